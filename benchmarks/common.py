@@ -0,0 +1,26 @@
+"""
+Helpers shared by the benchmark scripts.
+
+Run a benchmark from the project root, ex: python -m benchmarks.decode_function_input
+"""
+from collections.abc import Callable
+import timeit
+from typing import Any
+
+
+def best_time(fct: Callable[[], Any], number: int = 20, repeat: int = 5) -> float:
+    """
+    :return: the best time in seconds of one call to fct
+    """
+    return min(timeit.repeat(fct, number=number, repeat=repeat)) / number
+
+
+def print_header(title: str) -> None:
+    print("-" * 60)
+    print(f"| {title:<56} |")
+    print("-" * 60)
+
+
+def print_result(label: str, seconds: float, reference: float = 0.0) -> None:
+    speedup = f"  x{reference / seconds:.2f}" if reference else ""
+    print(f"{label:<40} {seconds * 1e6:>10.1f} µs{speedup}")
@@ -0,0 +1,52 @@
+"""
+Cost of decoding a batch of transactions into per command columns with decode.columns(),
+compared to decoding them with the RAW engine and then splitting the decoded dicts into columns.
+"""
+from collections import defaultdict
+from typing import Any
+
+from web3.types import HexStr
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder import (
+    DecodingEngine,
+    RouterCodec,
+)
+
+
+codec = RouterCodec()
+batch = [HexStr(trx["input"]) for trx in transactions] * 100
+
+
+def columns_from_dicts() -> dict[str, dict[str, list[Any]]]:
+    tables: dict[str, dict[str, list[Any]]] = defaultdict(lambda: defaultdict(list))
+    for i, input_data in enumerate(batch):
+        _, decoded_input = codec.decode.function_input(input_data, DecodingEngine.RAW)
+        for j, command_input in enumerate(decoded_input["inputs"]):
+            if isinstance(command_input, (str, bytes)):
+                continue
+            fct_name, params, revert_on_fail = command_input
+            table = tables[fct_name]
+            table["transaction"].append(i)
+            table["command"].append(j)
+            table["revert_on_fail"].append(revert_on_fail["revert_on_fail"])
+            for name, value in params.items():
+                table[name].append(value)
+    return tables
+
+
+def main() -> None:
+    print_header(f"decode.columns() - {len(batch)} inputs")
+    reference = best_time(columns_from_dicts, 1, 3) / len(batch)
+    print_result("RAW engine + dicts to columns (per trx)", reference)
+    columns = best_time(lambda: codec.decode.columns(batch), 1, 3) / len(batch)
+    print_result("columns (per trx)", columns, reference)
+
+
+if __name__ == "__main__":
+    main()
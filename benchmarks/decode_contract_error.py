@@ -0,0 +1,60 @@
+"""
+Per-error cost of decode.contract_error(), with the error selector index built once per decoder,
+compared to parsing the ABIs and building a contract per ABI for each error (the former implementation).
+"""
+import json
+from typing import Any
+
+from web3 import Web3
+from web3.exceptions import Web3Exception
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from uniswap_universal_router_decoder import RouterCodec
+from uniswap_universal_router_decoder._abi_builder import build_abi_type_list
+from uniswap_universal_router_decoder._constants import (
+    permit2_abi,
+    ur_abi,
+    v4_pool_manager_abi,
+    v4_position_manager_abi,
+)
+
+
+codec = RouterCodec()
+w3 = Web3()
+abis = (permit2_abi, v4_pool_manager_abi, v4_position_manager_abi, ur_abi)
+contract_errors = [
+    "0x2c4029e9000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000400000000000000000000000000000000000000000000000000000000000000000",  # noqa
+    "0x5d1d0f9f",
+    "0xf801e5250000000000000000000000000000000000000000000000000000000000000000",
+    "0x00000000",
+]
+
+
+def contract_per_abi(contract_error: str) -> tuple[str, dict[str, Any]]:
+    for abi in abis:
+        try:
+            error_abi = [{**item, "type": "function"} for item in json.loads(abi) if item["type"].lower() == "error"]
+            contract = w3.eth.contract(abi=error_abi)
+            error, params = contract.decode_function_input(contract_error)
+            return f"{error.fn_name}({','.join(build_abi_type_list(error.abi))})", params
+        except (ValueError, Web3Exception):
+            pass
+    return "Unknown error", {}
+
+
+def main() -> None:
+    print_header(f"decode.contract_error() - {len(contract_errors)} errors")
+    reference = best_time(lambda: [contract_per_abi(error) for error in contract_errors]) / len(contract_errors)
+    print_result("json.loads + contract per abi (per error)", reference)
+    indexed = best_time(
+        lambda: [codec.decode.contract_error(error) for error in contract_errors], number=1000
+    ) / len(contract_errors)
+    print_result("selector index (per error)", indexed, reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Per-input cost of reading a batch of transaction inputs from a JSONL file of hex strings, compared to a memory-mapped
+calldata corpus, alone, followed by the copy of the execute() arguments which the decoding engines make (eth_abi only
+decodes bytes), and followed by the command summary (read in place) or the RAW decoding of each input.
+"""
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+import json
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from hexbytes import HexBytes
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder import (
+    CalldataCorpus,
+    DecodingEngine,
+    RouterCodec,
+    write_calldata_corpus,
+)
+
+
+codec = RouterCodec()
+batch = [trx["input"] for trx in transactions] * 1000
+
+
+def jsonl_inputs(path: Path) -> Iterator[HexBytes]:
+    with open(path) as f:
+        for line in f:
+            yield HexBytes(json.loads(line))
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jsonl_path = Path(tmp_dir) / "calldata.jsonl"
+        jsonl_path.write_text("".join(f"{json.dumps(input_data)}\n" for input_data in batch))
+        corpus_path = Path(tmp_dir) / "calldata.urc"
+        write_calldata_corpus(corpus_path, batch)
+        print(f"JSONL: {jsonl_path.stat().st_size:,} bytes - corpus: {corpus_path.stat().st_size:,} bytes")
+
+        with CalldataCorpus(corpus_path) as corpus:
+            cases: list[tuple[str, Callable[[Any], Any]]] = [
+                ("read", lambda input_data: input_data),
+                ("read and copy the execute() arguments", lambda input_data: bytes(memoryview(input_data)[4:])),
+                ("command summary", codec.decode.command_summary),
+                ("RAW decoding", lambda input_data: codec.decode.function_input(input_data, DecodingEngine.RAW)),
+            ]
+            for label, process in cases:
+                print_header(f"{label} - {len(batch)} inputs")
+                reference = best_time(lambda: [process(data) for data in jsonl_inputs(jsonl_path)], 1, 3)
+                print_result("JSONL hex strings (per input)", reference / len(batch))
+                mapped = best_time(lambda: [process(data) for data in corpus], 1, 3)
+                print_result("calldata corpus (per input)", mapped / len(batch), reference / len(batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Per-transaction cost of decode.function_input() on the transactions used in the tests, with the decoding engines,
+compared to building a contract and matching the selector for each command (the former implementation).
+The lazy decoding and command summary costs are measured when only the commands are read,
+and the projected decoding when only amountIn and path of V3_SWAP_EXACT_IN are decoded.
+The cached decoding is measured when all the inputs are already in the cache.
+The raw addresses are measured with a codec built with raw_addresses=True.
+"""
+from typing import Any
+
+from web3 import Web3
+from web3.types import HexStr
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder import (
+    DecodeCache,
+    DecodingEngine,
+    RouterCodec,
+)
+from uniswap_universal_router_decoder._constants import ur_abi
+from uniswap_universal_router_decoder._enums import (
+    RouterConstant,
+    RouterFunction,
+)
+
+
+codec = RouterCodec()
+w3 = Web3()
+router_contract = w3.eth.contract(abi=ur_abi)
+inputs = [HexStr(trx["input"]) for trx in transactions]
+
+
+def per_command_contract_function_input(input_data: str) -> Any:
+    fct_name, decoded_input = router_contract.decode_function_input(input_data)
+    decoded_command_input: list[Any] = []
+    for i, b in enumerate(decoded_input["commands"]):
+        try:
+            abi_mapping = codec._abi_map[RouterFunction(b & RouterConstant.COMMAND_TYPE_MASK.value)]
+            sub_contract = w3.eth.contract(abi=abi_mapping.full_abi)
+            decoded_command_input.append(
+                sub_contract.decode_function_input(abi_mapping.selector + decoded_input["inputs"][i])
+            )
+        except ValueError:
+            decoded_command_input.append(decoded_input["inputs"][i].hex())
+    return fct_name, decoded_command_input
+
+
+def main() -> None:
+    print_header(f"decode.function_input() - {len(inputs)} transactions")
+    reference = best_time(lambda: [per_command_contract_function_input(data) for data in inputs]) / len(inputs)
+    print_result("contract per command (per trx)", reference)
+    compiled = best_time(lambda: [codec.decode.function_input(data) for data in inputs]) / len(inputs)
+    print_result("function_input (per trx)", compiled, reference)
+    raw = best_time(lambda: [codec.decode.function_input(data, DecodingEngine.RAW) for data in inputs]) / len(inputs)
+    print_result("function_input RAW engine (per trx)", raw, reference)
+    compact = best_time(
+        lambda: [codec.decode.function_input(data, DecodingEngine.COMPACT) for data in inputs]
+    ) / len(inputs)
+    print_result("function_input COMPACT engine (per trx)", compact, reference)
+    raw_addresses_codec = RouterCodec(raw_addresses=True)
+    raw_addresses = best_time(
+        lambda: [raw_addresses_codec.decode.function_input(data, DecodingEngine.RAW) for data in inputs]
+    ) / len(inputs)
+    print_result("RAW engine, raw addresses (per trx)", raw_addresses, reference)
+    lazy = best_time(lambda: [codec.decode.lazy_function_input(data)[1]["commands"] for data in inputs]) / len(inputs)
+    print_result("lazy_function_input, commands (per trx)", lazy, reference)
+    lazy_raw = best_time(
+        lambda: [codec.decode.lazy_function_input(data, DecodingEngine.RAW)[1]["commands"] for data in inputs]
+    ) / len(inputs)
+    print_result("lazy RAW engine, commands (per trx)", lazy_raw, reference)
+    projected = best_time(
+        lambda: [
+            codec.decode.function_input(
+                data,
+                DecodingEngine.RAW,
+                functions=[RouterFunction.V3_SWAP_EXACT_IN],
+                fields={RouterFunction.V3_SWAP_EXACT_IN: ["amountIn", "path"]},
+            )
+            for data in inputs
+        ]
+    ) / len(inputs)
+    print_result("RAW engine, projected (per trx)", projected, reference)
+    cached_codec = RouterCodec(decode_cache=DecodeCache(maxsize=len(inputs)))
+    cached = best_time(lambda: [cached_codec.decode.function_input(data) for data in inputs]) / len(inputs)
+    print_result("function_input, cache hits (per trx)", cached, reference)
+    summary = best_time(lambda: [codec.decode.command_summary(data) for data in inputs]) / len(inputs)
+    print_result("command_summary (per trx)", summary, reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Throughput of decode.function_inputs() on a large batch of the transactions used in the tests,
+in the current process and with several worker processes.
+"""
+import os
+from typing import Any
+
+from web3.types import HexStr
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder import (
+    DecodingEngine,
+    RouterCodec,
+)
+
+
+codec = RouterCodec()
+batch = [HexStr(trx["input"]) for trx in transactions] * 1000
+
+
+def decode_batch(workers: int, chunksize: int, engine: DecodingEngine) -> Any:
+    return codec.decode.function_inputs(batch, workers=workers, chunksize=chunksize, engine=engine)
+
+
+def main() -> None:
+    cpu_count = os.cpu_count() or 1
+    for engine in DecodingEngine:
+        print_header(f"decode.function_inputs() - {len(batch)} inputs - {engine.name} engine - {cpu_count} CPUs")
+        reference = best_time(lambda: decode_batch(0, 64, engine), 1, 3) / len(batch)
+        print_result("in process (per trx)", reference)
+        for workers in sorted({2, cpu_count}):
+            pooled = best_time(lambda: decode_batch(workers, 256, engine), 1, 3) / len(batch)
+            print_result(f"{workers} workers (per trx)", pooled, reference)
+
+
+if __name__ == "__main__":
+    main()
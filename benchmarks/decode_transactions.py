@@ -0,0 +1,64 @@
+"""
+Throughput of AsyncDecoder.transactions() against a local stand-in JSON-RPC server with a simulated latency,
+compared to awaiting AsyncDecoder.transaction() for one hash after the other.
+AsyncDecoder.block() and AsyncDecoder.scan() are measured by decoding the same number of UR transactions from blocks.
+"""
+import asyncio
+import time
+
+from benchmarks.common import (
+    print_header,
+    print_result,
+)
+from tests.resources.rpc_server import StandInRPCServer
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder import AsyncRouterCodec
+
+
+latency = 0.02
+trx_hashes = [trx["trx_hash"] for trx in transactions] * 50
+
+
+async def run() -> None:
+    server = StandInRPCServer(latency=latency)
+    codec = AsyncRouterCodec(rpc_endpoint=await server.start())
+    print_header(f"decode.transactions() - {len(trx_hashes)} trx - {latency * 1000:.0f} ms latency")
+
+    start = time.perf_counter()
+    for trx_hash in trx_hashes:
+        await codec.decode.transaction(trx_hash)
+    reference = (time.perf_counter() - start) / len(trx_hashes)
+    print_result("one await per trx (per trx)", reference)
+
+    for concurrency, batch_size in ((16, None), (64, None), (4, 50)):
+        start = time.perf_counter()
+        await codec.decode.transactions(trx_hashes, concurrency=concurrency, batch_size=batch_size)
+        elapsed = (time.perf_counter() - start) / len(trx_hashes)
+        label = f"concurrency={concurrency}" + (f", batch_size={batch_size}" if batch_size else "")
+        print_result(f"{label} (per trx)", elapsed, reference)
+
+    block_trx_count = len(await codec.decode.block("latest"))
+    start = time.perf_counter()
+    for _ in range(len(trx_hashes) // block_trx_count):
+        await codec.decode.block("latest")
+    elapsed = (time.perf_counter() - start) / len(trx_hashes)
+    print_result("block() - full transactions (per trx)", elapsed, reference)
+
+    block_count = len(trx_hashes) // block_trx_count
+    for concurrency in (1, 8):
+        start = time.perf_counter()
+        async for _ in codec.decode.scan(1, block_count, concurrency=concurrency):
+            pass
+        elapsed = (time.perf_counter() - start) / len(trx_hashes)
+        print_result(f"scan() - concurrency={concurrency} (per trx)", elapsed, reference)
+
+    await codec.decode._w3.provider.disconnect()
+    await server.stop()
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
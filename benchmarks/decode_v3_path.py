@@ -0,0 +1,62 @@
+"""
+Per-path cost of decode.v3_path() and decode.v3_paths() on a batch of V3 paths sharing a few tokens,
+compared to slicing the hex string of the path (the former implementation).
+"""
+from itertools import chain
+import random
+from typing import Any
+
+from web3 import Web3
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from uniswap_universal_router_decoder import RouterCodec
+
+
+codec = RouterCodec()
+random.seed(0)
+tokens = [random.randbytes(20) for _ in range(50)]
+fees = [100, 500, 3000, 10000]
+paths = [
+    b"".join(
+        chain(
+            [random.choice(tokens)],
+            chain.from_iterable(
+                (random.choice(fees).to_bytes(3, "big"), random.choice(tokens)) for _ in range(random.randint(1, 3))
+            ),
+        )
+    )
+    for _ in range(1000)
+]
+
+
+def hex_string_path(path: bytes) -> tuple[Any, ...]:
+    path_str = path.hex()
+    path_list: list[Any] = [Web3.to_checksum_address(path_str[0:40]), ]
+    parsed_remaining_path = [
+        [int(path_str[40:][i:i + 6], 16), Web3.to_checksum_address(path_str[40:][i + 6:i + 46])]
+        for i in range(0, len(path_str[40:]), 46)
+    ]
+    path_list.extend(list(chain.from_iterable(parsed_remaining_path)))
+    return tuple(path_list)
+
+
+def main() -> None:
+    print_header(f"decode.v3_path() - {len(paths)} paths")
+    reference = best_time(lambda: [hex_string_path(path) for path in paths], number=5) / len(paths)
+    print_result("hex string slicing (per path)", reference)
+    v3_path = best_time(lambda: [codec.decode.v3_path("V3_SWAP_EXACT_IN", path) for path in paths], number=5)
+    print_result("v3_path (per path)", v3_path / len(paths), reference)
+    raw = best_time(lambda: [codec.decode.v3_path("V3_SWAP_EXACT_IN", path, checksum=False) for path in paths])
+    print_result("v3_path, raw addresses (per path)", raw / len(paths), reference)
+    batch = best_time(lambda: codec.decode.v3_paths("V3_SWAP_EXACT_IN", paths))
+    print_result("v3_paths (per path)", batch / len(paths), reference)
+    raw_batch = best_time(lambda: codec.decode.v3_paths("V3_SWAP_EXACT_IN", paths, checksum=False))
+    print_result("v3_paths, raw addresses (per path)", raw_batch / len(paths), reference)
+
+
+if __name__ == "__main__":
+    main()
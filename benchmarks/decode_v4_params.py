@@ -0,0 +1,63 @@
+"""
+Per-call cost of the ExactInputParams and ExactOutputParams registry decoders on multi-hop V4 swaps of 1 to 4 hops,
+compared to reading the rest of the stream and building a contract on every call (the former implementation).
+"""
+from functools import partial
+from io import BytesIO
+from typing import Any
+
+from eth_abi.codec import ABICodec
+from web3 import Web3
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from uniswap_universal_router_decoder import RouterCodec
+from uniswap_universal_router_decoder._abi_builder import ABIMapWrapper
+from uniswap_universal_router_decoder._enums import MiscFunctions
+
+
+codec = RouterCodec()
+w3 = Web3()
+abi_map_wrapper = ABIMapWrapper(w3)
+currencies = [Web3.to_checksum_address(f"0x{i:040x}") for i in range(1, 6)]
+
+
+def contract_per_call(fct_name: MiscFunctions, stream: BytesIO) -> dict[str, Any]:
+    fct_abi = abi_map_wrapper.abi_map[fct_name]
+    raw_data = stream.read()
+    sub_contract = w3.eth.contract(abi=fct_abi.full_abi)
+    _, decoded_params = sub_contract.decode_function_input(fct_abi.selector + raw_data[32:])
+    return decoded_params
+
+
+former_registry = abi_map_wrapper.abi_registry.copy()
+for former_type_str, former_fct_name in (
+        ("ExactInputParams", MiscFunctions.STRICT_V4_SWAP_EXACT_IN),
+        ("ExactOutputParams", MiscFunctions.STRICT_V4_SWAP_EXACT_OUT)):
+    former_registry.unregister(former_type_str)
+    former_registry.register(former_type_str, lambda args: b"", partial(contract_per_call, former_fct_name))
+former_codec = ABICodec(former_registry)
+
+
+def main() -> None:
+    for hops in range(1, 5):
+        path_keys = [codec.encode.v4_path_key(currency, 3000, 60) for currency in currencies[1:hops + 1]]
+        args = (currencies[0], [tuple(path_key.values()) for path_key in path_keys], [], 10**18, 10**6)
+        cases = (
+            ("ExactInputParams", abi_map_wrapper.encode_v4_exact_input_params),
+            ("ExactOutputParams", abi_map_wrapper.encode_v4_exact_output_params),
+        )
+        print_header(f"V4 multi-hop params - {hops} hop(s)")
+        for type_str, encode in cases:
+            data = encode(args)
+            reference = best_time(lambda: former_codec.decode([type_str], data), number=200)
+            print_result(f"{type_str}, contract per call", reference)
+            in_place = best_time(lambda: abi_map_wrapper.abi_codec.decode([type_str], data), number=200)
+            print_result(f"{type_str}, in place", in_place, reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Memory used to keep a large batch of decoded transaction inputs, for each decoding engine,
+and for the RAW and COMPACT engines with the addresses decoded as 20-byte bytes.
+"""
+import gc
+import tracemalloc
+
+from web3.types import HexStr
+
+from benchmarks.common import print_header
+from tests.resources.transactions import transactions
+from tests.test_v4_codec import (
+    input_01,
+    input_02,
+)
+from uniswap_universal_router_decoder import (
+    DecodingEngine,
+    RouterCodec,
+)
+
+
+codec = RouterCodec()
+raw_addresses_codec = RouterCodec(raw_addresses=True)
+batch = [HexStr(trx["input"]) for trx in transactions] * 500 + [input_01, input_02] * 500
+
+
+def main() -> None:
+    print_header(f"Memory of {len(batch)} decoded inputs")
+    reference = 0
+    runs = [(engine.name, codec, engine) for engine in DecodingEngine]
+    runs += [
+        (f"{engine.name} raw addresses", raw_addresses_codec, engine)
+        for engine in (DecodingEngine.RAW, DecodingEngine.COMPACT)
+    ]
+    for label, run_codec, engine in runs:
+        run_codec.decode.function_input(batch[0], engine)  # the decoders and classes are built before measuring
+        gc.collect()
+        tracemalloc.start()
+        decoded_inputs = [run_codec.decode.function_input(input_data, engine) for input_data in batch]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        reference = reference or size
+        print(f"{label + ' (per trx)':<40} {size / len(decoded_inputs):>10.0f} B  x{reference / size:.2f}")
+        del decoded_inputs
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Import time of the codec, measured in fresh interpreters: per public entry point, and per module with
+'python -X importtime'. Also in-process cost of loading the ABI map from the precomputed table compared to running all
+the ABI builders.
+"""
+from collections import defaultdict
+import subprocess
+import sys
+
+from benchmarks.common import (
+    best_time,
+    print_header,
+    print_result,
+)
+from uniswap_universal_router_decoder._abi_builder import (
+    build_abi_map,
+    load_abi_map,
+)
+
+
+package = "uniswap_universal_router_decoder"
+reported_modules = (package, f"{package}._abi_builder", f"{package}._abi_table", "web3", "eth_abi")
+entry_points = (
+    f"import {package}",
+    f"from {package} import V4Constants",
+    f"from {package} import DecodeCache",
+    f"from {package}.utils import tick_to_prices",
+    f"from {package} import RouterCodec",
+    f"from {package} import AsyncRouterCodec",
+)
+
+
+def entry_point_time(statement: str, repeat: int) -> float:
+    """
+    :return: the best time in seconds to run the import statement over 'repeat' interpreters
+    """
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeat)
+    )
+
+
+def import_times(statement: str, repeat: int) -> dict[str, tuple[int, int]]:
+    """
+    :return: the best self and cumulative import times in microseconds of each module imported by the statement over
+    'repeat' interpreters
+    """
+    best: dict[str, tuple[int, int]] = defaultdict(lambda: (sys.maxsize, sys.maxsize))
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+                continue
+            self_time, cumulative_time, module = line[len("import time:"):].split("|")
+            module = module.strip()
+            best[module] = (min(best[module][0], int(self_time)), min(best[module][1], int(cumulative_time)))
+    return best
+
+
+def main() -> None:
+    print_header("entry points (best of 7 interpreters)")
+    for statement in entry_points:
+        print_result(statement.replace(package, "ur"), entry_point_time(statement, 7))
+
+    print_header("RouterCodec import (self / cumulative, best of 7)")
+    times = import_times(f"from {package} import RouterCodec", 7)
+    for module in reported_modules:
+        self_time, cumulative_time = times[module]
+        print(f"{module:<50}{self_time / 1000:>10.2f} ms{cumulative_time / 1000:>10.2f} ms")
+
+    print_header("ABI map")
+    reference = best_time(build_abi_map, 10, 5)
+    print_result("run the ABI builders", reference)
+    print_result("load the precomputed table", best_time(load_abi_map, 10, 5), reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Local stand-in JSON-RPC server, answering eth_getTransactionByHash and eth_getBlockByNumber (single and batch requests)
+with the test transactions after a simulated network latency.
+On its /ws websocket, eth_subscribe('newPendingTransactions') sends the block transactions as pending transactions.
+Other subscriptions get a notification looking like a UR transaction, which their subscribers must not decode.
+"""
+import asyncio
+from collections.abc import (
+    Generator,
+    Iterable,
+)
+from contextlib import contextmanager
+import json
+from threading import Thread
+from typing import (
+    Any,
+    Optional,
+)
+
+from aiohttp import web
+
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder._constants import ur_address
+
+
+def build_transaction(trx_hash: str, input_data: str, index: int = 0) -> dict[str, Any]:
+    return {
+        "blockHash": "0x" + "11" * 32,
+        "blockNumber": hex(20_000_000 + index),
+        "from": "0x1ab4973a48dc892cd9971ece8e01dcc7688f8f23",
+        "gas": "0x30d40",
+        "gasPrice": "0x3b9aca00",
+        "hash": trx_hash,
+        "input": input_data,
+        "nonce": hex(index),
+        "to": ur_address.lower(),
+        "transactionIndex": hex(index),
+        "type": "0x2",
+        "value": "0x0",
+    }
+
+
+test_transactions = {
+    trx["trx_hash"]: build_transaction(trx["trx_hash"], trx["input"], i) for i, trx in enumerate(transactions)
+}
+
+
+def build_block(number: int, trxs: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """
+    :return: a block with the given transactions, plus a transaction to another contract and a plain ETH transfer
+        to the UR, which cannot be decoded
+    """
+    block_trxs = [dict(trx) for trx in trxs]
+    other_trx = build_transaction("0x" + "22" * 32, block_trxs[0]["input"], len(block_trxs))
+    other_trx["to"] = "0x" + "33" * 20
+    eth_transfer = build_transaction("0x" + "44" * 32, "0x", len(block_trxs) + 1)
+    block_trxs = [other_trx] + block_trxs + [eth_transfer]
+    for i, trx in enumerate(block_trxs):
+        trx.update({"blockNumber": hex(number), "transactionIndex": hex(i)})
+    return {
+        "hash": "0x" + "11" * 32,
+        "number": hex(number),
+        "parentHash": "0x" + "00" * 32,
+        "timestamp": "0x6a00722a",
+        "transactions": block_trxs,
+    }
+
+
+class StandInRPCServer:
+    """
+    Serve the given transactions by hash, and a block containing them, on http://127.0.0.1:{port}
+    The 'finalized' block number defaults to the number of this block, None for a node without the 'finalized' tag.
+    """
+    def __init__(
+            self,
+            trxs: Iterable[dict[str, Any]] = test_transactions.values(),
+            latency: float = 0.0,
+            finalized_block_number: Optional[int] = 20_000_000) -> None:
+        self.trxs = {trx["hash"]: trx for trx in trxs}
+        self.block = build_block(20_000_000, self.trxs.values())
+        self.finalized_block_number = finalized_block_number
+        self.trxs.update((trx["hash"], trx) for trx in self.block["transactions"])
+        self.latency = latency
+        self.requests = 0
+        self._runner: Any = None
+        self.url = ""
+        self.ws_url = ""
+
+    def _respond(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if payload["method"] == "eth_chainId":
+            result: Any = "0x1"
+        elif payload["method"] == "eth_getTransactionByHash":
+            result = self.trxs.get(payload["params"][0])
+        elif payload["method"] == "eth_unsubscribe":
+            result = True
+        elif payload["method"] == "eth_getBlockByNumber":
+            # every block contains the same transactions
+            number, full_transactions = payload["params"]
+            if number == "finalized" and self.finalized_block_number is None:
+                error = {"code": -32602, "message": "invalid block tag"}
+                return {"jsonrpc": "2.0", "id": payload["id"], "error": error}
+            number = {"latest": self.block["number"], "finalized": hex(self.finalized_block_number)}.get(number, number)
+            block_trxs = [{**trx, "blockNumber": number} for trx in self.block["transactions"]]
+            result = {
+                **self.block,
+                "number": number,
+                "transactions": block_trxs if full_transactions else [trx["hash"] for trx in block_trxs],
+            }
+        else:
+            return {"jsonrpc": "2.0", "id": payload["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": result}
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        payload = await request.json()
+        await asyncio.sleep(self.latency)
+        if isinstance(payload, list):
+            return web.json_response([self._respond(item) for item in payload])
+        return web.json_response(self._respond(payload))
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        subscription_count = 0
+        async for message in ws:
+            payload = json.loads(message.data)
+            if payload["method"] != "eth_subscribe":
+                await ws.send_json(self._respond(payload))
+                continue
+            subscription_count += 1
+            subscription_id = f"0x{subscription_count:032x}"
+            await ws.send_json({"jsonrpc": "2.0", "id": payload["id"], "result": subscription_id})
+            if payload["params"][0] != "newPendingTransactions":
+                other_trx = build_transaction("0x" + "88" * 32, self.block["transactions"][1]["input"])
+                params = {"subscription": subscription_id, "result": other_trx}
+                await ws.send_json({"jsonrpc": "2.0", "method": "eth_subscription", "params": params})
+                continue
+            full_transactions = len(payload["params"]) > 1 and payload["params"][1]
+            for trx in self.block["transactions"]:
+                await asyncio.sleep(self.latency)
+                params = {"subscription": subscription_id, "result": trx if full_transactions else trx["hash"]}
+                await ws.send_json({"jsonrpc": "2.0", "method": "eth_subscription", "params": params})
+        return ws
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        app.router.add_get("/ws", self._handle_websocket)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        self.ws_url = f"ws://127.0.0.1:{port}/ws"
+        return self.url
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+
+@contextmanager
+def serve_in_thread(server: StandInRPCServer) -> Generator[str]:
+    """
+    Run the server in a thread with its own event loop, for the sync tests
+
+    :return: the server url
+    """
+    loop = asyncio.new_event_loop()
+    thread = Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    url = asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    try:
+        yield url
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
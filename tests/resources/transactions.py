@@ -1,39 +1,63 @@
+from eth_abi import (
+    decode,
+    encode,
+)
 from web3.types import HexStr
 
 
 transactions = (
     {  # 0 - "V2_SWAP_EXACT_IN", "UNWRAP_WETH"
         "trx_hash": HexStr("0xd2c87626ff2ed52e922c3d0c49ca36bd6c48e31ac21d5aee2505e503ddd1e29c"),
+        "input": HexStr("0x3593564c000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000a0000000000000000000000000000000000000000000000000000000006a00722a0000000000000000000000000000000000000000000000000000000000000002080c0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000001a000000000000000000000000000000000000000000000000000000000000001400000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000005329f26dd033fb000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000001200000000000000000000000000000000000000000000000000000000000000002000000000000000000000000e194cff868c88743428c165869caab56f9fb459a000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc200000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000040000000000000000000000000247b1d8efc8b39d4b6c6179cbfbfa420c31217a80000000000000000000000000000000000000000000000000149701bebb5f459"),  # noqa: E501
         "decoded_input": """(<Function execute(bytes,bytes[],uint256)>, {'commands': b'\\x08\\x0c', 'inputs': [(<Function V2_SWAP_EXACT_IN(address,uint256,uint256,address[],bool,uint256[])>, {'recipient': '0x0000000000000000000000000000000000000002', 'amountIn': 23408544268170235, 'amountOutMin': 0, 'path': ['0xE194CfF868C88743428c165869caab56F9fb459A', '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2'], 'payerIsSender': True, 'minHopPriceX36': []}, {'revert_on_fail': True}), (<Function UNWRAP_WETH(address,uint256)>, {'recipient': '0x247B1d8Efc8b39D4b6c6179CbfBfA420c31217a8', 'amountMin': 92728532558804057}, {'revert_on_fail': True})], 'deadline': 1778414122})"""  # noqa: E501
     },
 
     {  # 1 - "PERMIT2_PERMIT", "V3_SWAP_EXACT_OUT"
         "trx_hash": HexStr("0x16f416f6e808c457f88a7e0ce89892e5741c5ea7587d89eca073b5095e33c890"),
+        "input": HexStr("0x3593564c000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000a00000000000000000000000000000000000000000000000000000000069f8634900000000000000000000000000000000000000000000000000000000000000020a010000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000001c000000000000000000000000000000000000000000000000000000000000001600000000000000000000000009e32b13ce7f2e80a01932b42553652e053d6ed8e000000000000000000000000ffffffffffffffffffffffffffffffffffffffff000000000000000000000000000000000000000000000000000000006a1fe93a00000000000000000000000000000000000000000000000000000000000000000000000000000000000000004c82d1fbfe28c977cbb58d8c7ff8fcf9f70a2cca0000000000000000000000000000000000000000000000000000000069f8634200000000000000000000000000000000000000000000000000000000000000e000000000000000000000000000000000000000000000000000000000000000413832a7c974d578efdf7147a42d13c05ccfb5d01c6a1529fdf20e2d9be90130ab0f16cc4c0253f8dfc5fe68bb431810d7d2e6276bec4508b55762335c517d68441b0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001600000000000000000000000002b13ed7ec0af86cda542d9cdb91ad2b3e1959734000000000000000000000000000000000000000000000000000000000ee6b280000000000000000000000000000000000000000000000003dce2caa9fd30d95500000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000001400000000000000000000000000000000000000000000000000000000000000042dac17f958d2ee523a2206206994597c13d831ec7000064c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2000bb89e32b13ce7f2e80a01932b42553652e053d6ed8e0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"),  # noqa: E501
         "decoded_input": """(<Function execute(bytes,bytes[],uint256)>, {'commands': b'\\n\\x01', 'inputs': [(<Function PERMIT2_PERMIT(((address,uint160,uint48,uint48),address,uint256),bytes)>, {'struct': {'details': {'token': '0x9E32b13ce7f2E80A01932B42553652E053D6ed8e', 'amount': 1461501637330902918203684832716283019655932542975, 'expiration': 1780476218, 'nonce': 0}, 'spender': '0x4C82D1fBFe28C977cBB58D8C7FF8FCF9F70a2cCA', 'sigDeadline': 1777886018}, 'data': b"82\\xa7\\xc9t\\xd5x\\xef\\xdfqG\\xa4-\\x13\\xc0\\\\\\xcf\\xb5\\xd0\\x1cj\\x15)\\xfd\\xf2\\x0e-\\x9b\\xe9\\x010\\xab\\x0f\\x16\\xccL\\x02S\\xf8\\xdf\\xc5\\xfeh\\xbbC\\x18\\x10\\xd7\\xd2\\xe6\'k\\xecE\\x08\\xb5Wb3\\\\Q}hD\\x1b"}, {'revert_on_fail': True}), (<Function V3_SWAP_EXACT_OUT(address,uint256,uint256,bytes,bool,uint256[])>, {'recipient': '0x2b13ED7ec0Af86cDA542d9Cdb91ad2b3e1959734', 'amountOut': 250000000, 'amountInMax': 71256739085655529813, 'path': b"\\xda\\xc1\\x7f\\x95\\x8d.\\xe5#\\xa2 b\\x06\\x99E\\x97\\xc1=\\x83\\x1e\\xc7\\x00\\x00d\\xc0*\\xaa9\\xb2#\\xfe\\x8d\\n\\x0e\\\\O\'\\xea\\xd9\\x08<ul\\xc2\\x00\\x0b\\xb8\\x9e2\\xb1<\\xe7\\xf2\\xe8\\n\\x01\\x93+BU6R\\xe0S\\xd6\\xed\\x8e", 'payerIsSender': True, 'minHopPriceX36': []}, {'revert_on_fail': True})], 'deadline': 1777886025})"""  # noqa: E501
     },
 
     {  # 2 - "WRAP_ETH", "V2_SWAP_EXACT_OUT", "UNWRAP_WETH"
         "trx_hash": HexStr("0x93371c34a911f9b7f1a01945b373548fc17f72c6628767669151a981a33fc156"),
+        "input": HexStr("0x3593564c000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000a00000000000000000000000000000000000000000000000000000000069f86ef200000000000000000000000000000000000000000000000000000000000000030b090c00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000003000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000c00000000000000000000000000000000000000000000000000000000000000240000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000000020000000000000000000000000000000000000000000000000029222043e64f9c00000000000000000000000000000000000000000000000000000000000001600000000000000000000000000207f19a9f33c41bd3078edb34e04f875b320cce00000000000000000000000000000000000000000000006d4566c06287c800000000000000000000000000000000000000000000000000000029222043e64f9c00000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001400000000000000000000000000000000000000000000000000000000000000003000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2000000000000000000000000dac17f958d2ee523a2206206994597c13d831ec7000000000000000000000000f944e35f95e819e752f3ccb5faf40957d311e8c5000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000400000000000000000000000000207f19a9f33c41bd3078edb34e04f875b320cce0000000000000000000000000000000000000000000000000000000000000000"),  # noqa: E501
         "decoded_input": """(<Function execute(bytes,bytes[],uint256)>, {'commands': b'\\x0b\\t\\x0c', 'inputs': [(<Function WRAP_ETH(address,uint256)>, {'recipient': '0x0000000000000000000000000000000000000002', 'amountMin': 11577996018601884}, {'revert_on_fail': True}), (<Function V2_SWAP_EXACT_OUT(address,uint256,uint256,address[],bool,uint256[])>, {'recipient': '0x0207F19A9f33c41Bd3078EDb34e04F875B320cce', 'amountOut': 2015696000000000000000, 'amountInMax': 11577996018601884, 'path': ['0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', '0xdAC17F958D2ee523a2206206994597C13D831ec7', '0xF944e35f95E819E752f3cCB5Faf40957d311e8c5'], 'payerIsSender': False, 'minHopPriceX36': []}, {'revert_on_fail': True}), (<Function UNWRAP_WETH(address,uint256)>, {'recipient': '0x0207F19A9f33c41Bd3078EDb34e04F875B320cce', 'amountMin': 0}, {'revert_on_fail': True})], 'deadline': 1777889010})"""  # noqa: E501
     },
 
     {  # 3 - None, "SWEEP"
         "trx_hash": HexStr("0x47c0f1dd13edf9f1608f9f34bdba9ad40cb95dd081033cad69f5b88e451b4b55"),
+        "input": HexStr("0x24856bc300000000000000000000000000000000000000000000000000000000000000400000000000000000000000000000000000000000000000000000000000000080000000000000000000000000000000000000000000000000000000000000000219040000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000002600000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000030e0fb6492a9683000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000001843efd9e710000000000000000000000000000000000000000000000000000000000000080000000000000000000000000411150bf77260f446e6ac5c182981b949ab9502e000000000000000000000000411150bf77260f446e6ac5c182981b949ab9502e0000000000000000000000000000000000000000000000000000000063d94985000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000040000000000000000000000000000000000000000000000000030e0fb6492a9683000000000000000000000000888a71271d307b14e19d1a84d9851df0bd484d87000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000002cdc0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000600000000000000000000000000000000000000000000000000000000000000000000000000000000000000000411150bf77260f446e6ac5c182981b949ab9502e0000000000000000000000000000000000000000000000000000000000000000"),  # noqa: E501
         "decoded_input": """(<Function execute(bytes,bytes[])>, {'commands': b'\\x19\\x04', 'inputs': ['000000000000000000000000000000000000000000000000030e0fb6492a9683000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000001843efd9e710000000000000000000000000000000000000000000000000000000000000080000000000000000000000000411150bf77260f446e6ac5c182981b949ab9502e000000000000000000000000411150bf77260f446e6ac5c182981b949ab9502e0000000000000000000000000000000000000000000000000000000063d94985000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000040000000000000000000000000000000000000000000000000030e0fb6492a9683000000000000000000000000888a71271d307b14e19d1a84d9851df0bd484d87000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000002cdc00000000000000000000000000000000000000000000000000000000', (<Function SWEEP(address,address,uint256)>, {'token': '0x0000000000000000000000000000000000000000', 'recipient': '0x411150BF77260F446e6aC5C182981B949Ab9502e', 'amountMin': 0}, {'revert_on_fail': True})]})"""  # noqa: E501
     },
 
     {  # 4 - "V3_SWAP_EXACT_IN", "V3_SWAP_EXACT_IN", "V2_SWAP_EXACT_IN"
         "trx_hash": HexStr("0xfd25bd671e4186f360e673bee850a7ba0677bd45f1498ad400c81ffb0cef7838"),
+        "input": HexStr("0x3593564c000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000a00000000000000000000000000000000000000000000000000000000069f863e90000000000000000000000000000000000000000000000000000000000000003000008000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000030000000000000000000000000000000000000000000000000000000000000060000000000000000000000000000000000000000000000000000000000000022000000000000000000000000000000000000000000000000000000000000003a000000000000000000000000000000000000000000000000000000000000001a00000000000000000000000009388819156c6a0e8af044dabe4fb1974fc3920630000000000000000000000000000000000000000000000000000000005f5e1000000000000000000000000000000000000000000000005045e51057f67b858f300000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000001400000000000000000000000000000000000000000000000000000000000000042a0b86991c6218b36c1d19d4a2e9eb0ce3606eb480001f4c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2002710aff2565091e7207191dbe340b8528d02fa78d04400000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000020000000000000000000000000000000000c01c8c0c1da525a5683b77000000000000000000000000000000000000000000bfa1499c7243359784d7de0000000000000000000000000000000000000000000000000000000000000000000001600000000000000000000000007dfc9dd51638573a812b39d33eded20df468e7bc0000000000000000000000000000000000000000000000000000000017d78400000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000c000000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000000120000000000000000000000000000000000000000000000000000000000000002ba0b86991c6218b36c1d19d4a2e9eb0ce3606eb48000064c02aaa39b223fe8d0a0e5c4f27ead9083c756cc200000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000c01c8c0c1da525a5683b770000000000000000000000000000000000000000000000000000000000000000000001600000000000000000000000009388819156c6a0e8af044dabe4fb1974fc392063800000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000140f9d11b727ab6d917900000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001200000000000000000000000000000000000000000000000000000000000000002000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2000000000000000000000000aff2565091e7207191dbe340b8528d02fa78d04400000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000bfa1499c7243359784d7de00000000"),  # noqa: E501
         "decoded_input": """(<Function execute(bytes,bytes[],uint256)>, {'commands': b'\\x00\\x00\\x08', 'inputs': [(<Function V3_SWAP_EXACT_IN(address,uint256,uint256,bytes,bool,uint256[])>, {'recipient': '0x9388819156C6A0e8Af044dAbE4fb1974fc392063', 'amountIn': 100000000, 'amountOutMin': 23692415610000502184179, 'path': b"\\xa0\\xb8i\\x91\\xc6!\\x8b6\\xc1\\xd1\\x9dJ.\\x9e\\xb0\\xce6\\x06\\xebH\\x00\\x01\\xf4\\xc0*\\xaa9\\xb2#\\xfe\\x8d\\n\\x0e\\\\O'\\xea\\xd9\\x08<ul\\xc2\\x00'\\x10\\xaf\\xf2VP\\x91\\xe7 q\\x91\\xdb\\xe3@\\xb8R\\x8d\\x02\\xfax\\xd0D", 'payerIsSender': True, 'minHopPriceX36': [997500000000000000000000000000000000, 995000000000000000000000000000000000]}, {'revert_on_fail': True}), (<Function V3_SWAP_EXACT_IN(address,uint256,uint256,bytes,bool,uint256[])>, {'recipient': '0x7Dfc9DD51638573a812b39d33EDed20Df468E7bC', 'amountIn': 400000000, 'amountOutMin': 0, 'path': b"\\xa0\\xb8i\\x91\\xc6!\\x8b6\\xc1\\xd1\\x9dJ.\\x9e\\xb0\\xce6\\x06\\xebH\\x00\\x00d\\xc0*\\xaa9\\xb2#\\xfe\\x8d\\n\\x0e\\\\O'\\xea\\xd9\\x08<ul\\xc2", 'payerIsSender': True, 'minHopPriceX36': [997500000000000000000000000000000000]}, {'revert_on_fail': True}), (<Function V2_SWAP_EXACT_IN(address,uint256,uint256,address[],bool,uint256[])>, {'recipient': '0x9388819156C6A0e8Af044dAbE4fb1974fc392063', 'amountIn': 57896044618658097711785492504343953926634992332820282019728792003956564819968, 'amountOutMin': 94735348847218114007417, 'path': ['0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', '0xAFF2565091E7207191dBe340B8528D02FA78d044'], 'payerIsSender': False, 'minHopPriceX36': [995000000000000000000000000000000000]}, {'revert_on_fail': True})], 'deadline': 1777886185})"""  # noqa: E501
     },
 
     {  # 5 - "PERMIT2_PERMIT", "V2_SWAP_EXACT_IN", "PAY_PORTION", "PAY_PORTION", "UNWRAP_WETH"
         "trx_hash": HexStr("0x1e869ba980b7131ca03f619cdf4a37af66eed4de2db97eed862c02c977ecce53"),
+        "input": HexStr("0x24856bc30000000000000000000000000000000000000000000000000000000000000040000000000000000000000000000000000000000000000000000000000000008000000000000000000000000000000000000000000000000000000000000000050a0806060c000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000500000000000000000000000000000000000000000000000000000000000000a00000000000000000000000000000000000000000000000000000000000000220000000000000000000000000000000000000000000000000000000000000038000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000000480000000000000000000000000000000000000000000000000000000000000016000000000000000000000000046f45870df9e52a5dbe66343a5ff8fa040c17b81000000000000000000000000ffffffffffffffffffffffffffffffffffffffff000000000000000000000000000000000000000000000000000000006a208a2600000000000000000000000000000000000000000000000000000000000000000000000000000000000000004c82d1fbfe28c977cbb58d8c7ff8fcf9f70a2cca0000000000000000000000000000000000000000000000000000000069f9042e00000000000000000000000000000000000000000000000000000000000000e00000000000000000000000000000000000000000000000000000000000000041bc5342888b294c77b6dfbaa5b26f3a853bd59f19e7b20bdb9145a2bfa20664fc35d5bc963f7bf31ce6f35bdbb4615c01ccb8d70de2823162f01968c82e65c3ec1c00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000014000000000000000000000000000000000000000000000000000000000000000020000000000000000000000000000000000000001690a6c96d9c11f10df8ceb2a000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000c000000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000000120000000000000000000000000000000000000000000000000000000000000000200000000000000000000000046f45870df9e52a5dbe66343a5ff8fa040c17b81000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc200000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000060000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2000000000000000000000000e401da8b1e9998cbd7d04bce1381c7c75de1870100000000000000000000000000000000000000000000000000000000000000180000000000000000000000000000000000000000000000000000000000000060000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc20000000000000000000000009fcf6053e7890246205dfdb7b9ec3346b752973a00000000000000000000000000000000000000000000000000000000000000380000000000000000000000000000000000000000000000000000000000000040000000000000000000000000e394490d4bb118e09dd4cdd220019ef7f6979d13000000000000000000000000000000000000000000000000005ed28cc29c8795"),  # noqa: E501
         "decoded_input": """(<Function execute(bytes,bytes[])>, {'commands': b'\\n\\x08\\x06\\x06\\x0c', 'inputs': [(<Function PERMIT2_PERMIT(((address,uint160,uint48,uint48),address,uint256),bytes)>, {'struct': {'details': {'token': '0x46f45870DF9E52a5DbE66343a5fF8Fa040C17b81', 'amount': 1461501637330902918203684832716283019655932542975, 'expiration': 1780517414, 'nonce': 0}, 'spender': '0x4C82D1fBFe28C977cBB58D8C7FF8FCF9F70a2cCA', 'sigDeadline': 1777927214}, 'data': b'\\xbcSB\\x88\\x8b)Lw\\xb6\\xdf\\xba\\xa5\\xb2o:\\x85;\\xd5\\x9f\\x19\\xe7\\xb2\\x0b\\xdb\\x91E\\xa2\\xbf\\xa2\\x06d\\xfc5\\xd5\\xbc\\x96?{\\xf3\\x1c\\xe6\\xf3[\\xdb\\xb4a\\\\\\x01\\xcc\\xb8\\xd7\\r\\xe2\\x821b\\xf0\\x19h\\xc8.e\\xc3\\xec\\x1c'}, {'revert_on_fail': True}), (<Function V2_SWAP_EXACT_IN(address,uint256,uint256,address[],bool,uint256[])>, {'recipient': '0x0000000000000000000000000000000000000002', 'amountIn': 111736690601984333813574855466, 'amountOutMin': 0, 'path': ['0x46f45870DF9E52a5DbE66343a5fF8Fa040C17b81', '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2'], 'payerIsSender': True, 'minHopPriceX36': []}, {'revert_on_fail': True}), (<Function PAY_PORTION(address,address,uint256)>, {'token': '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', 'recipient': '0xe401Da8b1E9998cbD7D04BCe1381c7c75dE18701', 'bips': 24}, {'revert_on_fail': True}), (<Function PAY_PORTION(address,address,uint256)>, {'token': '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', 'recipient': '0x9FCF6053E7890246205dFDB7B9EC3346b752973a', 'bips': 56}, {'revert_on_fail': True}), (<Function UNWRAP_WETH(address,uint256)>, {'recipient': '0xe394490D4bB118e09dD4CDD220019Ef7f6979d13', 'amountMin': 26690149813094293}, {'revert_on_fail': True})]})"""  # noqa: E501
     },
 
     {  # 6 - "WRAP_ETH", "TRANSFER", "V3_SWAP_EXACT_OUT", "UNWRAP_WETH"
         "trx_hash": HexStr("0x19d531aaab4b8abfa3723d4d6fa5e80d8ecddafe3100992230edb9a2b02c3a80"),
+        "input": HexStr("0x3593564c000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000a00000000000000000000000000000000000000000000000000000000069fd3e5300000000000000000000000000000000000000000000000000000000000000040b05010c000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000008000000000000000000000000000000000000000000000000000000000000000e0000000000000000000000000000000000000000000000000000000000000016000000000000000000000000000000000000000000000000000000000000002c00000000000000000000000000000000000000000000000000000000000000040000000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000001a449250ede8c770000000000000000000000000000000000000000000000000000000000000060000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2000000000000000000000000147cf09e7373b8fda6f12021f1b0f98d6da1a56600000000000000000000000000000000000000000000000000035cbec2adcff800000000000000000000000000000000000000000000000000000000000001400000000000000000000000009c5ab27ab9d8365819b47c504b549ec7664b4cca0000000000000000000000000000000000000000000000104eb7542ff502000000000000000000000000000000000000000000000000000001a449250ede8c7700000000000000000000000000000000000000000000000000000000000000c000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000120000000000000000000000000000000000000000000000000000000000000002b829f4b62eebe12af653b4dd4ffc480966f7d7f09002710c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000400000000000000000000000009c5ab27ab9d8365819b47c504b549ec7664b4cca0000000000000000000000000000000000000000000000000000000000000000"),  # noqa: E501
         "decoded_input": """(<Function execute(bytes,bytes[],uint256)>, {'commands': b'\\x0b\\x05\\x01\\x0c', 'inputs': [(<Function WRAP_ETH(address,uint256)>, {'recipient': '0x0000000000000000000000000000000000000002', 'amountMin': 118299913730559095}, {'revert_on_fail': True}), (<Function TRANSFER(address,address,uint256)>, {'token': '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', 'recipient': '0x147CF09E7373B8FDA6f12021F1b0f98D6da1A566', 'value': 946399309844472}, {'revert_on_fail': True}), (<Function V3_SWAP_EXACT_OUT(address,uint256,uint256,bytes,bool,uint256[])>, {'recipient': '0x9c5aB27aB9D8365819B47C504b549eC7664b4ccA', 'amountOut': 300820000000000000000, 'amountInMax': 118299913730559095, 'path': b"\\x82\\x9fKb\\xee\\xbe\\x12\\xafe;M\\xd4\\xff\\xc4\\x80\\x96o}\\x7f\\t\\x00'\\x10\\xc0*\\xaa9\\xb2#\\xfe\\x8d\\n\\x0e\\\\O'\\xea\\xd9\\x08<ul\\xc2", 'payerIsSender': False, 'minHopPriceX36': []}, {'revert_on_fail': True}), (<Function UNWRAP_WETH(address,uint256)>, {'recipient': '0x9c5aB27aB9D8365819B47C504b549eC7664b4ccA', 'amountMin': 0}, {'revert_on_fail': True})], 'deadline': 1778204243})"""  # noqa: E501
     },
 )
+
+
+def drop_last_command_input(input_data: str) -> HexStr:
+    """
+    :return: the execute(bytes,bytes[],uint256) input without the input of its last command: valid abi, but one command
+        more than inputs
+    """
+    types = ["bytes", "bytes[]", "uint256"]
+    commands, inputs, deadline = decode(types, bytes.fromhex(input_data[10:]))
+    return HexStr(input_data[:10] + encode(types, [commands, inputs[:-1], deadline]).hex())
+
+
+missing_command_input = drop_last_command_input(transactions[0]["input"])
@@ -1,13 +1,22 @@
 import json
+from pathlib import Path
 
+from eth_abi.exceptions import NoEntriesFound
+from eth_abi.registry import registry
 import pytest
+from web3 import Web3
 
+from uniswap_universal_router_decoder import _abi_builder
 from uniswap_universal_router_decoder._abi_builder import (
     ABIFunction,
     ABIFunctionBuilder,
+    ABIMapWrapper,
     ABIParam,
+    ABIRegister,
     ABIStruct,
+    build_abi_map,
     build_abi_type_list,
+    generate_abi_table,
 )
 from uniswap_universal_router_decoder._enums import (  # noqa
     MiscFunctions,
@@ -47,6 +56,21 @@ def test_build_abi_map(command_id, expected_fct_abi, expected_selector, expected
     assert codec._abi_map[command_id].signature == expected_signature
 
 
+def test_abi_table():
+    # the precomputed table is out of date: regenerate it with write_abi_table()
+    assert Path(_abi_builder.__file__).with_name("_abi_table.py").read_text() == generate_abi_table()
+
+    built_abi_map = build_abi_map()
+    assert list(ABIRegister.abi_map) == list(built_abi_map)
+    for key, abi in ABIRegister.abi_map.items():
+        built_abi = built_abi_map[key]
+        assert abi.full_abi == built_abi.full_abi
+        assert abi.signature == built_abi.signature
+        assert abi.selector == built_abi.selector
+        assert abi.type_list == built_abi.type_list
+        assert repr(abi) == repr(built_abi)
+
+
 abi_dict_1 = \
     {
         'inputs': [
@@ -146,3 +170,23 @@ def test_builder_repr():
         "ABIFunctionBuilder(abi=ABIFunction(name='function_name', params=[ABIStruct(name='struct_name', type='tuple',"
         " params=[ABIParam(name='param_name', type='param_type')])]))"
     )
+
+
+def test_abi_map_wrapper_registry():
+    wrapper_1 = ABIMapWrapper()
+    wrapper_2 = ABIMapWrapper(Web3())
+    assert wrapper_1.abi_registry is not wrapper_2.abi_registry
+    assert not registry.has_encoder("ExactInputParams")
+    assert not registry.has_encoder("ExactOutputParams")
+
+    currency = Web3.to_checksum_address("0x" + "11" * 20)
+    path_keys = [(currency, 3000, 60, currency, b"")]
+    args = ((currency, path_keys, [], 10**18, 0), )
+    abi = wrapper_1.abi_map[V4Actions.SWAP_EXACT_IN]
+    encoded = abi.encode(args, wrapper_1.abi_codec)
+    assert encoded == abi.encode(args, wrapper_2.abi_codec)
+    decoded = wrapper_2.abi_codec.decode(abi.type_list, encoded)
+    assert decoded[0]["currencyIn"] == currency
+    assert decoded[0]["PathKeys"][0]["fee"] == 3000
+    with pytest.raises(NoEntriesFound):
+        abi.encode(args)  # the custom types are not registered on the global registry
@@ -1,13 +1,25 @@
 from pprint import pp
 
 import pytest
-from web3 import AsyncWeb3
+from web3 import (
+    AsyncWeb3,
+    WebSocketProvider,
+)
 from web3.types import Wei
 
-from tests.resources.transactions import transactions
+from tests.resources.rpc_server import (
+    build_transaction,
+    StandInRPCServer,
+    test_transactions,
+)
+from tests.resources.transactions import (
+    missing_command_input,
+    transactions,
+)
 from uniswap_universal_router_decoder import (
     AsyncRouterCodec,
     FunctionRecipient,
+    SQLiteCheckpoint,
     V4Constants,
 )
 from uniswap_universal_router_decoder._constants import ur_address
@@ -44,6 +56,118 @@ async def test_decode_transaction(trx_hash, use_w3, expected_decoded_input, asyn
     assert str(decoded_input) == expected_decoded_input
 
 
+@pytest.fixture
+async def rpc_server():
+    server = StandInRPCServer(latency=0.01)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.mark.parametrize("batch_size, expected_requests", ((None, 21), (1, 21), (5, 5), (100, 1)))
+async def test_decode_transactions(batch_size, expected_requests, rpc_server):
+    codec_w3 = AsyncRouterCodec(rpc_endpoint=rpc_server.url)
+    trx_hashes = [trx["trx_hash"] for trx in transactions] * 3
+
+    decoded_trxs = await codec_w3.decode.transactions(trx_hashes, concurrency=4, batch_size=batch_size)
+
+    assert rpc_server.requests == expected_requests
+    assert [decoded_trx["hash"] for decoded_trx in decoded_trxs] == [
+        AsyncWeb3.to_bytes(hexstr=trx_hash) for trx_hash in trx_hashes
+    ]
+    for decoded_trx, trx_hash in zip(decoded_trxs, trx_hashes):
+        expected_trx = await codec_w3.decode.transaction(trx_hash)
+        assert decoded_trx == expected_trx
+    await codec_w3._w3.provider.disconnect()
+
+
+async def test_decode_block(rpc_server):
+    codec_w3 = AsyncRouterCodec(rpc_endpoint=rpc_server.url)
+    decoded_trxs = await codec_w3.decode.block(20_000_000)
+    assert rpc_server.requests == 1
+    assert [decoded_trx["hash"] for decoded_trx in decoded_trxs] == [
+        AsyncWeb3.to_bytes(hexstr=trx["trx_hash"]) for trx in transactions
+    ] + [AsyncWeb3.to_bytes(hexstr="0x" + "44" * 32)]
+    for decoded_trx, trx in zip(decoded_trxs, transactions):
+        assert decoded_trx["decoded_input"] == codec_w3.decode.function_input(trx["input"])
+    assert decoded_trxs[-1]["decoded_input"] is None
+    assert await codec_w3.decode.block("latest", router_addresses=[]) == []
+    await codec_w3._w3.provider.disconnect()
+
+
+async def test_scan(rpc_server, tmp_path):
+    codec_w3 = AsyncRouterCodec(rpc_endpoint=rpc_server.url)
+    checkpoint = SQLiteCheckpoint(tmp_path / "checkpoints.db")
+    block_numbers = []
+    async for block_number, decoded_trxs in codec_w3.decode.scan(100, 109, checkpoint, concurrency=3):
+        assert len(decoded_trxs) == len(transactions) + 1
+        assert all(trx["blockNumber"] == block_number for trx in decoded_trxs)
+        block_numbers.append(block_number)
+        if block_number == 103:
+            break  # block 103 is not done
+    assert block_numbers == [100, 101, 102, 103]
+    assert checkpoint.load() == 102
+
+    block_numbers = [block_number async for block_number, _ in codec_w3.decode.scan(100, 109, checkpoint)]
+    assert block_numbers == list(range(103, 110))
+    assert checkpoint.load() == 109
+    await codec_w3._w3.provider.disconnect()
+
+
+@pytest.mark.parametrize("full_transactions", (True, False))
+async def test_pending_transactions(full_transactions, rpc_server):
+    codec_w3 = AsyncRouterCodec(rpc_endpoint=rpc_server.url)
+    pending_trxs = codec_w3.decode.pending_transactions(rpc_server.ws_url, full_transactions=full_transactions)
+    decoded_trxs = []
+    async for decoded_trx in pending_trxs:
+        decoded_trxs.append(decoded_trx)
+        if len(decoded_trxs) == len(transactions) + 1:
+            break
+    await pending_trxs.aclose()
+
+    # the transaction to another contract is filtered out
+    assert [decoded_trx["hash"] for decoded_trx in decoded_trxs] == [
+        AsyncWeb3.to_bytes(hexstr=trx["trx_hash"]) for trx in transactions
+    ] + [AsyncWeb3.to_bytes(hexstr="0x" + "44" * 32)]
+    for decoded_trx, trx in zip(decoded_trxs, transactions):
+        assert decoded_trx["decoded_input"] == codec_w3.decode.function_input(trx["input"])
+    assert decoded_trxs[-1]["decoded_input"] is None
+
+
+@pytest.mark.parametrize("full_transactions", (True, False))
+async def test_pending_transactions_missing_command_input(full_transactions):
+    malformed_trx = build_transaction("0x" + "77" * 32, missing_command_input, len(transactions))
+    server = StandInRPCServer([*test_transactions.values(), malformed_trx])
+    await server.start()
+    ws_w3 = await AsyncWeb3(WebSocketProvider(server.ws_url))
+    try:
+        # another subscription on the same websocket
+        await ws_w3.eth.subscribe("newHeads")
+        codec_w3 = AsyncRouterCodec(rpc_endpoint=server.url)
+        pending_trxs = codec_w3.decode.pending_transactions(ws_w3, full_transactions=full_transactions)
+        decoded_trxs = []
+        async for decoded_trx in pending_trxs:
+            decoded_trxs.append(decoded_trx)
+            if len(decoded_trxs) == len(transactions) + 2:
+                break
+        await pending_trxs.aclose()
+    finally:
+        await ws_w3.provider.disconnect()
+        await server.stop()
+
+    # the undecodable transactions do not end the subscription, and the other subscription is ignored
+    assert [decoded_trx["hash"] for decoded_trx in decoded_trxs if decoded_trx["decoded_input"] is None] == [
+        AsyncWeb3.to_bytes(hexstr=malformed_trx["hash"]),
+        AsyncWeb3.to_bytes(hexstr="0x" + "44" * 32),
+    ]
+    assert AsyncWeb3.to_bytes(hexstr="0x" + "88" * 32) not in [decoded_trx["hash"] for decoded_trx in decoded_trxs]
+
+
+async def test_decode_transactions_errors(async_codec):
+    with pytest.raises(ValueError):
+        await async_codec.decode.transactions([transactions[0]["trx_hash"]], concurrency=0)
+
+
 async def test_build_transaction(async_w3):
     async_codec = AsyncRouterCodec(async_w3=async_w3)
     sender = "0x1AB4973a48dc892Cd9971ECE8e01DcC7688f8F23"
@@ -0,0 +1,26 @@
+import pytest
+
+from uniswap_universal_router_decoder import (
+    FileCheckpoint,
+    SQLiteCheckpoint,
+)
+
+
+@pytest.mark.parametrize("checkpoint_type", (FileCheckpoint, SQLiteCheckpoint))
+def test_checkpoint(checkpoint_type, tmp_path):
+    checkpoint = checkpoint_type(tmp_path / "checkpoint")
+    assert checkpoint.load() is None
+    checkpoint.save(20_000_000)
+    assert checkpoint.load() == 20_000_000
+    checkpoint.save(20_000_001)
+    assert checkpoint_type(tmp_path / "checkpoint").load() == 20_000_001
+
+
+def test_sqlite_checkpoint_names(tmp_path):
+    checkpoint_1 = SQLiteCheckpoint(tmp_path / "checkpoints.db", "scan_1")
+    checkpoint_2 = SQLiteCheckpoint(tmp_path / "checkpoints.db", "scan_2")
+    checkpoint_1.save(1)
+    assert checkpoint_2.load() is None
+    checkpoint_2.save(2)
+    assert checkpoint_1.load() == 1
+    assert checkpoint_2.load() == 2
@@ -0,0 +1,56 @@
+import pytest
+from web3 import Web3
+
+from uniswap_universal_router_decoder import (
+    checksum_cache,
+    ChecksumCache,
+    RouterCodec,
+)
+
+
+weth = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+usdt = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+
+
+def test_checksum_cache():
+    cache = ChecksumCache(maxsize=2)
+    assert cache.to_checksum_address(weth.lower()) == weth
+    assert cache.to_checksum_address(bytes.fromhex(weth[2:])) == weth
+    assert cache.to_checksum_address(weth.upper().replace("X", "x")) == weth
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    assert cache.to_checksum_address(usdt.lower()) == usdt
+    assert cache.to_checksum_address("0x" + "00" * 20) == "0x" + "00" * 20
+    assert len(cache) == 2
+    assert cache.to_checksum_address(weth) == weth  # evicted
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_checksum_cache_trusted_input():
+    wrong_checksum = "0x" + weth[2:].swapcase()
+    assert ChecksumCache().to_checksum_address(wrong_checksum) == weth
+
+    cache = ChecksumCache(trusted_input=True)
+    assert cache.to_checksum_address(wrong_checksum) == wrong_checksum
+    assert cache.to_checksum_address(weth.lower()) == weth
+    assert cache.to_checksum_address(weth) == weth
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_checksum_cache_errors():
+    with pytest.raises(ValueError):
+        ChecksumCache(maxsize=0)
+
+
+def test_shared_checksum_cache():
+    codec = RouterCodec()
+    checksum_cache.clear()
+    path = codec.encode.v3_path("V3_SWAP_EXACT_IN", [weth, 500, usdt])
+    assert codec.decode.v3_paths("V3_SWAP_EXACT_IN", [path] * 2) == [(weth, 500, usdt)] * 2
+    assert codec.encode.v4_pool_key(usdt.lower(), weth.lower(), 500, 10)["currency_0"] == weth
+    assert checksum_cache.misses == 3  # weth, usdt and the hooks address
+    assert checksum_cache.hits == 6
+    assert Web3.is_checksum_address(codec.encode.v4_path_key(weth, 500, 10)["intermediate_currency"])
@@ -0,0 +1,75 @@
+import pytest
+from web3 import Web3
+from web3.types import HexStr
+
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder import (
+    CalldataCorpus,
+    DecodeCache,
+    DecodingEngine,
+    RouterCodec,
+    write_calldata_corpus,
+)
+
+
+inputs = [HexStr(trx["input"]) for trx in transactions]
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    path = tmp_path / "calldata.urc"
+    # hex strings and bytes-like objects can be mixed
+    assert write_calldata_corpus(path, inputs[:2] + [Web3.to_bytes(hexstr=data) for data in inputs[2:]]) == len(inputs)
+    return path
+
+
+def test_calldata_corpus(corpus_path):
+    expected_inputs = [Web3.to_bytes(hexstr=data) for data in inputs]
+    with CalldataCorpus(corpus_path) as corpus:
+        assert len(corpus) == len(inputs)
+        assert all(isinstance(input_data, memoryview) for input_data in corpus)
+        assert [bytes(input_data) for input_data in corpus] == expected_inputs
+        assert [bytes(corpus[i]) for i in range(len(corpus))] == expected_inputs
+        assert bytes(corpus[-1]) == expected_inputs[-1]
+        assert [bytes(input_data) for input_data in corpus[1:4]] == expected_inputs[1:4]
+        with pytest.raises(IndexError):
+            corpus[len(inputs)]
+        last_input = corpus[-1]
+    assert bytes(last_input) == expected_inputs[-1]  # still mapped while referenced
+
+    empty_path = corpus_path.with_name("empty.urc")
+    assert write_calldata_corpus(empty_path, []) == 0
+    with CalldataCorpus(empty_path) as corpus:
+        assert len(corpus) == 0
+        assert list(corpus) == []
+
+
+def test_decode_calldata_corpus(corpus_path):
+    codec = RouterCodec()
+    with CalldataCorpus(corpus_path) as corpus:
+        for input_data, hex_input in zip(corpus, inputs):
+            assert codec.decode.function_input(input_data, DecodingEngine.RAW) == codec.decode.function_input(
+                hex_input,
+                DecodingEngine.RAW,
+            )
+            assert repr(codec.decode.function_input(input_data)) == repr(codec.decode.function_input(hex_input))
+            assert codec.decode.command_summary(input_data) == codec.decode.command_summary(hex_input)
+        assert codec.decode.columns(corpus).keys() == codec.decode.columns(inputs).keys()
+
+        cache = DecodeCache()
+        cached_codec = RouterCodec(decode_cache=cache)
+        cached_codec.decode.function_input(corpus[0], DecodingEngine.RAW)
+        cached_codec.decode.function_input(inputs[0], DecodingEngine.RAW)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_calldata_corpus_errors(tmp_path):
+    path = tmp_path / "not_a_corpus.urc"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        CalldataCorpus(path)
+
+    write_calldata_corpus(path, inputs)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        CalldataCorpus(path)
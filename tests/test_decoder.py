@@ -1,8 +1,70 @@
+import csv
+import io
+import json
+import pickle
+from types import MappingProxyType
+
+from eth_abi import (
+    decode,
+    encode,
+)
 import pytest
 from web3 import Web3
+from web3.contract.contract import BaseContractFunction
+from web3.types import (
+    HexBytes,
+    HexStr,
+)
 
-from tests.resources.transactions import transactions
-from uniswap_universal_router_decoder import RouterCodec
+from tests.resources.rpc_server import (
+    build_transaction,
+    serve_in_thread,
+    StandInRPCServer,
+    test_transactions,
+)
+from tests.resources.transactions import (
+    missing_command_input,
+    transactions,
+)
+from tests.test_encoder import (
+    expected_v3_path_1,
+    expected_v3_path_2,
+    path_seq_1,
+    path_seq_2,
+)
+from tests.test_v4_codec import (
+    input_01,
+    input_02,
+)
+from uniswap_universal_router_decoder import (
+    _decoder,
+    CommandColumns,
+    CommandInfo,
+    CompactCommand,
+    CompactResult,
+    DecodeCache,
+    DecodingEngine,
+    FileCheckpoint,
+    FunctionRecipient,
+    LazyCommandInputs,
+    RouterCodec,
+    RouterFunction,
+    StreamFormat,
+    StreamStats,
+    SwapLeg,
+    SwapProtocol,
+    V4Actions,
+)
+from uniswap_universal_router_decoder._cache import freeze
+
+
+# the inputs of the test transactions and the V4 test inputs
+all_inputs = [trx["input"] for trx in transactions] + [input_01, input_02]
+parametrize_all_inputs = pytest.mark.parametrize(
+    "input_data",
+    all_inputs,
+    ids=[f"trx_{i}" for i in range(len(transactions))] + ["input_01", "input_02"],
+)
 
 
 # Test Decode Trx + Input
@@ -33,6 +95,709 @@ def test_decode_transaction(trx_hash, use_w3, expected_decoded_input, w3, rpc_ur
     assert str(decoded_input) == expected_decoded_input
 
 
+@pytest.mark.parametrize("trx", transactions)
+def test_decode_function_input(trx, codec):
+    assert str(codec.decode.function_input(trx["input"])) == trx["decoded_input"]
+    # compiled function decoders are reused across calls
+    assert str(codec.decode.function_input(trx["input"])) == trx["decoded_input"]
+
+
+def to_raw(decoded):
+    """Convert a web3 decoded input into the expected raw one"""
+    if isinstance(decoded, BaseContractFunction):
+        return decoded.fn_name
+    if isinstance(decoded, str) and Web3.is_checksum_address(decoded):
+        return decoded.lower()
+    if isinstance(decoded, dict):
+        return {k: to_raw(v) for k, v in decoded.items()}
+    if isinstance(decoded, tuple):
+        return tuple(to_raw(v) for v in decoded)
+    if isinstance(decoded, list):
+        items = [to_raw(v) for v in decoded]
+        # arrays of non struct values are returned as tuples by eth_abi
+        return items if any(isinstance(item, (dict, tuple)) for item in items) else tuple(items)
+    return decoded
+
+
+@parametrize_all_inputs
+def test_decode_function_input_raw_engine(input_data, codec):
+    web3_decoded_input = codec.decode.function_input(input_data)
+    raw_decoded_input = codec.decode.function_input(input_data, DecodingEngine.RAW)
+    assert raw_decoded_input[0] == "execute"
+    assert raw_decoded_input == to_raw(web3_decoded_input)
+
+
+def test_decode_function_input_raw_engine_unknown_function(codec):
+    with pytest.raises(ValueError):
+        codec.decode.function_input("0x12345678", DecodingEngine.RAW)
+
+
+@pytest.mark.parametrize("workers", (0, 2))
+@pytest.mark.parametrize("engine", (DecodingEngine.WEB3, DecodingEngine.RAW, DecodingEngine.COMPACT))
+def test_decode_function_inputs(workers, engine, codec):
+    input_data_list = all_inputs * 2
+    expected_output = [codec.decode.function_input(input_data, engine) for input_data in input_data_list]
+
+    output = codec.decode.function_inputs(input_data_list, workers=workers, chunksize=3, engine=engine)
+
+    assert str(output) == str(expected_output)
+    if engine is DecodingEngine.WEB3:
+        assert all(isinstance(fct, BaseContractFunction) for fct, _ in output)
+
+
+@pytest.mark.parametrize("engine", (DecodingEngine.WEB3, DecodingEngine.COMPACT))
+def test_decode_function_inputs_cache(engine, mocker):
+    mocker.patch.object(_decoder, "_chunks_per_worker", 1)  # several windows of 2 * 2 inputs
+    input_data_list = [HexStr(input_data) for input_data in all_inputs]
+    cache = DecodeCache()
+    cached_codec = RouterCodec(decode_cache=cache)
+    cached_inputs = [cached_codec.decode.function_input(input_data, engine) for input_data in input_data_list[::2]]
+
+    # the cached inputs are read in the current process, the other ones are decoded by the workers and cached
+    output = cached_codec.decode.function_inputs(iter(input_data_list), workers=2, chunksize=2, engine=engine)
+    assert (cache.hits, cache.misses) == (len(cached_inputs), len(input_data_list))
+    assert all(result is cached_input for result, cached_input in zip(output[::2], cached_inputs))
+    assert all(
+        result is cached_codec.decode.function_input(input_data, engine)
+        for result, input_data in zip(output, input_data_list)
+    )
+    assert isinstance(output[1][1], (MappingProxyType, CompactResult))
+    assert str(output) == str([freeze(RouterCodec().decode.function_input(data, engine)) for data in input_data_list])
+
+
+@pytest.mark.parametrize("engine", (DecodingEngine.WEB3, DecodingEngine.RAW))
+def test_decode_stream_jsonl(engine, codec):
+    lines = [
+        json.dumps({"hash": "0x01", "input": transactions[0]["input"]}),
+        "",
+        json.dumps(transactions[1]["input"]),
+        "{not json",
+        json.dumps({"hash": "0x02"}),
+        json.dumps({"input": "0xzz"}),
+        json.dumps({"input": "0x12345678"}),
+        json.dumps({"input": missing_command_input}),
+        json.dumps({"input": transactions[2]["input"]}),
+    ]
+    stats = StreamStats()
+
+    output = list(codec.decode.stream(io.StringIO("\n".join(lines)), engine=engine, stats=stats))
+
+    assert [line_number for line_number, _ in output] == [1, 3, 9]
+    expected_output = [codec.decode.function_input(trx["input"], engine) for trx in transactions[:3]]
+    assert str([decoded_input for _, decoded_input in output]) == str(expected_output)
+    assert stats == StreamStats(lines=8, decoded=3, malformed=3, undecodable=2)
+
+
+def test_decode_stream_csv(codec):
+    fileobj = io.StringIO()
+    writer = csv.writer(fileobj)
+    writer.writerow(["hash", "calldata"])
+    writer.writerow(["0x01", transactions[0]["input"]])
+    writer.writerow(["0x02", ""])
+    writer.writerow(["0x03", transactions[1]["input"]])
+    fileobj.seek(0)
+    stats = StreamStats()
+
+    output = list(codec.decode.stream(fileobj, StreamFormat.CSV, "calldata", stats=stats))
+
+    assert [line_number for line_number, _ in output] == [2, 4]
+    assert [str(decoded_input) for _, decoded_input in output] == [trx["decoded_input"] for trx in transactions[:2]]
+    assert stats == StreamStats(lines=3, decoded=2, malformed=1, undecodable=0)
+
+
+def test_decode_stream_is_lazy(codec):
+    def lines():
+        yield json.dumps(transactions[0]["input"])
+        raise AssertionError("The stream must not be read ahead")
+
+    assert str(next(codec.decode.stream(lines()))[1]) == transactions[0]["decoded_input"]
+
+
+@parametrize_all_inputs
+@pytest.mark.parametrize("engine", (DecodingEngine.WEB3, DecodingEngine.RAW))
+def test_lazy_decode_function_input(input_data, engine, codec):
+    fct, decoded_input = codec.decode.lazy_function_input(input_data, engine)
+    lazy_inputs = decoded_input["inputs"]
+    assert isinstance(lazy_inputs, LazyCommandInputs)
+    assert len(lazy_inputs) == len(decoded_input["commands"])
+    assert not any(lazy_inputs.is_decoded(i) for i in range(len(lazy_inputs)))
+
+    expected_fct, expected_decoded_input = codec.decode.function_input(input_data, engine)
+    assert lazy_inputs[-1] == expected_decoded_input["inputs"][-1]
+    assert lazy_inputs.is_decoded(len(lazy_inputs) - 1)
+    assert len(lazy_inputs) == 1 or not lazy_inputs.is_decoded(0)
+    assert lazy_inputs[-1] is lazy_inputs[-1]
+
+    assert str((fct, decoded_input)) == str((expected_fct, expected_decoded_input))
+    assert lazy_inputs == expected_decoded_input["inputs"]
+
+
+@parametrize_all_inputs
+def test_command_summary(input_data, codec):
+    _, decoded_input = codec.decode.function_input(input_data, DecodingEngine.RAW)
+    data = bytes(HexBytes(input_data))
+    types = ["bytes", "bytes[]", "uint256"] if "deadline" in decoded_input else ["bytes", "bytes[]"]
+    raw_inputs = decode(types, data[4:])[1]
+
+    summary = codec.decode.command_summary(input_data)
+
+    assert summary.commands == decoded_input["commands"]
+    assert summary.deadline == decoded_input.get("deadline")
+    assert len(summary.command_infos) == len(raw_inputs)
+    for info, raw_input, decoded_command in zip(summary.command_infos, raw_inputs, decoded_input["inputs"]):
+        assert data[info.input_offset:info.input_offset + info.input_length] == raw_input
+        if not isinstance(decoded_command, str):
+            assert info.command.name == decoded_command[0]
+            assert info.revert_on_fail == decoded_command[2]["revert_on_fail"]
+
+
+def test_command_summary_flags(codec):
+    summary = codec.decode.command_summary(transactions[3]["input"])
+    assert summary.contains(RouterFunction.SWEEP)
+    assert not summary.contains(RouterFunction.V4_SWAP, RouterFunction.V3_SWAP_EXACT_IN)
+    assert summary.command_infos[0].command == 0x19  # unknown command
+    assert summary.command_infos[1] == CommandInfo(RouterFunction.SWEEP, True, 804, 96)
+
+
+@pytest.mark.parametrize(
+    "input_data",
+    (
+        "0x12345678",
+        transactions[0]["input"][:100],
+        transactions[0]["input"][:-64],
+    )
+)
+def test_command_summary_errors(input_data, codec):
+    with pytest.raises(ValueError):
+        codec.decode.command_summary(input_data)
+
+
+def fn_name(fct):
+    return fct if isinstance(fct, str) else fct.fn_name
+
+
+@parametrize_all_inputs
+@pytest.mark.parametrize("engine", (DecodingEngine.WEB3, DecodingEngine.RAW))
+def test_decode_function_input_fields(input_data, engine, codec):
+    _, decoded_input = codec.decode.function_input(input_data, engine)
+    for i, command_input in enumerate(decoded_input["inputs"]):
+        if isinstance(command_input, str):
+            continue
+        fct, params, _ = command_input
+        if "actions" in params or "unlockData" in params:
+            v4_params = params.get("unlockData", params)["params"]
+            for action in v4_params:
+                if isinstance(action, str):
+                    continue
+                for field, value in action[1].items():
+                    _, projected = codec.decode.function_input(
+                        input_data,
+                        engine,
+                        fields={V4Actions[fn_name(action[0])]: [field]},
+                    )
+                    projected_params = projected["inputs"][i][1].get("unlockData", projected["inputs"][i][1])["params"]
+                    assert (fn_name(action[0]), {field: value}) in [
+                        (fn_name(projected_action[0]), projected_action[1])
+                        for projected_action in projected_params
+                        if not isinstance(projected_action, str)
+                    ]
+            continue
+        for field, value in params.items():
+            fields = {RouterFunction[fn_name(fct)]: [field]}
+            _, projected = codec.decode.function_input(input_data, engine, fields=fields)
+            assert projected["inputs"][i][1] == {field: value}
+
+
+@pytest.mark.parametrize("engine", (DecodingEngine.WEB3, DecodingEngine.RAW))
+def test_decode_function_input_functions(engine, codec):
+    _, decoded_input = codec.decode.function_input(
+        transactions[4]["input"],
+        engine,
+        functions=[RouterFunction.V2_SWAP_EXACT_IN],
+        fields={RouterFunction.V2_SWAP_EXACT_IN: ["path", "amountIn"]},
+    )
+    raw_inputs = decode(["bytes", "bytes[]", "uint256"], HexBytes(transactions[4]["input"])[4:])[1]
+    assert decoded_input["inputs"][:2] == list(raw_inputs[:2])
+    fct, params, revert_on_fail = decoded_input["inputs"][2]
+    assert fn_name(fct) == "V2_SWAP_EXACT_IN"
+    assert list(params) == ["path", "amountIn"]
+    assert params["amountIn"] == 57896044618658097711785492504343953926634992332820282019728792003956564819968
+    assert revert_on_fail == {"revert_on_fail": True}
+
+    _, decoded_input = codec.decode.function_input(input_01, engine, functions={V4Actions.SETTLE})
+    actions = decoded_input["inputs"][0][1]["params"]
+    assert isinstance(actions[0], bytes) and isinstance(actions[2], bytes)
+    assert fn_name(actions[1][0]) == "SETTLE"
+
+
+@pytest.mark.parametrize(
+    "fields",
+    (
+        {RouterFunction.V2_SWAP_EXACT_IN: ["unknown"]},
+        {RouterFunction.V4_SWAP: ["actions"]},
+    )
+)
+def test_decode_function_input_fields_errors(fields, codec):
+    with pytest.raises(ValueError):
+        codec.decode.function_input(transactions[4]["input"], fields=fields)
+
+
+@parametrize_all_inputs
+def test_decode_function_input_compact_engine(input_data, codec):
+    raw_decoded_input = codec.decode.function_input(input_data, DecodingEngine.RAW)
+    compact_decoded_input = codec.decode.function_input(input_data, DecodingEngine.COMPACT)
+    assert compact_decoded_input[0] == "execute"
+    assert isinstance(compact_decoded_input[1], CompactResult)
+    assert compact_decoded_input[1].to_dict() == raw_decoded_input[1]
+    assert pickle.loads(pickle.dumps(compact_decoded_input)) == compact_decoded_input
+
+
+def test_decode_function_input_compact_engine_access(codec):
+    _, decoded_input = codec.decode.function_input(transactions[4]["input"], DecodingEngine.COMPACT)
+    command = decoded_input.inputs[2]
+    assert isinstance(command, CompactCommand)
+    assert command.fn_name == "V2_SWAP_EXACT_IN"
+    assert command.revert_on_fail is True
+    assert command.amountIn == command["amountIn"]
+    assert not hasattr(command, "__dict__")
+    with pytest.raises(KeyError):
+        command["unknown"]
+
+    _, decoded_input = codec.decode.function_input(
+        transactions[4]["input"],
+        DecodingEngine.COMPACT,
+        fields={RouterFunction.V2_SWAP_EXACT_IN: ["path", "amountIn"]},
+    )
+    command = decoded_input["inputs"][2]
+    assert list(command) == ["amountIn", "path"]
+    assert not hasattr(command, "amountOutMin")
+
+    _, decoded_input = codec.decode.function_input(input_01, DecodingEngine.COMPACT, functions={V4Actions.SETTLE})
+    actions = decoded_input.inputs[0].params
+    assert isinstance(actions[0], bytes) and isinstance(actions[2], bytes)
+    assert actions[1].fn_name == "SETTLE"
+
+
+def test_decode_columns(codec):
+    input_data_list = all_inputs
+    tables = codec.decode.columns(input_data_list)
+
+    rows = {
+        (function, i, j): row
+        for function, table in tables.items()
+        for row, (i, j) in enumerate(zip(table.columns["transaction"], table.columns["command"]))
+    }
+    expected_rows = 0
+    for i, input_data in enumerate(input_data_list):
+        _, decoded_input = codec.decode.function_input(input_data, DecodingEngine.RAW)
+        for j, command_input in enumerate(decoded_input["inputs"]):
+            if isinstance(command_input, str):
+                continue  # undecodable commands are skipped
+            fct_name, params, revert_on_fail = command_input
+            table = tables[RouterFunction[fct_name]]
+            row = rows[(RouterFunction[fct_name], i, j)]
+            assert table.columns["revert_on_fail"][row] == revert_on_fail["revert_on_fail"]
+            if fct_name.startswith("V4"):
+                continue  # V4 actions are not decoded in the columns
+            assert {name: table.columns[name][row] for name in params} == params
+            expected_rows += 1
+    assert expected_rows == sum(len(table) for function, table in tables.items() if not function.name.startswith("V4"))
+
+    v3_swap = tables[RouterFunction.V3_SWAP_EXACT_IN]
+    assert v3_swap.columns["tokenIn"][0] == f"0x{v3_swap.columns['path'][0][:20].hex()}"
+    v3_swap = tables[RouterFunction.V3_SWAP_EXACT_OUT]
+    assert v3_swap.columns["tokenIn"][0] == f"0x{v3_swap.columns['path'][0][-20:].hex()}"
+    v2_swap = tables[RouterFunction.V2_SWAP_EXACT_IN]
+    assert v2_swap.columns["tokenOut"][0] == v2_swap.columns["path"][0][-1]
+
+
+def test_decode_columns_undecodable_commands():
+    codec = RouterCodec()
+    posm_input = (
+        codec.encode.chain()
+        .v4_posm_call()
+        .close_currency("0x0000000000000000000000000000000000000000")
+        .build_v4_posm_call(codec.get_default_deadline())
+        .build()
+    )
+    selector, arguments = posm_input[:10], bytes.fromhex(posm_input[10:])
+    commands, inputs = decode(["bytes", "bytes[]"], arguments)
+    wrong_selector_arguments = encode(["bytes", "bytes[]"], [commands, [b"\xde\xad\xbe\xef" + inputs[0][4:]]])
+    wrong_selector_input = selector + wrong_selector_arguments.hex()
+    v2_swap_input = transactions[0]["input"]
+
+    tables = codec.decode.columns([posm_input, wrong_selector_input])
+    assert tables[RouterFunction.V4_POSITION_MANAGER_CALL].columns["transaction"] == [0]
+    assert codec.decode.function_input(wrong_selector_input)[1]["inputs"][0] == "deadbeef" + inputs[0][4:].hex()
+
+    # a command without decoder is skipped like the other undecodable commands, instead of failing the whole batch
+    del codec.decode._columnar_decoder._fn_decoders[RouterFunction.V4_POSITION_MANAGER_CALL]
+    tables = codec.decode.columns([posm_input, v2_swap_input])
+    assert RouterFunction.V4_POSITION_MANAGER_CALL not in tables
+    assert tables.keys() == codec.decode.columns([v2_swap_input]).keys()
+
+
+def test_decode_columns_invalid_paths_and_missing_inputs(codec):
+    abi_map = codec.decode._columnar_decoder._abi_map
+    selector = transactions[0]["input"][:10]
+    recipient = "0x" + "11" * 20
+    token = "0x" + "22" * 20
+
+    def swap_input(function, path):
+        types = [param.type for param in abi_map[function].params]
+        command_input = encode(types, [recipient, 10**18, 0, path, True, []])
+        arguments = encode(["bytes", "bytes[]", "uint256"], [bytes([function.value]), [command_input], 2**32])
+        return selector + arguments.hex()
+
+    valid_inputs = [
+        swap_input(RouterFunction.V2_SWAP_EXACT_IN, [token, recipient]),
+        swap_input(RouterFunction.V3_SWAP_EXACT_IN, bytes(20) + bytes(23)),
+    ]
+    invalid_inputs = [
+        swap_input(RouterFunction.V2_SWAP_EXACT_IN, []),
+        swap_input(RouterFunction.V3_SWAP_EXACT_IN, bytes(19)),
+        swap_input(RouterFunction.V3_SWAP_EXACT_IN, bytes(20) + bytes(22)),
+        swap_input(RouterFunction.V3_SWAP_EXACT_OUT, b""),
+        missing_command_input,
+    ]
+    # invalid rows are skipped like the other undecodable commands, instead of failing the whole batch
+    tables = codec.decode.columns(invalid_inputs + valid_inputs)
+    assert list(tables) == [RouterFunction.V2_SWAP_EXACT_IN, RouterFunction.V3_SWAP_EXACT_IN]
+    assert tables[RouterFunction.V2_SWAP_EXACT_IN].columns["transaction"] == [5]
+    assert tables[RouterFunction.V2_SWAP_EXACT_IN].columns["tokenIn"] == [Web3.to_checksum_address(token)]
+    assert tables[RouterFunction.V3_SWAP_EXACT_IN].columns["transaction"] == [6]
+
+    # the functions tables are kept, even when all their rows are invalid
+    tables = codec.decode.columns(invalid_inputs, functions=[RouterFunction.V2_SWAP_EXACT_IN])
+    assert list(tables) == [RouterFunction.V2_SWAP_EXACT_IN]
+    assert len(tables[RouterFunction.V2_SWAP_EXACT_IN]) == 0
+
+
+def test_decode_columns_functions(codec):
+    tables = codec.decode.columns(
+        [trx["input"] for trx in transactions],
+        functions=[RouterFunction.V2_SWAP_EXACT_IN, RouterFunction.V4_INITIALIZE_POOL],
+    )
+    assert list(tables) == [RouterFunction.V2_SWAP_EXACT_IN, RouterFunction.V4_INITIALIZE_POOL]
+    assert isinstance(tables[RouterFunction.V2_SWAP_EXACT_IN], CommandColumns)
+    assert len(tables[RouterFunction.V2_SWAP_EXACT_IN]) == 3
+    assert len(tables[RouterFunction.V4_INITIALIZE_POOL]) == 0
+
+    with pytest.raises(ValueError):
+        codec.decode.columns(["0x12345678"])
+
+
+def test_decode_columns_to_arrow(codec):
+    pa = pytest.importorskip("pyarrow")
+    tables = codec.decode.columns([trx["input"] for trx in transactions])
+    for table in tables.values():
+        record_batch = table.to_arrow()
+        assert record_batch.num_rows == len(table)
+        assert record_batch.schema.names == list(table.columns)
+    record_batch = tables[RouterFunction.V2_SWAP_EXACT_IN].to_arrow()
+    assert record_batch.schema.field("amountIn").type == pa.string()
+    assert record_batch.column("amountIn").to_pylist() == [
+        str(amount) for amount in tables[RouterFunction.V2_SWAP_EXACT_IN].columns["amountIn"]
+    ]
+    assert record_batch.schema.field("revert_on_fail").type == pa.bool_()
+    permit = tables[RouterFunction.PERMIT2_PERMIT]
+    arrow_struct = permit.to_arrow().column("struct").to_pylist()[0]
+    assert arrow_struct["details"]["expiration"] == permit.columns["struct"][0]["details"]["expiration"]
+
+    raw_tables = RouterCodec(raw_addresses=True).decode.columns([trx["input"] for trx in transactions])
+    record_batch = raw_tables[RouterFunction.V2_SWAP_EXACT_IN].to_arrow()
+    assert record_batch.schema.field("recipient").type == pa.binary(20)
+    assert record_batch.column("tokenIn").to_pylist() == raw_tables[RouterFunction.V2_SWAP_EXACT_IN].columns["tokenIn"]
+
+
+def test_decode_columns_to_numpy(codec):
+    pytest.importorskip("numpy")
+    tables = codec.decode.columns([trx["input"] for trx in transactions])
+    for table in tables.values():
+        array = table.to_numpy()
+        assert len(array) == len(table)
+        assert list(array.dtype.names) == list(table.columns)
+        for name, column in table.columns.items():
+            assert list(array[name]) == column
+    array = tables[RouterFunction.V2_SWAP_EXACT_IN].to_numpy()
+    assert array.dtype["recipient"].kind == "U"
+    assert array.dtype["amountIn"].kind == "O"
+
+    raw_table = RouterCodec(raw_addresses=True).decode.columns([trx["input"] for trx in transactions])[
+        RouterFunction.V2_SWAP_EXACT_IN
+    ]
+    array = raw_table.to_numpy()
+    assert array.dtype["recipient"].kind == "V"
+    assert [recipient.tobytes() for recipient in array["recipient"]] == raw_table.columns["recipient"]
+
+
+@pytest.mark.parametrize("engine", (DecodingEngine.WEB3, DecodingEngine.RAW, DecodingEngine.COMPACT))
+def test_decode_cache(engine):
+    input_data = HexBytes(transactions[4]["input"])
+    cache = DecodeCache(maxsize=2)
+    cached_codec = RouterCodec()
+    expected_output = cached_codec.decode.function_input(input_data, engine)
+    cached_codec.decode.cache = cache
+
+    output = cached_codec.decode.function_input(input_data, engine)
+    assert output == freeze(expected_output)
+    assert cache.misses == 1 and cache.hits == 0
+    assert cached_codec.decode.function_input(HexStr(input_data.to_0x_hex()), engine) is output
+    assert cache.misses == 1 and cache.hits == 1
+
+    # the decoding options are part of the key
+    cached_codec.decode.function_input(input_data, engine, functions=[RouterFunction.V2_SWAP_EXACT_IN])
+    assert cache.misses == 2 and len(cache) == 2
+
+    # LRU eviction
+    cached_codec.decode.function_input(HexBytes(transactions[5]["input"]), engine)
+    assert len(cache) == 2
+    cached_codec.decode.function_input(input_data, engine)
+    assert cache.misses == 4
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == cache.misses == 0
+
+
+def test_decode_cache_read_only():
+    input_data = HexBytes(transactions[4]["input"])
+    cached_codec = RouterCodec(decode_cache=DecodeCache())
+    _, decoded_input = cached_codec.decode.function_input(input_data, DecodingEngine.RAW)
+    assert isinstance(decoded_input, MappingProxyType)
+    with pytest.raises(TypeError):
+        decoded_input["deadline"] = 0  # type: ignore
+    with pytest.raises(TypeError):
+        decoded_input["inputs"][2][1]["amountIn"] = 0  # type: ignore
+    with pytest.raises(AttributeError):
+        decoded_input["inputs"].append(None)  # type: ignore
+
+    _, compact_input = cached_codec.decode.function_input(input_data, DecodingEngine.COMPACT)
+    assert cached_codec.decode.function_input(input_data, DecodingEngine.COMPACT)[1] is compact_input
+    with pytest.raises(AttributeError):
+        compact_input.deadline = 0  # type: ignore
+    with pytest.raises(AttributeError):
+        compact_input.inputs[2].amountIn = 1  # type: ignore
+    with pytest.raises(AttributeError):
+        compact_input.inputs[2].revert_on_fail = False  # type: ignore
+    with pytest.raises(AttributeError):
+        del compact_input.inputs[2].amountIn  # type: ignore
+    with pytest.raises(AttributeError):
+        compact_input.inputs.append(None)  # type: ignore
+    assert compact_input.to_dict() == cached_codec.decode.function_input(input_data, DecodingEngine.RAW)[1]
+
+
+def test_decode_cache_ttl(mocker):
+    monotonic = mocker.patch("uniswap_universal_router_decoder._cache.time.monotonic", return_value=100.0)
+    input_data = HexBytes(transactions[4]["input"])
+    cache = DecodeCache(ttl=10)
+    cached_codec = RouterCodec(decode_cache=cache)
+    cached_codec.decode.function_input(input_data)
+    monotonic.return_value = 109.0
+    cached_codec.decode.function_input(input_data)
+    assert cache.hits == 1
+    monotonic.return_value = 111.0
+    cached_codec.decode.function_input(input_data)
+    assert cache.misses == 2
+
+    with pytest.raises(ValueError):
+        DecodeCache(maxsize=0)
+
+
+def test_decode_block():
+    server = StandInRPCServer()
+    with serve_in_thread(server) as url:
+        codec_rpc = RouterCodec(rpc_endpoint=url)
+        decoded_trxs = codec_rpc.decode.block(20_000_000)
+        assert server.requests == 1
+        assert [decoded_trx["hash"] for decoded_trx in decoded_trxs] == [
+            HexBytes(trx["trx_hash"]) for trx in transactions
+        ] + [HexBytes("0x" + "44" * 32)]
+        for decoded_trx, trx in zip(decoded_trxs, transactions):
+            assert decoded_trx["decoded_input"] == codec_rpc.decode.function_input(trx["input"])
+        assert decoded_trxs[-1]["decoded_input"] is None
+
+        assert codec_rpc.decode.block("latest", router_addresses=["0x" + "33" * 20])[0]["hash"] == HexBytes(
+            "0x" + "22" * 32
+        )
+
+
+def test_decode_block_missing_command_input(codec):
+    with pytest.raises(ValueError):
+        codec.decode.function_input(missing_command_input)
+
+    malformed_trx = build_transaction("0x" + "77" * 32, missing_command_input, len(transactions))
+    server = StandInRPCServer([*test_transactions.values(), malformed_trx])
+    with serve_in_thread(server) as url:
+        decoded_trxs = RouterCodec(rpc_endpoint=url).decode.block(20_000_000)
+        assert [trx["hash"] for trx in decoded_trxs if trx["decoded_input"] is None] == [
+            HexBytes(malformed_trx["hash"]),
+            HexBytes("0x" + "44" * 32),
+        ]
+
+
+def test_scan(tmp_path):
+    checkpoint = FileCheckpoint(tmp_path / "checkpoint")
+    with serve_in_thread(StandInRPCServer()) as url:
+        codec_rpc = RouterCodec(rpc_endpoint=url)
+        expected_trxs = codec_rpc.decode.block(20_000_000)
+
+        block_numbers = []
+        for block_number, decoded_trxs in codec_rpc.decode.scan(100, 109, checkpoint, concurrency=3):
+            assert [trx["hash"] for trx in decoded_trxs] == [trx["hash"] for trx in expected_trxs]
+            assert all(trx["blockNumber"] == block_number for trx in decoded_trxs)
+            block_numbers.append(block_number)
+            if block_number == 103:
+                break  # block 103 is not done
+        assert block_numbers == [100, 101, 102, 103]
+        assert checkpoint.load() == 102
+
+        block_numbers = [block_number for block_number, _ in codec_rpc.decode.scan(100, 109, checkpoint)]
+        assert block_numbers == list(range(103, 110))
+        assert checkpoint.load() == 109
+        assert list(codec_rpc.decode.scan(100, 109, checkpoint)) == []
+
+        with pytest.raises(ValueError):
+            next(codec_rpc.decode.scan(100, 109, concurrency=0))
+
+
+def test_scan_missing_command_input(tmp_path):
+    checkpoint = FileCheckpoint(tmp_path / "checkpoint")
+    malformed_trx = build_transaction("0x" + "77" * 32, missing_command_input, len(transactions))
+    with serve_in_thread(StandInRPCServer([*test_transactions.values(), malformed_trx])) as url:
+        codec_rpc = RouterCodec(rpc_endpoint=url)
+        scanned_blocks = list(codec_rpc.decode.scan(100, 104, checkpoint, concurrency=2))
+        assert [block_number for block_number, _ in scanned_blocks] == list(range(100, 105))
+        for _, decoded_trxs in scanned_blocks:
+            malformed_decoded_trx = next(trx for trx in decoded_trxs if trx["hash"] == HexBytes(malformed_trx["hash"]))
+            assert malformed_decoded_trx["decoded_input"] is None
+        assert checkpoint.load() == 104
+
+
+def hex_addresses(value):
+    """
+    Convert the raw 20-byte addresses to lower case hex strings, as returned by the RAW engine
+    """
+    if isinstance(value, bytes) and len(value) == 20:
+        return f"0x{value.hex()}"
+    if isinstance(value, dict):
+        return {key: hex_addresses(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(hex_addresses(item) for item in value)
+    return value
+
+
+@parametrize_all_inputs
+def test_decode_function_input_raw_addresses(input_data, codec):
+    raw_codec = RouterCodec(raw_addresses=True)
+    raw_decoded_input = raw_codec.decode.function_input(input_data, DecodingEngine.RAW)
+    assert hex_addresses(raw_decoded_input) == codec.decode.function_input(input_data, DecodingEngine.RAW)
+    compact_decoded_input = raw_codec.decode.function_input(input_data, DecodingEngine.COMPACT)
+    assert compact_decoded_input[1].to_dict() == raw_decoded_input[1]
+    # the WEB3 engine still returns checksum addresses
+    assert str(raw_codec.decode.function_input(input_data)) == str(codec.decode.function_input(input_data))
+
+
+def test_decode_function_input_raw_addresses_values():
+    raw_codec = RouterCodec(raw_addresses=True)
+    _, decoded_input = raw_codec.decode.function_input(HexStr(transactions[4]["input"]), DecodingEngine.RAW)
+    fct_name, params, _ = decoded_input["inputs"][2]
+    assert fct_name == "V2_SWAP_EXACT_IN"
+    assert all(isinstance(address, bytes) and len(address) == 20 for address in params["path"])
+    assert type(params["amountIn"]) is int
+
+    input_data_list = [HexStr(trx["input"]) for trx in transactions]
+    expected_output = [raw_codec.decode.function_input(data, DecodingEngine.RAW) for data in input_data_list]
+    assert raw_codec.decode.function_inputs(input_data_list, workers=2, engine=DecodingEngine.RAW) == expected_output
+
+
+def test_decode_columns_raw_addresses(codec):
+    input_data_list = [trx["input"] for trx in transactions]
+    tables = codec.decode.columns(input_data_list)
+    raw_tables = RouterCodec(raw_addresses=True).decode.columns(input_data_list)
+    assert list(raw_tables) == list(tables)
+    for function, raw_table in raw_tables.items():
+        assert hex_addresses(raw_table.columns) == tables[function].columns
+
+    v3_swap = raw_tables[RouterFunction.V3_SWAP_EXACT_OUT]
+    assert v3_swap.columns["tokenIn"][0] == v3_swap.columns["path"][0][-20:]
+    v2_swap = raw_tables[RouterFunction.V2_SWAP_EXACT_IN]
+    assert v2_swap.columns["tokenOut"][0] == v2_swap.columns["path"][0][-1]
+
+
+weth = Web3.to_checksum_address("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
+usdt = Web3.to_checksum_address("0xdAC17F958D2ee523a2206206994597C13D831ec7")
+usdc = Web3.to_checksum_address("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
+no_hooks = "0x0000000000000000000000000000000000000000"
+custom_recipient = Web3.to_checksum_address("0x" + "ab" * 20)
+
+
+def build_swaps_input(codec):
+    path_keys = [codec.encode.v4_path_key(usdt, 500, 10), codec.encode.v4_path_key(usdc, 3000, 60)]
+    return (
+        codec.encode.chain()
+        .wrap_eth(FunctionRecipient.ROUTER, 10**18)
+        .v2_swap_exact_in(FunctionRecipient.SENDER, 10**18, 5, [weth, usdt, usdc])
+        .v3_swap_exact_out(FunctionRecipient.ROUTER, 7, 10**18, [weth, 500, usdt])
+        .v4_swap()
+        .swap_exact_in(weth, path_keys, 10**18, 10**6)
+        .swap_exact_in_single(codec.encode.v4_pool_key(weth, usdc, 500, 10), True, 10, 1)
+        .swap_exact_out(usdc, [path_keys[0], codec.encode.v4_path_key(weth, 100, 1)], 3, 4)
+        .take_all(usdc, 0)
+        .take(weth, custom_recipient, 0)
+        .build_v4_swap()
+        .build(1_700_000_000)
+    )
+
+
+expected_swap_legs = [
+    SwapLeg(1, None, 0, SwapProtocol.V2, RouterFunction.V2_SWAP_EXACT_IN, True, weth, usdt, 10**18, None, None),
+    SwapLeg(
+        1, None, 1, SwapProtocol.V2, RouterFunction.V2_SWAP_EXACT_IN, True, usdt, usdc, None, 5, None,
+        recipient=FunctionRecipient.SENDER,
+    ),
+    SwapLeg(
+        2, None, 0, SwapProtocol.V3, RouterFunction.V3_SWAP_EXACT_OUT, False, weth, usdt, 10**18, 7, 500,
+        recipient=FunctionRecipient.ROUTER,
+    ),
+    SwapLeg(3, 0, 0, SwapProtocol.V4, V4Actions.SWAP_EXACT_IN, True, weth, usdt, 10**18, None, 500, 10, no_hooks),
+    SwapLeg(
+        3, 0, 1, SwapProtocol.V4, V4Actions.SWAP_EXACT_IN, True, usdt, usdc, None, 10**6, 3000, 60, no_hooks,
+        FunctionRecipient.SENDER,
+    ),
+    SwapLeg(
+        3, 1, 0, SwapProtocol.V4, V4Actions.SWAP_EXACT_IN_SINGLE, True, usdc, weth, 10, 1, 500, 10, no_hooks,
+        FunctionRecipient.CUSTOM,
+    ),
+    SwapLeg(3, 2, 0, SwapProtocol.V4, V4Actions.SWAP_EXACT_OUT, False, usdt, weth, 4, None, 500, 10, no_hooks),
+    SwapLeg(
+        3, 2, 1, SwapProtocol.V4, V4Actions.SWAP_EXACT_OUT, False, weth, usdc, None, 3, 100, 1, no_hooks,
+        FunctionRecipient.SENDER,
+    ),
+]
+
+
+def test_swap_legs(codec):
+    assert codec.decode.swap_legs(build_swaps_input(codec)) == expected_swap_legs
+
+    legs = codec.decode.swap_legs(input_01)
+    assert len(legs) == 1
+    assert (legs[0].token_in, legs[0].token_out) == ("0xd04175024082F1490135F5D7054aDE0538386Fed", no_hooks)
+    assert (legs[0].fee, legs[0].tick_spacing, legs[0].recipient) == (10000, 200, FunctionRecipient.CUSTOM)
+
+    # no swap
+    assert codec.decode.swap_legs(transactions[3]["input"]) == []
+
+
+def test_swap_legs_raw_addresses():
+    codec = RouterCodec(raw_addresses=True)
+    legs = codec.decode.swap_legs(build_swaps_input(codec))
+    assert len(legs) == len(expected_swap_legs)
+    for leg, expected_leg in zip(legs, expected_swap_legs):
+        assert leg.token_in == bytes.fromhex(expected_leg.token_in[2:])
+        assert leg.token_out == bytes.fromhex(expected_leg.token_out[2:])
+        assert leg.recipient == expected_leg.recipient
+
+
 # Test Decode V3 Path
 expected_parsed_path_02 = (
     Web3.to_checksum_address("0x9E32b13ce7f2E80A01932B42553652E053D6ed8e"),
@@ -89,6 +854,35 @@ def test_decode_v3_path(trx_hash, fn_name, expected_parsed_path, expected_except
         raise ValueError(f"No fn_name {fn_name} found in the decoded command inputs for trx {trx_hash}")
 
 
+@pytest.mark.parametrize(
+    "fn_name, path, expected_parsed_path",
+    (
+        ("V3_SWAP_EXACT_IN", expected_v3_path_1, path_seq_1),
+        ("V3_SWAP_EXACT_OUT", expected_v3_path_2, path_seq_2),
+        ("v3_swap_exact_out", "0x" + expected_v3_path_2.hex(), path_seq_2),
+    )
+)
+def test_decode_v3_path_offline(fn_name, path, expected_parsed_path, codec):
+    assert codec.decode.v3_path(fn_name, path) == expected_parsed_path
+    raw_parsed_path = codec.decode.v3_path(fn_name, path, checksum=False)
+    assert raw_parsed_path == tuple(
+        Web3.to_bytes(hexstr=item) if isinstance(item, str) else item for item in expected_parsed_path
+    )
+    assert codec.decode.v3_paths(fn_name, [path] * 3) == [expected_parsed_path] * 3
+    assert codec.decode.v3_paths(fn_name, [path], checksum=False) == [raw_parsed_path]
+
+
+@pytest.mark.parametrize(
+    "fn_name, path",
+    (("V2_SWAP_EXACT_IN", expected_v3_path_1), ("V3_SWAP_EXACT_IN", b"\x01" * 42)),
+)
+def test_decode_v3_path_errors(fn_name, path, codec):
+    with pytest.raises(ValueError):
+        codec.decode.v3_path(fn_name, path)
+    with pytest.raises(ValueError):
+        codec.decode.v3_paths(fn_name, [path])
+
+
 contract_error_0 = "0x00000000"
 contract_error_1 = "0x2c4029e9000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000400000000000000000000000000000000000000000000000000000000000000000"  # noqa
 contract_error_2 = "0x5d1d0f9f"
@@ -112,3 +906,32 @@ def test_contract_error(contract_error, expected):
     codec = RouterCodec()
     decoded_error = codec.decode.contract_error(contract_error)
     assert decoded_error == expected
+
+
+def test_contract_error_custom_abis():
+    codec = RouterCodec()
+    abi = json.dumps([{"type": "error", "name": "Custom", "inputs": [{"name": "owner", "type": "address"}]}])
+    custom_error = "0x" + Web3.keccak(text="Custom(address)")[:4].hex() + "00" * 12 + "ab" * 20
+    expected = ("Custom(address)", {"owner": Web3.to_checksum_address("0x" + "ab" * 20)})
+    assert codec.decode.contract_error(custom_error, abis=[abi]) == expected
+    assert codec.decode.contract_error(contract_error_2, abis=[abi]) == ("Unknown error", {})
+    assert codec.decode.contract_error(custom_error) == ("Unknown error", {})
+    # the error arguments are missing
+    assert codec.decode.contract_error(contract_error_1[:10]) == ("Unknown error", {})
+    # one index per set of abis
+    assert len(codec.decode._error_indexes) == 2
+
+
+def test_contract_error_indexes(mocker):
+    codec = RouterCodec()
+    build_error_index = mocker.spy(_decoder, "_build_error_index")
+    for contract_error in (contract_error_1, contract_error_2, contract_error_4):
+        codec.decode.contract_error(contract_error)
+    assert build_error_index.call_count == 1  # the default abis reuse one index
+
+    # each call with other abis builds their index, but only the most recently used ones are kept
+    for i in range(2 * _decoder._max_error_indexes):
+        abi = json.dumps([{"type": "error", "name": f"Custom{i}", "inputs": []}])
+        codec.decode.contract_error(contract_error_2, abis=[abi])
+    assert build_error_index.call_count == 1 + 2 * _decoder._max_error_indexes
+    assert len(codec.decode._error_indexes) == _decoder._max_error_indexes
@@ -0,0 +1,76 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from web3 import Web3
+
+import uniswap_universal_router_decoder
+from uniswap_universal_router_decoder._constants import (
+    permit2_address,
+    ur_address,
+)
+from uniswap_universal_router_decoder._enums import RouterConstant
+
+
+@pytest.mark.parametrize(
+    "statement, expected_web3_import",
+    (
+        ("import uniswap_universal_router_decoder", False),
+        ("from uniswap_universal_router_decoder import DecodingEngine, MAX_TICK, V4Constants", False),
+        ("from uniswap_universal_router_decoder import CalldataCorpus, DecodeCache, SQLiteTransactionCache", False),
+        ("from uniswap_universal_router_decoder import StreamStats", False),
+        ("from uniswap_universal_router_decoder.utils import tick_to_prices", False),
+        ("from uniswap_universal_router_decoder import RouterCodec", True),
+    )
+)
+def test_lazy_imports(statement, expected_web3_import):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print('web3' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == str(expected_web3_import)
+
+
+def test_abi_map_import_runs_no_builder():
+    # the ABI map is loaded from the precomputed table: neither the builders nor keccak run at import
+    code = textwrap.dedent(
+        """
+        import sys
+        import eth_utils
+
+        keccak_calls = []
+        keccak = eth_utils.keccak
+        eth_utils.keccak = lambda *args, **kwargs: keccak_calls.append(args) or keccak(*args, **kwargs)
+        called = set()
+        sys.setprofile(
+            lambda frame, event, arg: event == "call"
+            and frame.f_code.co_filename.endswith("_abi_builder.py")
+            and called.add(frame.f_code.co_name)
+        )
+        from uniswap_universal_router_decoder._abi_builder import ABIRegister
+        sys.setprofile(None)
+
+        builder_names = {builder.__name__ for builder in ABIRegister.builders.values()}
+        print(len(ABIRegister.abi_map), len(builder_names & called), "finalize" in called, len(keccak_calls))
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    abi_map_size, called_builders, finalize_called, keccak_calls = result.stdout.split()
+    assert int(abi_map_size) > 0
+    assert (called_builders, finalize_called, keccak_calls) == ("0", "False", "0")
+
+
+def test_exports():
+    assert set(dir(uniswap_universal_router_decoder)) >= set(uniswap_universal_router_decoder.__all__)
+    for name in uniswap_universal_router_decoder.__all__:
+        assert getattr(uniswap_universal_router_decoder, name) is not None
+    with pytest.raises(AttributeError):
+        uniswap_universal_router_decoder.NotExported  # type: ignore[attr-defined]
+
+
+def test_checksum_address_constants():
+    for address in (permit2_address, ur_address, RouterConstant.MSG_SENDER.value, RouterConstant.ADDRESS_THIS.value):
+        assert Web3.to_checksum_address(address) == address
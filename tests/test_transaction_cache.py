@@ -0,0 +1,144 @@
+from hexbytes import HexBytes
+import pytest
+
+from tests.resources.rpc_server import (
+    build_transaction,
+    serve_in_thread,
+    StandInRPCServer,
+    test_transactions,
+)
+from tests.resources.transactions import transactions
+from uniswap_universal_router_decoder import (
+    AsyncRouterCodec,
+    RouterCodec,
+    SQLiteTransactionCache,
+    TransactionCacheMode,
+)
+
+
+trx_hashes = [trx["trx_hash"] for trx in transactions]
+
+
+def test_sqlite_transaction_cache(tmp_path):
+    trx = {"hash": HexBytes("0x" + "11" * 32), "blockNumber": 20_000_000, "input": HexBytes("0x3593564c")}
+    with SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+        assert cache.get(trx["hash"]) is None
+        cache.put(trx["hash"], trx)
+        cache.put(trx["hash"], trx)
+        assert cache.get(trx["hash"]) == trx
+        assert (len(cache), cache.hits, cache.misses) == (1, 1, 1)
+
+    with SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+        assert cache.get(trx["hash"]) == trx
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+        assert cache.get(trx["hash"]) is None
+
+
+@pytest.mark.parametrize(
+    "mode, expected_requests",
+    (
+        (TransactionCacheMode.READ_THROUGH, len(transactions) + 1),  # + 1 for the finalized block
+        (TransactionCacheMode.WRITE_THROUGH, 2 * len(transactions) + 1),
+    )
+)
+def test_decode_transaction_with_cache(mode, expected_requests, tmp_path):
+    server = StandInRPCServer()
+    with serve_in_thread(server) as url, SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+        codec_rpc = RouterCodec(rpc_endpoint=url, transaction_cache=cache, transaction_cache_mode=mode)
+        decoded_trxs = [codec_rpc.decode.transaction(trx_hash) for trx_hash in trx_hashes]
+        assert [codec_rpc.decode.transaction(trx_hash) for trx_hash in trx_hashes] == decoded_trxs
+        assert server.requests == expected_requests
+        assert len(cache) == len(transactions)
+
+        # the cache is persistent and shared: another codec does not send any request in read-through mode
+        codec_cached = RouterCodec(rpc_endpoint=url, transaction_cache=cache)
+        cached_trxs = [codec_cached.decode.transaction(HexBytes(trx_hash)) for trx_hash in trx_hashes]
+        assert repr(cached_trxs) == repr(decoded_trxs)
+        assert server.requests == expected_requests
+
+
+def test_pending_transaction_not_cached(tmp_path):
+    pending_trx = build_transaction("0x" + "55" * 32, transactions[0]["input"])
+    pending_trx.update({"blockHash": None, "blockNumber": None, "transactionIndex": None})
+    server = StandInRPCServer([pending_trx])
+    server.trxs[pending_trx["hash"]] = pending_trx  # not the copy in the served block
+    with serve_in_thread(server) as url, SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+        codec_rpc = RouterCodec(rpc_endpoint=url, transaction_cache=cache)
+        codec_rpc.decode.transaction(pending_trx["hash"])
+        codec_rpc.decode.transaction(pending_trx["hash"])
+        assert server.requests == 2
+        assert len(cache) == 0
+
+
+def test_recent_transaction_not_cached(mocker, tmp_path):
+    monotonic = mocker.patch("uniswap_universal_router_decoder._decoder.time.monotonic", return_value=100.0)
+    recent_trx = build_transaction("0x" + "66" * 32, transactions[0]["input"])
+    recent_trx["blockNumber"] = hex(20_000_100)
+    server = StandInRPCServer([recent_trx], finalized_block_number=20_000_099)
+    server.trxs[recent_trx["hash"]] = recent_trx  # not the copy in the served block
+    with serve_in_thread(server) as url, SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+        codec_rpc = RouterCodec(rpc_endpoint=url, transaction_cache=cache)
+        codec_rpc.decode.transaction(recent_trx["hash"])
+        assert server.requests == 2  # the transaction and the finalized block
+        assert len(cache) == 0
+
+        # the finalized block is refreshed at most once per slot
+        server.finalized_block_number = 20_000_100
+        monotonic.return_value = 111.0
+        codec_rpc.decode.transaction(recent_trx["hash"])
+        assert server.requests == 3
+        assert len(cache) == 0
+
+        monotonic.return_value = 112.0
+        codec_rpc.decode.transaction(recent_trx["hash"])
+        assert server.requests == 5
+        assert len(cache) == 1
+        codec_rpc.decode.transaction(recent_trx["hash"])
+        assert server.requests == 5
+
+
+def test_finalized_tag_not_supported(tmp_path):
+    server = StandInRPCServer(finalized_block_number=None)
+    with serve_in_thread(server) as url, SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+        codec_rpc = RouterCodec(rpc_endpoint=url, transaction_cache=cache)
+        # the transactions are decoded, but not cached
+        assert codec_rpc.decode.transaction(trx_hashes[0])["decoded_input"][0].fn_name == "execute"
+        assert server.requests == 2
+        assert len(cache) == 0
+
+
+async def test_concurrent_fetches_refresh_finalized_block_once(tmp_path):
+    recent_trxs = [build_transaction("0x" + f"{i:02x}" * 32, transactions[0]["input"], i) for i in range(8)]
+    server = StandInRPCServer(recent_trxs, latency=0.01, finalized_block_number=19_999_999)
+    await server.start()
+    try:
+        with SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+            codec_w3 = AsyncRouterCodec(rpc_endpoint=server.url, transaction_cache=cache)
+            await codec_w3.decode.transactions([trx["hash"] for trx in recent_trxs])
+            assert server.requests == len(recent_trxs) + 1  # + 1 for the finalized block
+            assert len(cache) == 0
+            await codec_w3._w3.provider.disconnect()
+    finally:
+        await server.stop()
+
+
+@pytest.mark.parametrize("batch_size, expected_requests", ((None, 2), (100, 1)))
+async def test_decode_transactions_with_cache(batch_size, expected_requests, tmp_path):
+    server = StandInRPCServer(test_transactions.values())
+    await server.start()
+    try:
+        with SQLiteTransactionCache(tmp_path / "trxs.db") as cache:
+            codec_w3 = AsyncRouterCodec(rpc_endpoint=server.url, transaction_cache=cache)
+            expected_trxs = [await codec_w3.decode.transaction(trx_hash) for trx_hash in trx_hashes[:-2]]
+            assert server.requests == len(transactions) - 2 + 1  # + 1 for the finalized block
+
+            decoded_trxs = await codec_w3.decode.transactions(trx_hashes, batch_size=batch_size)
+            assert server.requests == len(transactions) - 1 + expected_requests
+            assert decoded_trxs[:-2] == expected_trxs
+            assert [decoded_trx["hash"] for decoded_trx in decoded_trxs] == [HexBytes(h) for h in trx_hashes]
+            assert await codec_w3.decode.transactions(trx_hashes, batch_size=batch_size) == decoded_trxs
+            assert server.requests == len(transactions) - 1 + expected_requests
+            await codec_w3._w3.provider.disconnect()
+    finally:
+        await server.stop()
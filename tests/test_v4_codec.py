@@ -599,3 +599,39 @@ def test_v4_take_portion(currency_input, recipient_input, bips_input, expected_r
     assert result[1]['inputs'][0][1]['params'][0][1]['currency'] == currency_input
     assert result[1]['inputs'][0][1]['params'][0][1]['recipient'] == recipient_input
     assert result[1]['inputs'][0][1]['params'][0][1]['bips'] == bips_input
+
+
+@pytest.mark.parametrize("hops", (1, 2, 3, 4))
+def test_v4_multi_hop_swaps(hops):
+    currencies = [Web3.to_checksum_address(f"0x{i:040x}") for i in range(1, hops + 2)]
+    path_keys = [
+        codec.encode.v4_path_key(currency, 500 * i, 10 * i, currencies[0], bytes(i))
+        for i, currency in enumerate(currencies[1:], start=1)
+    ]
+    min_hop_prices = list(range(1, hops + 1))
+    encoded_input = (
+        codec
+        .encode
+        .chain()
+        .v4_swap()
+        .swap_exact_in(currencies[0], path_keys, 10**18, 10**6, min_hop_prices)
+        .swap_exact_out(currencies[-1], path_keys, 10**6, 10**18)
+        .build_v4_swap()
+        .build(deadline=1732612928)
+    )
+    params = codec.decode.function_input(input_data=encoded_input)[1]['inputs'][0][1]['params']
+    expected_path_keys = [to_camel_case(dict(path_key)) for path_key in path_keys]
+    assert params[0][1]['params'] == {
+        'currencyIn': currencies[0],
+        'PathKeys': expected_path_keys,
+        'minHopPriceX36': min_hop_prices,
+        'amountIn': 10**18,
+        'amountOutMinimum': 10**6,
+    }
+    assert params[1][1]['params'] == {
+        'currencyOut': currencies[-1],
+        'PathKeys': expected_path_keys,
+        'minHopPriceX36': [],
+        'amountOut': 10**6,
+        'amountInMaximum': 10**18,
+    }
@@ -1,30 +1,155 @@
-from uniswap_universal_router_decoder._constants import (
-    MAX_TICK,
-    MAX_TICK_SPACING,
-    MIN_TICK,
-    MIN_TICK_SPACING,
-)
-from uniswap_universal_router_decoder._encoder import (
-    AllowanceTransferDetails,
-    PathKey,
-    PoolKey,
-)
-from uniswap_universal_router_decoder._enums import (
-    FunctionRecipient,
-    TransactionSpeed,
-    V4Constants,
-)
-from uniswap_universal_router_decoder.router_codec import (
-    AsyncRouterCodec,
-    PermitDetails,
-    RouterCodec,
+"""
+Uniswap Universal Router Codec
+
+The public names are imported from their submodule on first access, so that importing the package, its enums or
+its utils does not import web3 nor the encoding/decoding machinery until a codec is needed.
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from importlib import import_module
+from typing import (
+    Any,
+    TYPE_CHECKING,
 )
 
 
+if TYPE_CHECKING:
+    from uniswap_universal_router_decoder._cache import DecodeCache
+    from uniswap_universal_router_decoder._checkpoint import (
+        Checkpoint,
+        FileCheckpoint,
+        SQLiteCheckpoint,
+    )
+    from uniswap_universal_router_decoder._checksum import (
+        checksum_cache,
+        ChecksumCache,
+    )
+    from uniswap_universal_router_decoder._columns import CommandColumns
+    from uniswap_universal_router_decoder._compact import (
+        CompactAction,
+        CompactCommand,
+        CompactResult,
+    )
+    from uniswap_universal_router_decoder._constants import (
+        MAX_TICK,
+        MAX_TICK_SPACING,
+        MIN_TICK,
+        MIN_TICK_SPACING,
+    )
+    from uniswap_universal_router_decoder._corpus import (
+        CalldataCorpus,
+        write_calldata_corpus,
+    )
+    from uniswap_universal_router_decoder._decoder import (
+        CommandInfo,
+        CommandSummary,
+        LazyCommandInputs,
+    )
+    from uniswap_universal_router_decoder._encoder import (
+        AllowanceTransferDetails,
+        PathKey,
+        PoolKey,
+    )
+    from uniswap_universal_router_decoder._enums import (
+        DecodingEngine,
+        FunctionRecipient,
+        RouterFunction,
+        StreamFormat,
+        SwapProtocol,
+        TransactionCacheMode,
+        TransactionSpeed,
+        V4Actions,
+        V4Constants,
+    )
+    from uniswap_universal_router_decoder._stream import StreamStats
+    from uniswap_universal_router_decoder._swaps import SwapLeg
+    from uniswap_universal_router_decoder._transaction_cache import (
+        SQLiteTransactionCache,
+        TransactionCache,
+    )
+    from uniswap_universal_router_decoder.router_codec import (
+        AsyncRouterCodec,
+        PermitDetails,
+        RouterCodec,
+    )
+
+
+_lazy_exports = {
+    "AllowanceTransferDetails": "_encoder",
+    "AsyncRouterCodec": "router_codec",
+    "CalldataCorpus": "_corpus",
+    "Checkpoint": "_checkpoint",
+    "checksum_cache": "_checksum",
+    "ChecksumCache": "_checksum",
+    "CommandColumns": "_columns",
+    "CommandInfo": "_decoder",
+    "CommandSummary": "_decoder",
+    "CompactAction": "_compact",
+    "CompactCommand": "_compact",
+    "CompactResult": "_compact",
+    "DecodeCache": "_cache",
+    "DecodingEngine": "_enums",
+    "FileCheckpoint": "_checkpoint",
+    "FunctionRecipient": "_enums",
+    "LazyCommandInputs": "_decoder",
+    "MAX_TICK": "_constants",
+    "MAX_TICK_SPACING": "_constants",
+    "MIN_TICK": "_constants",
+    "MIN_TICK_SPACING": "_constants",
+    "PathKey": "_encoder",
+    "PermitDetails": "router_codec",
+    "PoolKey": "_encoder",
+    "RouterCodec": "router_codec",
+    "RouterFunction": "_enums",
+    "SQLiteCheckpoint": "_checkpoint",
+    "SQLiteTransactionCache": "_transaction_cache",
+    "StreamFormat": "_enums",
+    "StreamStats": "_stream",
+    "SwapLeg": "_swaps",
+    "SwapProtocol": "_enums",
+    "TransactionCache": "_transaction_cache",
+    "TransactionCacheMode": "_enums",
+    "TransactionSpeed": "_enums",
+    "V4Actions": "_enums",
+    "V4Constants": "_enums",
+    "write_calldata_corpus": "_corpus",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _lazy_exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # next accesses do not go through __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "AllowanceTransferDetails",
     "AsyncRouterCodec",
+    "CalldataCorpus",
+    "Checkpoint",
+    "checksum_cache",
+    "ChecksumCache",
+    "CommandColumns",
+    "CommandInfo",
+    "CommandSummary",
+    "CompactAction",
+    "CompactCommand",
+    "CompactResult",
+    "DecodeCache",
+    "DecodingEngine",
+    "FileCheckpoint",
     "FunctionRecipient",
+    "LazyCommandInputs",
     "MAX_TICK",
     "MAX_TICK_SPACING",
     "MIN_TICK",
@@ -33,6 +158,17 @@ __all__ = [
     "PermitDetails",
     "PoolKey",
     "RouterCodec",
+    "RouterFunction",
+    "SQLiteCheckpoint",
+    "SQLiteTransactionCache",
+    "StreamFormat",
+    "StreamStats",
+    "SwapLeg",
+    "SwapProtocol",
+    "TransactionCache",
+    "TransactionCacheMode",
     "TransactionSpeed",
+    "V4Actions",
     "V4Constants",
+    "write_calldata_corpus",
 ]
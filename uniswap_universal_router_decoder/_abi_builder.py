@@ -12,8 +12,8 @@ from collections.abc import (
     Sequence,
 )
 from dataclasses import dataclass
-from functools import wraps
-from io import BytesIO
+from pathlib import Path
+from pprint import pformat
 from typing import (
     Any,
     cast,
@@ -23,8 +23,16 @@ from typing import (
     Union,
 )
 
-from eth_abi import encode
-from eth_abi.registry import registry
+from eth_abi.abi import default_codec
+from eth_abi.codec import ABICodec
+from eth_abi.decoding import (
+    ContextFramesBytesIO,
+    TupleDecoder,
+)
+from eth_abi.registry import (
+    ABIRegistry,
+    registry,
+)
 from eth_utils import keccak
 from typing_extensions import Self
 from web3 import (
@@ -33,6 +41,8 @@ from web3 import (
     Web3,
 )
 
+from uniswap_universal_router_decoder._abi_table import abi_table
+from uniswap_universal_router_decoder._checksum import to_checksum_address
 from uniswap_universal_router_decoder._enums import (
     MiscFunctions,
     RouterFunction,
@@ -111,6 +121,24 @@ class ABIFunction:
     def __repr__(self) -> str:
         return f"ABIFunction(name='{self.name}', params={self.params})"
 
+    @classmethod
+    def from_table(
+            cls,
+            signature: str,
+            selector: bytes,
+            type_list: Sequence[str],
+            abi_dict: ABIFunctionDict) -> ABIFunction:
+        """
+        :return: the function ABI from its precomputed abi_table entry, without hashing its signature
+        """
+        abi = cls(abi_dict["name"])
+        abi.params = [_param_from_dict(param_dict) for param_dict in abi_dict["inputs"]]
+        abi.full_abi = [abi_dict]
+        abi.type_list = list(type_list)
+        abi.signature = signature
+        abi.selector = selector
+        return abi
+
     def finalize(self) -> None:
         self.full_abi = [self.get_abi_as_dict()]
         self.type_list = [param.get_types_as_str() for param in self.params]
@@ -127,8 +155,16 @@ class ABIFunction:
     def get_types_as_list(self) -> list[str]:
         return [param.get_types_as_str() for param in self.params]
 
-    def encode(self, args: Sequence[Any]) -> bytes:
-        return encode(self.get_types_as_list(), args)
+    def encode(self, args: Sequence[Any], abi_codec: ABICodec = default_codec) -> bytes:
+        return abi_codec.encode(self.get_types_as_list(), args)
+
+
+def _param_from_dict(param_dict: Union[ABIParamDict, ABIStructDict]) -> Union[ABIParam, ABIStruct]:
+    if "components" in param_dict:
+        struct = ABIStruct(param_dict["name"], cast(Literal["tuple", "tuple[]"], param_dict["type"]))
+        struct.params = [_param_from_dict(component) for component in param_dict["components"]]
+        return struct
+    return ABIParam(param_dict["name"], param_dict["type"])
 
 
 def _get_types_from_list(type_list: list[Union[ABIParamDict, ABIStructDict]]) -> list[str]:
@@ -251,56 +287,180 @@ class ABIStructBuilder(CommonABIBuilder):
         return self.abi
 
 
+def load_abi_map() -> ABIMap:
+    """
+    :return: the ABI map loaded from the precomputed abi_table
+    """
+    return {
+        enum_key: ABIFunction.from_table(signature, selector, type_list, cast(ABIFunctionDict, abi_dict))
+        for enum_key, (signature, selector, type_list, abi_dict) in abi_table.items()
+    }
+
+
 class ABIRegister:
-    abi_map: ABIMap = {}
+    """
+    Register the builders of the UR function ABIs. They are not run at import: the ABI map is loaded from abi_table,
+    which is generated from them with write_abi_table().
+    """
+    builders: dict[Union[MiscFunctions, RouterFunction, V4Actions], Callable[[], ABIFunction]] = {}
+    abi_map: ABIMap = load_abi_map()
 
     def __init__(self, enum_key: Union[MiscFunctions, RouterFunction, V4Actions]) -> None:
         self.enum_key = enum_key
 
-    def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
-        ABIRegister.abi_map[self.enum_key] = func()
-
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return func(*args, **kwargs)  # for some reason, coverage reports this line as missed  # pragma: no cover
-        return wrapper
+    def __call__(self, func: Callable[[], ABIFunction]) -> Callable[[], ABIFunction]:
+        ABIRegister.builders[self.enum_key] = func
+        return func
+
+
+def build_abi_map() -> ABIMap:
+    """
+    :return: the ABI map built by running all the registered builders
+    """
+    return {enum_key: builder() for enum_key, builder in ABIRegister.builders.items()}
+
+
+def generate_abi_table() -> str:
+    """
+    :return: the source code of the _abi_table module, from the registered builders
+    """
+    lines = [
+        '"""',
+        "Precomputed UR function ABIs, loaded at import instead of running the ABI builders",
+        "",
+        "Generated from the ABI builders by _abi_builder.write_abi_table() - Do not edit.",
+        "",
+        "* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).",
+        "* License: MIT.",
+        "* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder",
+        '"""',
+        "from typing import (",
+        "    Any,",
+        "    Union,",
+        ")",
+        "",
+        "from uniswap_universal_router_decoder._enums import (",
+        "    MiscFunctions,",
+        "    RouterFunction,",
+        "    V4Actions,",
+        ")",
+        "",
+        "",
+        "# function -> (signature, selector, type list, full ABI)",
+        "abi_table: dict[Union[MiscFunctions, RouterFunction, V4Actions], tuple[str, bytes, tuple[str, ...], Any]] = {",
+    ]
+    for enum_key, abi in build_abi_map().items():
+        lines.append(f"    {type(enum_key).__name__}.{enum_key.name}: (")
+        lines.append(f'        "{abi.signature}",')
+        lines.append(f'        bytes.fromhex("{abi.selector.hex()}"),')
+        lines.extend(f"        {line}" for line in pformat(tuple(abi.type_list), width=108).splitlines())
+        lines[-1] += ","
+        lines.extend(f"        {line}" for line in pformat(abi.full_abi[0], width=108, sort_dicts=False).splitlines())
+        lines[-1] += ","
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_abi_table() -> None:
+    """
+    Regenerate the _abi_table module after a change to the builders
+    """
+    Path(__file__).with_name("_abi_table.py").write_text(generate_abi_table())
+
+
+def _to_web3_values(param: Union[ABIParam, ABIStruct]) -> Callable[[Any], Any]:
+    """
+    :return: a function converting the values decoded by eth_abi to the web3 output: structs as dicts,
+        arrays as lists and checksum addresses
+    """
+    if isinstance(param, ABIStruct):
+        names = [sub_param.name for sub_param in param.params]
+        converters = [_to_web3_values(sub_param) for sub_param in param.params]
+
+        def to_dict(values: Sequence[Any]) -> dict[str, Any]:
+            return {name: converter(value) for name, converter, value in zip(names, converters, values)}
+
+        if param.type == "tuple[]":
+            return lambda values: [to_dict(value) for value in values]
+        return to_dict
+    if param.type == "address":
+        return to_checksum_address
+    if param.type == "address[]":
+        return lambda values: [to_checksum_address(value) for value in values]
+    if param.type.endswith("]"):
+        return list
+    return lambda value: value
+
+
+class _V4ParamsDecoder:
+    """
+    Decode the custom v4 params types in place from the stream, as the struct made of the strict v4 function params,
+    with the cached type list of the function. Same output as decode_function_input() on the strict function.
+    """
+    # the params are encoded as an offset in the head, so eth_abi reads and checks it, and calls the decoder on the tail
+    is_dynamic = True
+
+    def __init__(self, fct_abi: ABIFunction, abi_registry: ABIRegistry) -> None:
+        self._names = [param.name for param in fct_abi.params]
+        self._converters = [_to_web3_values(param) for param in fct_abi.params]
+        self._decoder = TupleDecoder(decoders=[abi_registry.get_decoder(type_str) for type_str in fct_abi.type_list])
+
+    def __call__(self, stream: ContextFramesBytesIO) -> dict[str, Any]:
+        values = self._decoder(stream)
+        return {name: converter(value) for name, converter, value in zip(self._names, self._converters, values)}
 
 
 class ABIMapWrapper:
+    """
+    The UR function ABIs, with the eth_abi registry and codec to encode and decode them.
+    The registry is a copy of the eth_abi one, with the custom v4 params types registered on it, so each codec has its
+    own encoders and decoders, resolved and cached once, and the global eth_abi registry is never modified.
+    """
     def __init__(self, w3: Optional[Union[AsyncWeb3[AsyncHTTPProvider], Web3]] = None) -> None:
         self.w3 = w3 if w3 else Web3()
         self.abi_map = ABIRegister.abi_map
-        if not registry.has_encoder("ExactInputParams"):
-            registry.register("ExactInputParams", self.encode_v4_exact_input_params, self.decode_v4_exact_input_params)
-        if not registry.has_encoder("ExactOutputParams"):
-            registry.register(
-                "ExactOutputParams",
-                self.encode_v4_exact_output_params,
-                self.decode_v4_exact_output_params,
-            )
-
-    def decode_v4_exact_input_params(self, stream: BytesIO) -> dict[str, Any]:
-        fct_abi = self.abi_map[MiscFunctions.STRICT_V4_SWAP_EXACT_IN]
-        raw_data = stream.read()
-        sub_contract = self.w3.eth.contract(abi=fct_abi.full_abi)
-        _, decoded_params = sub_contract.decode_function_input(fct_abi.selector + raw_data[32:])
-        return decoded_params
+        self.abi_registry = registry.copy()
+        self._exact_input_params_decoder = _V4ParamsDecoder(
+            self.abi_map[MiscFunctions.STRICT_V4_SWAP_EXACT_IN],
+            self.abi_registry,
+        )
+        self._exact_output_params_decoder = _V4ParamsDecoder(
+            self.abi_map[MiscFunctions.STRICT_V4_SWAP_EXACT_OUT],
+            self.abi_registry,
+        )
+        self.abi_registry.register(
+            "ExactInputParams",
+            self.encode_v4_exact_input_params,
+            self._exact_input_params_decoder,
+        )
+        self.abi_registry.register(
+            "ExactOutputParams",
+            self.encode_v4_exact_output_params,
+            self._exact_output_params_decoder,
+        )
+        self.abi_codec = ABICodec(self.abi_registry)
+
+    def decode_v4_exact_input_params(self, stream: ContextFramesBytesIO) -> dict[str, Any]:
+        """
+        :param stream: the stream positioned at the start of the params struct, ie after following the head offset
+        """
+        return self._exact_input_params_decoder(stream)
 
     def encode_v4_exact_input_params(self, args: Sequence[Any]) -> bytes:
         fct_abi = self.abi_map[MiscFunctions.STRICT_V4_SWAP_EXACT_IN]
-        encoded_data = 0x20.to_bytes(32, "big") + encode(fct_abi.type_list, args)
+        encoded_data = 0x20.to_bytes(32, "big") + self.abi_codec.encode(fct_abi.type_list, args)
         return encoded_data
 
-    def decode_v4_exact_output_params(self, stream: BytesIO) -> dict[str, Any]:
-        fct_abi = self.abi_map[MiscFunctions.STRICT_V4_SWAP_EXACT_OUT]
-        raw_data = stream.read()
-        sub_contract = self.w3.eth.contract(abi=fct_abi.full_abi)
-        _, decoded_params = sub_contract.decode_function_input(fct_abi.selector + raw_data[32:])
-        return decoded_params
+    def decode_v4_exact_output_params(self, stream: ContextFramesBytesIO) -> dict[str, Any]:
+        """
+        :param stream: the stream positioned at the start of the params struct, ie after following the head offset
+        """
+        return self._exact_output_params_decoder(stream)
 
     def encode_v4_exact_output_params(self, args: Sequence[Any]) -> bytes:
         fct_abi = self.abi_map[MiscFunctions.STRICT_V4_SWAP_EXACT_OUT]
-        encoded_data = 0x20.to_bytes(32, "big") + encode(fct_abi.type_list, args)
+        encoded_data = 0x20.to_bytes(32, "big") + self.abi_codec.encode(fct_abi.type_list, args)
         return encoded_data
 
 
@@ -0,0 +1,488 @@
+"""
+Precomputed UR function ABIs, loaded at import instead of running the ABI builders
+
+Generated from the ABI builders by _abi_builder.write_abi_table() - Do not edit.
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from typing import (
+    Any,
+    Union,
+)
+
+from uniswap_universal_router_decoder._enums import (
+    MiscFunctions,
+    RouterFunction,
+    V4Actions,
+)
+
+
+# function -> (signature, selector, type list, full ABI)
+abi_table: dict[Union[MiscFunctions, RouterFunction, V4Actions], tuple[str, bytes, tuple[str, ...], Any]] = {
+    RouterFunction.V2_SWAP_EXACT_IN: (
+        "V2_SWAP_EXACT_IN(address,uint256,uint256,address[],bool,uint256[])",
+        bytes.fromhex("741e1a9f"),
+        ('address', 'uint256', 'uint256', 'address[]', 'bool', 'uint256[]'),
+        {'inputs': [{'name': 'recipient', 'type': 'address'},
+                    {'name': 'amountIn', 'type': 'uint256'},
+                    {'name': 'amountOutMin', 'type': 'uint256'},
+                    {'name': 'path', 'type': 'address[]'},
+                    {'name': 'payerIsSender', 'type': 'bool'},
+                    {'name': 'minHopPriceX36', 'type': 'uint256[]'}],
+         'name': 'V2_SWAP_EXACT_IN',
+         'type': 'function'},
+    ),
+    RouterFunction.PERMIT2_PERMIT: (
+        "PERMIT2_PERMIT(((address,uint160,uint48,uint48),address,uint256),bytes)",
+        bytes.fromhex("3923f704"),
+        ('((address,uint160,uint48,uint48),address,uint256)', 'bytes'),
+        {'inputs': [{'components': [{'components': [{'name': 'token', 'type': 'address'},
+                                                    {'name': 'amount', 'type': 'uint160'},
+                                                    {'name': 'expiration', 'type': 'uint48'},
+                                                    {'name': 'nonce', 'type': 'uint48'}],
+                                     'name': 'details',
+                                     'type': 'tuple'},
+                                    {'name': 'spender', 'type': 'address'},
+                                    {'name': 'sigDeadline', 'type': 'uint256'}],
+                     'name': 'struct',
+                     'type': 'tuple'},
+                    {'name': 'data', 'type': 'bytes'}],
+         'name': 'PERMIT2_PERMIT',
+         'type': 'function'},
+    ),
+    RouterFunction.PERMIT2_PERMIT_BATCH: (
+        "PERMIT2_PERMIT_BATCH(((address,uint160,uint48,uint48)[],address,uint256),bytes)",
+        bytes.fromhex("deac4a12"),
+        ('((address,uint160,uint48,uint48)[],address,uint256)', 'bytes'),
+        {'inputs': [{'components': [{'components': [{'name': 'token', 'type': 'address'},
+                                                    {'name': 'amount', 'type': 'uint160'},
+                                                    {'name': 'expiration', 'type': 'uint48'},
+                                                    {'name': 'nonce', 'type': 'uint48'}],
+                                     'name': 'details',
+                                     'type': 'tuple[]'},
+                                    {'name': 'spender', 'type': 'address'},
+                                    {'name': 'sigDeadline', 'type': 'uint256'}],
+                     'name': 'struct',
+                     'type': 'tuple'},
+                    {'name': 'data', 'type': 'bytes'}],
+         'name': 'PERMIT2_PERMIT_BATCH',
+         'type': 'function'},
+    ),
+    RouterFunction.UNWRAP_WETH: (
+        "UNWRAP_WETH(address,uint256)",
+        bytes.fromhex("fddbb42e"),
+        ('address', 'uint256'),
+        {'inputs': [{'name': 'recipient', 'type': 'address'}, {'name': 'amountMin', 'type': 'uint256'}],
+         'name': 'UNWRAP_WETH',
+         'type': 'function'},
+    ),
+    RouterFunction.V3_SWAP_EXACT_IN: (
+        "V3_SWAP_EXACT_IN(address,uint256,uint256,bytes,bool,uint256[])",
+        bytes.fromhex("822417f9"),
+        ('address', 'uint256', 'uint256', 'bytes', 'bool', 'uint256[]'),
+        {'inputs': [{'name': 'recipient', 'type': 'address'},
+                    {'name': 'amountIn', 'type': 'uint256'},
+                    {'name': 'amountOutMin', 'type': 'uint256'},
+                    {'name': 'path', 'type': 'bytes'},
+                    {'name': 'payerIsSender', 'type': 'bool'},
+                    {'name': 'minHopPriceX36', 'type': 'uint256[]'}],
+         'name': 'V3_SWAP_EXACT_IN',
+         'type': 'function'},
+    ),
+    RouterFunction.WRAP_ETH: (
+        "WRAP_ETH(address,uint256)",
+        bytes.fromhex("1d3c2c4b"),
+        ('address', 'uint256'),
+        {'inputs': [{'name': 'recipient', 'type': 'address'}, {'name': 'amountMin', 'type': 'uint256'}],
+         'name': 'WRAP_ETH',
+         'type': 'function'},
+    ),
+    RouterFunction.V2_SWAP_EXACT_OUT: (
+        "V2_SWAP_EXACT_OUT(address,uint256,uint256,address[],bool,uint256[])",
+        bytes.fromhex("63cbbd62"),
+        ('address', 'uint256', 'uint256', 'address[]', 'bool', 'uint256[]'),
+        {'inputs': [{'name': 'recipient', 'type': 'address'},
+                    {'name': 'amountOut', 'type': 'uint256'},
+                    {'name': 'amountInMax', 'type': 'uint256'},
+                    {'name': 'path', 'type': 'address[]'},
+                    {'name': 'payerIsSender', 'type': 'bool'},
+                    {'name': 'minHopPriceX36', 'type': 'uint256[]'}],
+         'name': 'V2_SWAP_EXACT_OUT',
+         'type': 'function'},
+    ),
+    RouterFunction.V3_SWAP_EXACT_OUT: (
+        "V3_SWAP_EXACT_OUT(address,uint256,uint256,bytes,bool,uint256[])",
+        bytes.fromhex("4b1c7011"),
+        ('address', 'uint256', 'uint256', 'bytes', 'bool', 'uint256[]'),
+        {'inputs': [{'name': 'recipient', 'type': 'address'},
+                    {'name': 'amountOut', 'type': 'uint256'},
+                    {'name': 'amountInMax', 'type': 'uint256'},
+                    {'name': 'path', 'type': 'bytes'},
+                    {'name': 'payerIsSender', 'type': 'bool'},
+                    {'name': 'minHopPriceX36', 'type': 'uint256[]'}],
+         'name': 'V3_SWAP_EXACT_OUT',
+         'type': 'function'},
+    ),
+    RouterFunction.SWEEP: (
+        "SWEEP(address,address,uint256)",
+        bytes.fromhex("075da630"),
+        ('address', 'address', 'uint256'),
+        {'inputs': [{'name': 'token', 'type': 'address'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'amountMin', 'type': 'uint256'}],
+         'name': 'SWEEP',
+         'type': 'function'},
+    ),
+    RouterFunction.PAY_PORTION: (
+        "PAY_PORTION(address,address,uint256)",
+        bytes.fromhex("69ef8b2e"),
+        ('address', 'address', 'uint256'),
+        {'inputs': [{'name': 'token', 'type': 'address'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'bips', 'type': 'uint256'}],
+         'name': 'PAY_PORTION',
+         'type': 'function'},
+    ),
+    RouterFunction.TRANSFER: (
+        "TRANSFER(address,address,uint256)",
+        bytes.fromhex("c951f2d1"),
+        ('address', 'address', 'uint256'),
+        {'inputs': [{'name': 'token', 'type': 'address'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'value', 'type': 'uint256'}],
+         'name': 'TRANSFER',
+         'type': 'function'},
+    ),
+    RouterFunction.V4_SWAP: (
+        "V4_SWAP(bytes,bytes[])",
+        bytes.fromhex("99685b2e"),
+        ('bytes', 'bytes[]'),
+        {'inputs': [{'name': 'actions', 'type': 'bytes'}, {'name': 'params', 'type': 'bytes[]'}],
+         'name': 'V4_SWAP',
+         'type': 'function'},
+    ),
+    V4Actions.SWAP_EXACT_IN_SINGLE: (
+        "SWAP_EXACT_IN_SINGLE(((address,address,uint24,int24,address),bool,uint128,uint128,uint256,bytes))",
+        bytes.fromhex("004a3798"),
+        ('((address,address,uint24,int24,address),bool,uint128,uint128,uint256,bytes)',),
+        {'inputs': [{'components': [{'components': [{'name': 'currency0', 'type': 'address'},
+                                                    {'name': 'currency1', 'type': 'address'},
+                                                    {'name': 'fee', 'type': 'uint24'},
+                                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                                    {'name': 'hooks', 'type': 'address'}],
+                                     'name': 'PoolKey',
+                                     'type': 'tuple'},
+                                    {'name': 'zeroForOne', 'type': 'bool'},
+                                    {'name': 'amountIn', 'type': 'uint128'},
+                                    {'name': 'amountOutMinimum', 'type': 'uint128'},
+                                    {'name': 'minHopPriceX36', 'type': 'uint256'},
+                                    {'name': 'hookData', 'type': 'bytes'}],
+                     'name': 'exact_in_single_params',
+                     'type': 'tuple'}],
+         'name': 'SWAP_EXACT_IN_SINGLE',
+         'type': 'function'},
+    ),
+    RouterFunction.V4_INITIALIZE_POOL: (
+        "V4_INITIALIZE_POOL((address,address,uint24,int24,address),uint256)",
+        bytes.fromhex("dbd4e4bd"),
+        ('(address,address,uint24,int24,address)', 'uint256'),
+        {'inputs': [{'components': [{'name': 'currency0', 'type': 'address'},
+                                    {'name': 'currency1', 'type': 'address'},
+                                    {'name': 'fee', 'type': 'uint24'},
+                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                    {'name': 'hooks', 'type': 'address'}],
+                     'name': 'PoolKey',
+                     'type': 'tuple'},
+                    {'name': 'sqrtPriceX96', 'type': 'uint256'}],
+         'name': 'V4_INITIALIZE_POOL',
+         'type': 'function'},
+    ),
+    RouterFunction.V4_POSITION_MANAGER_CALL: (
+        "modifyLiquidities(bytes,uint256)",
+        bytes.fromhex("dd46508f"),
+        ('bytes', 'uint256'),
+        {'inputs': [{'name': 'unlockData', 'type': 'bytes'}, {'name': 'deadline', 'type': 'uint256'}],
+         'name': 'modifyLiquidities',
+         'type': 'function'},
+    ),
+    MiscFunctions.UNLOCK_DATA: (
+        "unlockData(bytes,bytes[])",
+        bytes.fromhex("ad19ff10"),
+        ('bytes', 'bytes[]'),
+        {'inputs': [{'name': 'actions', 'type': 'bytes'}, {'name': 'params', 'type': 'bytes[]'}],
+         'name': 'unlockData',
+         'type': 'function'},
+    ),
+    V4Actions.MINT_POSITION: (
+        "MINT_POSITION((address,address,uint24,int24,address),int24,int24,uint256,uint128,uint128,address,bytes)",
+        bytes.fromhex("57935d24"),
+        ('(address,address,uint24,int24,address)',
+         'int24',
+         'int24',
+         'uint256',
+         'uint128',
+         'uint128',
+         'address',
+         'bytes'),
+        {'inputs': [{'components': [{'name': 'currency0', 'type': 'address'},
+                                    {'name': 'currency1', 'type': 'address'},
+                                    {'name': 'fee', 'type': 'uint24'},
+                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                    {'name': 'hooks', 'type': 'address'}],
+                     'name': 'PoolKey',
+                     'type': 'tuple'},
+                    {'name': 'tickLower', 'type': 'int24'},
+                    {'name': 'tickUpper', 'type': 'int24'},
+                    {'name': 'liquidity', 'type': 'uint256'},
+                    {'name': 'amount0Max', 'type': 'uint128'},
+                    {'name': 'amount1Max', 'type': 'uint128'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'hookData', 'type': 'bytes'}],
+         'name': 'MINT_POSITION',
+         'type': 'function'},
+    ),
+    V4Actions.SETTLE_PAIR: (
+        "SETTLE_PAIR(address,address)",
+        bytes.fromhex("4081b776"),
+        ('address', 'address'),
+        {'inputs': [{'name': 'currency0', 'type': 'address'}, {'name': 'currency1', 'type': 'address'}],
+         'name': 'SETTLE_PAIR',
+         'type': 'function'},
+    ),
+    V4Actions.SETTLE: (
+        "SETTLE(address,uint256,bool)",
+        bytes.fromhex("02313228"),
+        ('address', 'uint256', 'bool'),
+        {'inputs': [{'name': 'currency', 'type': 'address'},
+                    {'name': 'amount', 'type': 'uint256'},
+                    {'name': 'payerIsUser', 'type': 'bool'}],
+         'name': 'SETTLE',
+         'type': 'function'},
+    ),
+    V4Actions.CLOSE_CURRENCY: (
+        "CLOSE_CURRENCY(address)",
+        bytes.fromhex("63bc1f07"),
+        ('address',),
+        {'inputs': [{'name': 'currency', 'type': 'address'}], 'name': 'CLOSE_CURRENCY', 'type': 'function'},
+    ),
+    V4Actions.SWEEP: (
+        "SWEEP(address,address)",
+        bytes.fromhex("2b9b02b0"),
+        ('address', 'address'),
+        {'inputs': [{'name': 'currency', 'type': 'address'}, {'name': 'to', 'type': 'address'}],
+         'name': 'SWEEP',
+         'type': 'function'},
+    ),
+    RouterFunction.PERMIT2_TRANSFER_FROM: (
+        "PERMIT2_TRANSFER_FROM(address,address,uint256)",
+        bytes.fromhex("d63f2a62"),
+        ('address', 'address', 'uint256'),
+        {'inputs': [{'name': 'token', 'type': 'address'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'amount', 'type': 'uint256'}],
+         'name': 'PERMIT2_TRANSFER_FROM',
+         'type': 'function'},
+    ),
+    RouterFunction.PERMIT2_TRANSFER_FROM_BATCH: (
+        "PERMIT2_TRANSFER_FROM_BATCH((address,address,uint160,address)[])",
+        bytes.fromhex("bb9f58bf"),
+        ('(address,address,uint160,address)[]',),
+        {'inputs': [{'components': [{'name': 'from', 'type': 'address'},
+                                    {'name': 'to', 'type': 'address'},
+                                    {'name': 'amount', 'type': 'uint160'},
+                                    {'name': 'token', 'type': 'address'}],
+                     'name': 'AllowanceTransferDetails',
+                     'type': 'tuple[]'}],
+         'name': 'PERMIT2_TRANSFER_FROM_BATCH',
+         'type': 'function'},
+    ),
+    V4Actions.TAKE_ALL: (
+        "TAKE_ALL(address,uint256)",
+        bytes.fromhex("3c351884"),
+        ('address', 'uint256'),
+        {'inputs': [{'name': 'currency', 'type': 'address'}, {'name': 'minAmount', 'type': 'uint256'}],
+         'name': 'TAKE_ALL',
+         'type': 'function'},
+    ),
+    V4Actions.SETTLE_ALL: (
+        "SETTLE_ALL(address,uint256)",
+        bytes.fromhex("dde91f55"),
+        ('address', 'uint256'),
+        {'inputs': [{'name': 'currency', 'type': 'address'}, {'name': 'maxAmount', 'type': 'uint256'}],
+         'name': 'SETTLE_ALL',
+         'type': 'function'},
+    ),
+    MiscFunctions.EXECUTE: (
+        "execute(bytes,bytes[])",
+        bytes.fromhex("24856bc3"),
+        ('bytes', 'bytes[]'),
+        {'inputs': [{'name': 'commands', 'type': 'bytes'}, {'name': 'inputs', 'type': 'bytes[]'}],
+         'name': 'execute',
+         'type': 'function'},
+    ),
+    MiscFunctions.EXECUTE_WITH_DEADLINE: (
+        "execute(bytes,bytes[],uint256)",
+        bytes.fromhex("3593564c"),
+        ('bytes', 'bytes[]', 'uint256'),
+        {'inputs': [{'name': 'commands', 'type': 'bytes'},
+                    {'name': 'inputs', 'type': 'bytes[]'},
+                    {'name': 'deadline', 'type': 'uint256'}],
+         'name': 'execute',
+         'type': 'function'},
+    ),
+    MiscFunctions.V4_POOL_ID: (
+        "v4_pool_id((address,address,uint24,int24,address))",
+        bytes.fromhex("91b5e9b7"),
+        ('(address,address,uint24,int24,address)',),
+        {'inputs': [{'components': [{'name': 'currency0', 'type': 'address'},
+                                    {'name': 'currency1', 'type': 'address'},
+                                    {'name': 'fee', 'type': 'uint24'},
+                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                    {'name': 'hooks', 'type': 'address'}],
+                     'name': 'PoolKey',
+                     'type': 'tuple'}],
+         'name': 'v4_pool_id',
+         'type': 'function'},
+    ),
+    MiscFunctions.STRICT_V4_SWAP_EXACT_IN: (
+        "STRICT_V4_SWAP_EXACT_IN(address,(address,uint24,int24,address,bytes)[],uint256[],uint128,uint128)",
+        bytes.fromhex("9f8ebceb"),
+        ('address', '(address,uint24,int24,address,bytes)[]', 'uint256[]', 'uint128', 'uint128'),
+        {'inputs': [{'name': 'currencyIn', 'type': 'address'},
+                    {'components': [{'name': 'intermediateCurrency', 'type': 'address'},
+                                    {'name': 'fee', 'type': 'uint24'},
+                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                    {'name': 'hooks', 'type': 'address'},
+                                    {'name': 'hookData', 'type': 'bytes'}],
+                     'name': 'PathKeys',
+                     'type': 'tuple[]'},
+                    {'name': 'minHopPriceX36', 'type': 'uint256[]'},
+                    {'name': 'amountIn', 'type': 'uint128'},
+                    {'name': 'amountOutMinimum', 'type': 'uint128'}],
+         'name': 'STRICT_V4_SWAP_EXACT_IN',
+         'type': 'function'},
+    ),
+    V4Actions.MINT_POSITION_FROM_DELTAS: (
+        "MINT_POSITION_FROM_DELTAS((address,address,uint24,int24,address),int24,int24,uint128,uint128,address,bytes)",
+        bytes.fromhex("874947e8"),
+        ('(address,address,uint24,int24,address)', 'int24', 'int24', 'uint128', 'uint128', 'address', 'bytes'),
+        {'inputs': [{'components': [{'name': 'currency0', 'type': 'address'},
+                                    {'name': 'currency1', 'type': 'address'},
+                                    {'name': 'fee', 'type': 'uint24'},
+                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                    {'name': 'hooks', 'type': 'address'}],
+                     'name': 'PoolKey',
+                     'type': 'tuple'},
+                    {'name': 'tickLower', 'type': 'int24'},
+                    {'name': 'tickUpper', 'type': 'int24'},
+                    {'name': 'amount0Max', 'type': 'uint128'},
+                    {'name': 'amount1Max', 'type': 'uint128'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'hookData', 'type': 'bytes'}],
+         'name': 'MINT_POSITION_FROM_DELTAS',
+         'type': 'function'},
+    ),
+    V4Actions.WRAP: (
+        "WRAP(uint256)",
+        bytes.fromhex("863bb1cb"),
+        ('uint256',),
+        {'inputs': [{'name': 'amount', 'type': 'uint256'}], 'name': 'WRAP', 'type': 'function'},
+    ),
+    V4Actions.UNWRAP: (
+        "UNWRAP(uint256)",
+        bytes.fromhex("504de393"),
+        ('uint256',),
+        {'inputs': [{'name': 'amount', 'type': 'uint256'}], 'name': 'UNWRAP', 'type': 'function'},
+    ),
+    V4Actions.SWAP_EXACT_OUT_SINGLE: (
+        "SWAP_EXACT_OUT_SINGLE(((address,address,uint24,int24,address),bool,uint128,uint128,uint256,bytes))",
+        bytes.fromhex("9c76770b"),
+        ('((address,address,uint24,int24,address),bool,uint128,uint128,uint256,bytes)',),
+        {'inputs': [{'components': [{'components': [{'name': 'currency0', 'type': 'address'},
+                                                    {'name': 'currency1', 'type': 'address'},
+                                                    {'name': 'fee', 'type': 'uint24'},
+                                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                                    {'name': 'hooks', 'type': 'address'}],
+                                     'name': 'PoolKey',
+                                     'type': 'tuple'},
+                                    {'name': 'zeroForOne', 'type': 'bool'},
+                                    {'name': 'amountOut', 'type': 'uint128'},
+                                    {'name': 'amountInMaximum', 'type': 'uint128'},
+                                    {'name': 'minHopPriceX36', 'type': 'uint256'},
+                                    {'name': 'hookData', 'type': 'bytes'}],
+                     'name': 'exact_out_single_params',
+                     'type': 'tuple'}],
+         'name': 'SWAP_EXACT_OUT_SINGLE',
+         'type': 'function'},
+    ),
+    MiscFunctions.STRICT_V4_SWAP_EXACT_OUT: (
+        "STRICT_V4_SWAP_EXACT_OUT(address,(address,uint24,int24,address,bytes)[],uint256[],uint128,uint128)",
+        bytes.fromhex("54dda40b"),
+        ('address', '(address,uint24,int24,address,bytes)[]', 'uint256[]', 'uint128', 'uint128'),
+        {'inputs': [{'name': 'currencyOut', 'type': 'address'},
+                    {'components': [{'name': 'intermediateCurrency', 'type': 'address'},
+                                    {'name': 'fee', 'type': 'uint24'},
+                                    {'name': 'tickSpacing', 'type': 'int24'},
+                                    {'name': 'hooks', 'type': 'address'},
+                                    {'name': 'hookData', 'type': 'bytes'}],
+                     'name': 'PathKeys',
+                     'type': 'tuple[]'},
+                    {'name': 'minHopPriceX36', 'type': 'uint256[]'},
+                    {'name': 'amountOut', 'type': 'uint128'},
+                    {'name': 'amountInMaximum', 'type': 'uint128'}],
+         'name': 'STRICT_V4_SWAP_EXACT_OUT',
+         'type': 'function'},
+    ),
+    V4Actions.TAKE_PAIR: (
+        "TAKE_PAIR(address,address,address)",
+        bytes.fromhex("c88a490f"),
+        ('address', 'address', 'address'),
+        {'inputs': [{'name': 'currency0', 'type': 'address'},
+                    {'name': 'currency1', 'type': 'address'},
+                    {'name': 'recipient', 'type': 'address'}],
+         'name': 'TAKE_PAIR',
+         'type': 'function'},
+    ),
+    V4Actions.CLEAR_OR_TAKE: (
+        "CLEAR_OR_TAKE(address,uint256)",
+        bytes.fromhex("dc89dfb5"),
+        ('address', 'uint256'),
+        {'inputs': [{'name': 'currency', 'type': 'address'}, {'name': 'amountMax', 'type': 'uint256'}],
+         'name': 'CLEAR_OR_TAKE',
+         'type': 'function'},
+    ),
+    V4Actions.TAKE_PORTION: (
+        "TAKE_PORTION(address,address,uint256)",
+        bytes.fromhex("cbf814f9"),
+        ('address', 'address', 'uint256'),
+        {'inputs': [{'name': 'currency', 'type': 'address'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'bips', 'type': 'uint256'}],
+         'name': 'TAKE_PORTION',
+         'type': 'function'},
+    ),
+    V4Actions.TAKE: (
+        "TAKE(address,address,uint256)",
+        bytes.fromhex("1545b6b1"),
+        ('address', 'address', 'uint256'),
+        {'inputs': [{'name': 'currency', 'type': 'address'},
+                    {'name': 'recipient', 'type': 'address'},
+                    {'name': 'amount', 'type': 'uint256'}],
+         'name': 'TAKE',
+         'type': 'function'},
+    ),
+    V4Actions.SWAP_EXACT_IN: (
+        "SWAP_EXACT_IN(ExactInputParams)",
+        bytes.fromhex("683e7e31"),
+        ('ExactInputParams',),
+        {'inputs': [{'name': 'params', 'type': 'ExactInputParams'}], 'name': 'SWAP_EXACT_IN', 'type': 'function'},
+    ),
+    V4Actions.SWAP_EXACT_OUT: (
+        "SWAP_EXACT_OUT(ExactOutputParams)",
+        bytes.fromhex("20582a74"),
+        ('ExactOutputParams',),
+        {'inputs': [{'name': 'params', 'type': 'ExactOutputParams'}], 'name': 'SWAP_EXACT_OUT', 'type': 'function'},
+    ),
+}
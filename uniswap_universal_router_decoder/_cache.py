@@ -0,0 +1,151 @@
+"""
+Bounded LRU cache of decoded inputs used by the Uniswap Universal Router Codec
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Hashable,
+    Mapping,
+)
+from hashlib import blake2b
+from threading import Lock
+import time
+from types import MappingProxyType
+from typing import (
+    Any,
+    cast,
+    Optional,
+    Union,
+)
+
+from uniswap_universal_router_decoder._compact import (
+    CompactCommand,
+    CompactResult,
+)
+
+
+class DecodeCache:
+    """
+    Bounded LRU cache of decoded inputs, with an optional time to live, to be given to the codec:
+    RouterCodec(decode_cache=DecodeCache(maxsize=4096)).
+
+    The inputs are keyed by a hash of their bytes (and by the decoding options), and the cached results are read-only,
+    so they can be shared between callers: dicts are returned as MappingProxyType and lists as tuples.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None) -> None:
+        """
+        :param maxsize: the maximum number of cached decoded inputs. The least recently used ones are evicted first.
+        :param ttl: optional time to live of the cached decoded inputs, in seconds
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[bytes, Hashable], tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"DecodeCache(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def get_or_decode(
+            self,
+            data: Union[bytes, bytearray, memoryview],
+            options: Hashable,
+            decode: Callable[[], Any]) -> Any:
+        """
+        Return the cached decoded input, or decode it and cache the result
+
+        :param data: the input bytes
+        :param options: the other decoding parameters (engine, projection, ...), part of the cache key
+        :param decode: the function decoding the input
+        :return: the read-only decoded input
+        """
+        key = _cache_key(data, options)
+        now = time.monotonic()
+        cached = self._get(key, now)
+        if cached is not None:
+            return cached
+        # decode outside the lock: a concurrent miss on the same input only decodes it twice
+        return self._put(key, now, decode())
+
+    def get(self, data: Union[bytes, bytearray, memoryview], options: Hashable) -> Any:
+        """
+        :param data: the input bytes
+        :param options: the other decoding parameters, part of the cache key
+        :return: the read-only cached decoded input, or None if it is not cached or has expired
+        """
+        return self._get(_cache_key(data, options), time.monotonic())
+
+    def put(self, data: Union[bytes, bytearray, memoryview], options: Hashable, decoded: Any) -> Any:
+        """
+        Cache a decoded input, ex: decoded in another process
+
+        :param data: the input bytes
+        :param options: the other decoding parameters, part of the cache key
+        :param decoded: the decoded input
+        :return: the read-only cached decoded input
+        """
+        return self._put(_cache_key(data, options), time.monotonic(), decoded)
+
+    def _get(self, key: tuple[bytes, Hashable], now: float) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or now - entry[0] < self.ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def _put(self, key: tuple[bytes, Hashable], now: float, decoded: Any) -> Any:
+        frozen = freeze(decoded)
+        with self._lock:
+            self._entries[key] = (now, frozen)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return frozen
+
+    def clear(self) -> None:
+        """
+        Remove all cached decoded inputs and reset the hit and miss counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _cache_key(data: Union[bytes, bytearray, memoryview], options: Hashable) -> tuple[bytes, Hashable]:
+    return blake2b(data, digest_size=16).digest(), options
+
+
+def freeze(value: Any) -> Any:
+    """
+    :return: a read-only copy of a decoded value: dicts become MappingProxyType, lists tuples,
+        and compact results are rebuilt with frozen values.
+    """
+    if isinstance(value, CompactResult):
+        fields = {name: freeze(item) for name, item in value.items()}
+        if isinstance(value, CompactCommand):
+            fields["revert_on_fail"] = value.revert_on_fail
+        return type(value)(**fields)
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in cast(Mapping[Any, Any], value).items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in cast(list[Any], value))
+    return value
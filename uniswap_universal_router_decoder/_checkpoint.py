@@ -0,0 +1,99 @@
+"""
+Checkpoints used by the Uniswap Universal Router Codec block scanners to resume where they stopped
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sqlite3
+from typing import (
+    Optional,
+    Protocol,
+    Union,
+)
+
+
+class Checkpoint(Protocol):
+    """
+    Persist the last block done by a scanner. Any object with these 2 methods can be used.
+    """
+    def load(self) -> Optional[int]:
+        """
+        :return: the last block done, or None if nothing has been saved yet
+        """
+        ...
+
+    def save(self, block_number: int) -> None:
+        """
+        :param block_number: the last block done
+        """
+        ...
+
+
+class FileCheckpoint:
+    """
+    Checkpoint stored as a block number in a text file, replaced atomically on each save.
+    """
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+
+    def __repr__(self) -> str:
+        return f"FileCheckpoint(path='{self.path}')"
+
+    def load(self) -> Optional[int]:
+        try:
+            return int(self.path.read_text().strip())
+        except FileNotFoundError:
+            return None
+
+    def save(self, block_number: int) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(str(block_number))
+        os.replace(tmp_path, self.path)
+
+
+class SQLiteCheckpoint:
+    """
+    Checkpoint stored in a SQLite database, in the 'checkpoints' table, so several named scans can share a database.
+    """
+    def __init__(self, path: Union[str, Path], name: str = "default") -> None:
+        self.path = Path(path)
+        self.name = name
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS checkpoints (name TEXT PRIMARY KEY, block_number INTEGER NOT NULL)"
+                )
+        finally:
+            connection.close()
+
+    def __repr__(self) -> str:
+        return f"SQLiteCheckpoint(path='{self.path}', name='{self.name}')"
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def load(self) -> Optional[int]:
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT block_number FROM checkpoints WHERE name = ?", (self.name, )).fetchone()
+        finally:
+            connection.close()
+        return int(row[0]) if row else None
+
+    def save(self, block_number: int) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT INTO checkpoints (name, block_number) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET block_number = excluded.block_number",
+                    (self.name, block_number),
+                )
+        finally:
+            connection.close()
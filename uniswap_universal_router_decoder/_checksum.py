@@ -0,0 +1,96 @@
+"""
+Bounded cache of checksum addresses shared by the encoder and the decoder of the Uniswap Universal Router Codec
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    cast,
+    Union,
+)
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
+
+
+class ChecksumCache:
+    """
+    Bounded LRU cache of checksum addresses. Checksumming an address computes a keccak hash, and the same tokens and
+    recipients are checksummed over and over by the codec, so the shared instance checksum_cache is used by the
+    encoder and the decoder. Ex: checksum_cache.maxsize = 10_000
+    """
+    def __init__(self, maxsize: int = 4096, trusted_input: bool = False) -> None:
+        """
+        :param maxsize: the maximum number of cached addresses. The least recently used ones are evicted first.
+        :param trusted_input: if True, mixed-case address strings are considered already checksummed and returned
+            as they are, without computing their checksum.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self.trusted_input = trusted_input
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, ChecksumAddress] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"ChecksumCache(maxsize={self.maxsize}, trusted_input={self.trusted_input}, size={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def to_checksum_address(self, address: Union[str, bytes]) -> ChecksumAddress:
+        """
+        Same as Web3.to_checksum_address(), but each address is checksummed once while it is in the cache
+
+        :param address: the address as a hex string or 20 bytes
+        :return: the checksum address
+        """
+        if self.trusted_input and isinstance(address, str) and not (address.islower() or address[2:].isupper()):
+            return cast(ChecksumAddress, address)
+
+        # the same address as a hex string in any case, or as bytes, is cached once
+        key = address.lower() if isinstance(address, str) else f"0x{address.hex()}"
+        with self._lock:
+            checksum_address = self._entries.get(key)
+            if checksum_address is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return checksum_address
+            self.misses += 1
+
+        checksum_address = Web3.to_checksum_address(address)
+        with self._lock:
+            self._entries[key] = checksum_address
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return checksum_address
+
+    def clear(self) -> None:
+        """
+        Remove all cached addresses and reset the hit and miss counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+checksum_cache = ChecksumCache()
+
+
+def to_checksum_address(address: Any) -> ChecksumAddress:
+    """
+    :return: the checksum address, from the shared checksum_cache
+    """
+    return checksum_cache.to_checksum_address(address)
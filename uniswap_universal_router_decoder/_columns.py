@@ -0,0 +1,206 @@
+"""
+Columnar tables of decoded commands used by the Uniswap Universal Router Codec, exportable to Arrow and NumPy
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from importlib import import_module
+from typing import (
+    Any,
+    cast,
+    Union,
+)
+
+from uniswap_universal_router_decoder._abi_builder import (
+    ABIParam,
+    ABIStruct,
+)
+from uniswap_universal_router_decoder._enums import RouterFunction
+from uniswap_universal_router_decoder._swaps import check_v3_path_length
+
+
+_v2_swap_functions = frozenset((RouterFunction.V2_SWAP_EXACT_IN, RouterFunction.V2_SWAP_EXACT_OUT))
+_v3_swap_functions = frozenset((RouterFunction.V3_SWAP_EXACT_IN, RouterFunction.V3_SWAP_EXACT_OUT))
+_index_params = (("transaction", "uint64"), ("command", "uint8"), ("revert_on_fail", "bool"))
+_token_columns = ("tokenIn", "tokenOut")
+
+
+class CommandColumns:
+    """
+    The decoded inputs of one UR command over a batch of transactions, stored column by column:
+    one list per command parameter, in the ABI order, after the following columns:
+
+    transaction: index of the transaction input in the batch
+
+    command: index of the command in the transaction commands
+
+    revert_on_fail: False if the command is allowed to revert
+
+    The V2 and V3 swaps have 2 additional columns, tokenIn and tokenOut: the input and output tokens of their path.
+    Values are the same as the RAW decoding engine, and the V4 actions are not decoded (kept as bytes).
+    With raw_addresses, the addresses are 20-byte bytes instead of lower case hex strings.
+    """
+    def __init__(
+            self,
+            function: RouterFunction,
+            params: Sequence[Union[ABIParam, ABIStruct]],
+            raw_addresses: bool = False) -> None:
+        self.function = function
+        self.raw_addresses = raw_addresses
+        self._params: list[Union[ABIParam, ABIStruct]] = [ABIParam(name, abi_type) for name, abi_type in _index_params]
+        self._params.extend(params)
+        self._path_index = -1
+        if function in _v2_swap_functions or function in _v3_swap_functions:
+            self._path_index = [param.name for param in params].index("path")
+            self._params.extend(ABIParam(name, "address") for name in _token_columns)
+        self.columns: dict[str, list[Any]] = {param.name: [] for param in self._params}
+        self._column_lists = list(self.columns.values())
+
+    def __len__(self) -> int:
+        return len(self.columns["transaction"])
+
+    def __repr__(self) -> str:
+        return f"CommandColumns(function={self.function.name}, columns={list(self.columns)}, rows={len(self)})"
+
+    def append(self, transaction: int, command: int, revert_on_fail: bool, values: Sequence[Any]) -> None:
+        """
+        Append a row
+
+        :param transaction: index of the transaction input in the batch
+        :param command: index of the command in the transaction commands
+        :param revert_on_fail: False if the command is allowed to revert
+        :param values: the decoded command parameters, in the ABI order
+        :raise ValueError: if the swap path is empty or has an invalid length. The table is not modified.
+        """
+        row = [transaction, command, revert_on_fail, *values]
+        if self._path_index >= 0:
+            path = values[self._path_index]
+            if self.function in _v2_swap_functions:
+                if not path:
+                    raise ValueError("Empty V2 path")
+                row.extend((path[0], path[-1]))
+            else:
+                check_v3_path_length(path)
+                first, last = path[:20], path[-20:]
+                if not self.raw_addresses:
+                    first, last = f"0x{first.hex()}", f"0x{last.hex()}"
+                # V3 exact output paths are encoded from the output token to the input token
+                row.extend((first, last) if self.function is RouterFunction.V3_SWAP_EXACT_IN else (last, first))
+        for column, value in zip(self._column_lists, row):
+            column.append(value)
+
+    def to_arrow(self) -> Any:
+        """
+        Requires pyarrow. Integers larger than 64 bits (ex: amounts) are converted to decimal strings, so they are not
+        truncated, and structs to Arrow structs. Raw addresses are 20-byte fixed size binaries.
+
+        :return: the table as a pyarrow.RecordBatch
+        """
+        pa = _import_optional("pyarrow", "arrow")
+        arrays = [
+            pa.array(
+                [_to_arrow_value(param, value) for value in column],
+                type=_arrow_type(pa, param, self.raw_addresses),
+            )
+            for param, column in zip(self._params, self._column_lists)
+        ]
+        return pa.RecordBatch.from_arrays(arrays, names=list(self.columns))
+
+    def to_numpy(self) -> Any:
+        """
+        Requires numpy. Integers up to 64 bits, bools and addresses have native types (raw addresses are 20-byte void
+        fields), the other columns (large integers, bytes, arrays and structs) are Python objects.
+
+        :return: the table as a numpy structured array
+        """
+        np = _import_optional("numpy", "numpy")
+        dtype = [(param.name, _numpy_dtype(param, self.raw_addresses)) for param in self._params]
+        array = np.empty(len(self), dtype=dtype)
+        for (name, field_dtype), column in zip(dtype, self._column_lists):
+            if field_dtype == "O":
+                # element-wise, so tuples are not broadcast as sub-arrays
+                field = array[name]
+                for i, value in enumerate(column):
+                    field[i] = value
+            else:
+                array[name] = column
+        return array
+
+
+def _import_optional(module_name: str, extra: str) -> Any:
+    try:
+        return import_module(module_name)
+    except ImportError:
+        raise ImportError(
+            f"{module_name} is required: pip install uniswap-universal-router-decoder[{extra}]"
+        ) from None
+
+
+def _int_bits(abi_type: str) -> int:
+    """
+    :return: the size in bits of an ABI (u)int type, or 0 if it is not an integer type
+    """
+    if abi_type.startswith("uint"):
+        return int(abi_type[4:] or 256)
+    if abi_type.startswith("int"):
+        return int(abi_type[3:] or 256)
+    return 0
+
+
+def _element_param(param: ABIParam) -> ABIParam:
+    return ABIParam(param.name, param.type[:-2])
+
+
+def _arrow_type(pa: Any, param: Union[ABIParam, ABIStruct], raw_addresses: bool) -> Any:
+    if isinstance(param, ABIStruct):
+        struct_type = pa.struct(
+            [pa.field(sub_param.name, _arrow_type(pa, sub_param, raw_addresses)) for sub_param in param.params]
+        )
+        return pa.list_(struct_type) if param.type == "tuple[]" else struct_type
+    if param.type.endswith("[]"):
+        return pa.list_(_arrow_type(pa, _element_param(param), raw_addresses))
+    if param.type == "address" and raw_addresses:
+        return pa.binary(20)
+    bits = _int_bits(param.type)
+    if 0 < bits <= 64:
+        return pa.uint64() if param.type.startswith("u") else pa.int64()
+    if bits or param.type in ("address", "string"):
+        return pa.string()
+    if param.type == "bool":
+        return pa.bool_()
+    return pa.binary()
+
+
+def _to_arrow_value(param: Union[ABIParam, ABIStruct], value: Any) -> Any:
+    if isinstance(param, ABIStruct):
+        if param.type == "tuple[]":
+            return [_struct_to_arrow(param, item) for item in cast(Sequence[dict[str, Any]], value)]
+        return _struct_to_arrow(param, cast(dict[str, Any], value))
+    if param.type.endswith("[]"):
+        element_param = _element_param(param)
+        return [_to_arrow_value(element_param, item) for item in cast(Sequence[Any], value)]
+    if _int_bits(param.type) > 64:
+        return str(value)
+    return value
+
+
+def _struct_to_arrow(param: ABIStruct, value: dict[str, Any]) -> dict[str, Any]:
+    return {sub_param.name: _to_arrow_value(sub_param, value[sub_param.name]) for sub_param in param.params}
+
+
+def _numpy_dtype(param: Union[ABIParam, ABIStruct], raw_addresses: bool) -> str:
+    if isinstance(param, ABIStruct) or param.type.endswith("[]"):
+        return "O"
+    bits = _int_bits(param.type)
+    if 0 < bits <= 64:
+        return "u8" if param.type.startswith("u") else "i8"
+    if param.type == "address":
+        # not S20, which strips the trailing null bytes
+        return "V20" if raw_addresses else "U42"
+    if param.type == "bool":
+        return "?"
+    return "O"
@@ -0,0 +1,153 @@
+"""
+Compact decoded results used by the Uniswap Universal Router Codec: slotted classes generated from the ABI map
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from collections.abc import (
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import (
+    Any,
+    cast,
+)
+
+
+class CompactResult(Mapping[str, Any]):
+    """
+    Base class of the compact decoded results, whose subclasses are generated from the ABI map with one slot per
+    parameter. They are read-only mappings, so the parameters can be read as items or attributes,
+    ex: result["amountIn"] or result.amountIn, but cannot be set or deleted once built.
+    to_dict() returns the same structure as the RAW decoding engine.
+    """
+    __slots__ = ()
+    _path: tuple[str, ...] = ()
+    fn_name: str = ""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        for name, value in zip(self.__slots__, args):
+            object.__setattr__(self, name, value)
+        for name, value in kwargs.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only: cannot set {name}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only: cannot delete {name}")
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        # parameters which have not been decoded (see the fields argument of function_input()) are skipped
+        return (name for name in self.__slots__ if hasattr(self, name))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}={value!r}' for name, value in self.items())})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # generated classes cannot be found by pickle, so they are rebuilt from their definition
+        cls = type(self)
+        return _rebuild, (cls.__bases__[0], cls._path, cls.__slots__, _slot_values(self))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: the decoded parameters as a dict, same as the RAW decoding engine
+        """
+        return {name: _to_raw(value) for name, value in self.items()}
+
+
+class CompactAction(CompactResult):
+    """
+    Base class of the compact decoded V4 actions
+    """
+    __slots__ = ()
+
+    def to_raw(self) -> tuple[str, dict[str, Any]]:
+        """
+        :return: (function name, decoded parameters), same as the RAW decoding engine
+        """
+        return self.fn_name, self.to_dict()
+
+
+class CompactCommand(CompactResult):
+    """
+    Base class of the compact decoded UR commands, with the additional revert_on_fail attribute
+    """
+    __slots__ = ("revert_on_fail", )
+    revert_on_fail: bool
+
+    def to_raw(self) -> tuple[str, dict[str, Any], dict[str, bool]]:
+        """
+        :return: (function name, decoded parameters, {"revert_on_fail": bool}), same as the RAW decoding engine
+        """
+        return self.fn_name, self.to_dict(), {"revert_on_fail": self.revert_on_fail}
+
+
+def set_revert_on_fail(command: CompactCommand, revert_on_fail: bool) -> None:
+    """
+    Set the revert_on_fail attribute of a command built by the decoder, before it is returned
+    """
+    object.__setattr__(command, "revert_on_fail", revert_on_fail)
+
+
+def _slot_values(result: CompactResult) -> dict[str, Any]:
+    slots = (name for cls in type(result).__mro__ for name in getattr(cls, "__slots__", ()))
+    return {name: getattr(result, name) for name in slots if hasattr(result, name)}
+
+
+def _to_raw(value: Any) -> Any:
+    if isinstance(value, (CompactAction, CompactCommand)):
+        return value.to_raw()
+    if isinstance(value, CompactResult):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_raw(item) for item in cast(list[Any], value)]
+    if isinstance(value, tuple):
+        # lists of cached results are frozen into tuples
+        return tuple(_to_raw(item) for item in cast(tuple[Any, ...], value))
+    return value
+
+
+_compact_types: dict[tuple[type[CompactResult], tuple[str, ...], tuple[str, ...]], type[CompactResult]] = {}
+
+
+def get_compact_type(
+        base: type[CompactResult],
+        path: tuple[str, ...],
+        names: Sequence[str]) -> type[CompactResult]:
+    """
+    Get, or generate once, the slotted class of a function or a struct
+
+    :param base: CompactCommand, CompactAction or CompactResult
+    :param path: the path of the function or struct in the ABI map, ex: ('RouterFunction.PERMIT2_PERMIT', 'struct')
+    :param names: the parameter names
+    :return: the slotted class
+    """
+    key = (base, path, tuple(names))
+    cls = _compact_types.get(key)
+    if cls is None:
+        fn_name = path[-1].split(".")[-1]
+        cls = type(fn_name, (base, ), {"__slots__": tuple(names), "_path": path, "fn_name": fn_name})
+        _compact_types[key] = cls
+    return cls
+
+
+def _rebuild(
+        base: type[CompactResult],
+        path: tuple[str, ...],
+        names: Sequence[str],
+        values: dict[str, Any]) -> CompactResult:
+    return get_compact_type(base, path, names)(**values)
@@ -0,0 +1,156 @@
+"""
+Memory-mapped binary corpus of transaction inputs for the Uniswap Universal Router Codec
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Sequence,
+)
+import mmap
+from pathlib import Path
+from struct import Struct
+import tempfile
+from types import TracebackType
+from typing import (
+    Optional,
+    overload,
+    Union,
+)
+
+from hexbytes import HexBytes
+
+
+# File layout, all integers little-endian:
+#   header: magic, version (u32), reserved (u32)
+#   records: length (u32), input bytes - one record per input
+#   index: offset (u64) of each record, aligned on 8 bytes
+#   footer: index offset (u64), number of records (u64), magic
+_MAGIC = b"URCORPUS"
+_VERSION = 1
+_header = Struct(f"<{len(_MAGIC)}sII")
+_length = Struct("<I")
+_offset = Struct("<Q")
+_footer = Struct(f"<QQ{len(_MAGIC)}s")
+
+
+def write_calldata_corpus(path: Union[str, Path], inputs: Iterable[Union[str, bytes, bytearray, memoryview]]) -> int:
+    """
+    Write transaction inputs to a calldata corpus file, to be read with CalldataCorpus.
+    The index is spooled to a temporary file, so any number of inputs can be written with a constant memory use.
+
+    :param path: the corpus file, overwritten if it exists
+    :param inputs: the transaction inputs, as hex strings or bytes-like objects
+    :return: the number of written inputs
+    """
+    count = 0
+    with open(path, "wb") as f, tempfile.TemporaryFile() as index:
+        f.write(_header.pack(_MAGIC, _VERSION, 0))
+        offset = _header.size
+        for input_data in inputs:
+            data = HexBytes(input_data) if isinstance(input_data, str) else input_data
+            length = len(memoryview(data).cast("B"))
+            index.write(_offset.pack(offset))
+            f.write(_length.pack(length))
+            f.write(data)
+            offset += _length.size + length
+            count += 1
+
+        padding = -offset % _offset.size
+        f.write(b"\0" * padding)
+        index.seek(0)
+        while chunk := index.read(1 << 20):
+            f.write(chunk)
+        f.write(_footer.pack(offset + padding, count, _MAGIC))
+    return count
+
+
+class CalldataCorpus(Sequence[memoryview]):
+    """
+    Calldata corpus file written by write_calldata_corpus(), memory-mapped and read-only.
+    Each input is a memoryview slice of the mapped file: nothing is read nor copied until it is decoded, and no hex
+    parsing is needed. The decoder reads the selector in place, then copies the execute() arguments once, since eth_abi
+    only decodes bytes. Ex: for input_data in corpus: codec.decode.function_input(input_data)
+
+    The file is unmapped by close() or at the end of a 'with' block, or if some inputs are still referenced then,
+    as soon as they are garbage collected.
+    """
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        try:
+            if len(self._mmap) < _header.size + _footer.size:
+                raise ValueError(f"Not a calldata corpus: {self.path}")
+            magic, version, _ = _header.unpack_from(self._mmap, 0)
+            self._index_offset, self._count, footer_magic = _footer.unpack_from(
+                self._mmap,
+                len(self._mmap) - _footer.size,
+            )
+            if magic != _MAGIC or footer_magic != _MAGIC:
+                raise ValueError(f"Not a calldata corpus, or truncated: {self.path}")
+            if version != _VERSION:
+                raise ValueError(f"Unsupported calldata corpus version {version}: {self.path}")
+        except ValueError:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> memoryview:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[memoryview]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[memoryview, list[memoryview]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError(f"Calldata corpus index out of range: {index}")
+        (offset, ) = _offset.unpack_from(self._mmap, self._index_offset + _offset.size * position)
+        (length, ) = _length.unpack_from(self._mmap, offset)
+        start = offset + _length.size
+        return self._view[start:start + length]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        # the records are contiguous: no need to read the index
+        offset = _header.size
+        for _ in range(self._count):
+            (length, ) = _length.unpack_from(self._mmap, offset)
+            start = offset + _length.size
+            yield self._view[start:start + length]
+            offset = start + length
+
+    def __repr__(self) -> str:
+        return f"CalldataCorpus(path='{self.path}', size={self._count})"
+
+    def __enter__(self) -> CalldataCorpus:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the file, or let it be unmapped when the inputs still referenced are garbage collected
+        """
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            """Some inputs are still referenced: they keep the mapping alive"""
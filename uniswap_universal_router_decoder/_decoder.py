@@ -5,29 +5,92 @@ Decoding part of the Uniswap Universal Router Codec
 * License: MIT.
 * Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
 """
-from collections.abc import Sequence
-from itertools import chain
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Collection,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import (
+    cached_property,
+    partial,
+)
+from itertools import (
+    accumulate,
+    chain,
+    islice,
+)
 import json
+import os
+from threading import Lock
+import time
 from typing import (
     Any,
+    cast,
     Generic,
+    Literal,
+    Optional,
+    overload,
+    Protocol,
+    TypeVar,
     Union,
 )
 
 from eth_abi import decode
+from eth_abi.abi import default_codec
+from eth_abi.codec import ABICodec
+from eth_abi.decoding import (
+    AddressDecoder,
+    BaseDecoder,
+    ContextFramesBytesIO,
+    TupleDecoder,
+)
+from eth_abi.encoding import AddressEncoder
 from eth_abi.exceptions import DecodingError
+from eth_abi.grammar import (
+    ABIType,
+    parse,
+    TupleType,
+)
+from eth_abi.registry import (
+    ABIRegistry,
+    BaseEquals,
+    registry,
+)
+from eth_typing import ABIError
+from eth_utils.abi import (
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+)
 from web3 import (
     AsyncHTTPProvider,
     AsyncWeb3,
     Web3,
+    WebSocketProvider,
+)
+from web3._utils.abi import (
+    map_abi_data,
+    named_tree,
 )
+from web3._utils.normalizers import implicitly_identity
 from web3.contract.async_contract import AsyncContract
 from web3.contract.contract import (
     BaseContractFunction,
     Contract,
 )
-from web3.exceptions import Web3Exception
 from web3.types import (
+    BlockData,
+    BlockIdentifier,
     ChecksumAddress,
     HexBytes,
     HexStr,
@@ -35,161 +98,1442 @@ from web3.types import (
 )
 
 from uniswap_universal_router_decoder._abi_builder import (
-    ABIFunctionDict,
+    ABIFunction,
     ABIMap,
-    build_abi_type_list,
+    ABIMapWrapper,
+    ABIParam,
+    ABIStruct,
+)
+from uniswap_universal_router_decoder._cache import DecodeCache
+from uniswap_universal_router_decoder._checkpoint import Checkpoint
+from uniswap_universal_router_decoder._checksum import to_checksum_address
+from uniswap_universal_router_decoder._columns import CommandColumns
+from uniswap_universal_router_decoder._compact import (
+    CompactAction,
+    CompactCommand,
+    CompactResult,
+    get_compact_type,
+    set_revert_on_fail,
 )
 from uniswap_universal_router_decoder._constants import (
     permit2_abi,
     ur_abi,
+    ur_address,
     v4_pool_manager_abi,
     v4_position_manager_abi,
     W3,
 )
 from uniswap_universal_router_decoder._enums import (
+    DecodingEngine,
+    MiscFunctions,
     RouterConstant,
     RouterFunction,
+    StreamFormat,
+    TransactionCacheMode,
     V4Actions,
 )
+from uniswap_universal_router_decoder._pending import decode_pending_transactions
+from uniswap_universal_router_decoder._scan import (
+    async_scan_blocks,
+    scan_blocks,
+)
+from uniswap_universal_router_decoder._stream import (
+    decode_stream,
+    StreamStats,
+)
+from uniswap_universal_router_decoder._swaps import (
+    extract_swap_legs,
+    parse_v3_path,
+    router_function_values,
+    swap_leg_functions,
+    SwapLeg,
+)
+from uniswap_universal_router_decoder._transaction_cache import TransactionCache
 
 
+# the transaction input: a hex string, or any bytes-like object (bytes, bytearray, memoryview of a mapped file, ...)
+InputData = Union[HexStr, bytes, bytearray, memoryview]
 DecodedInput = tuple[BaseContractFunction, dict[str, Any]]
+RawDecodedInput = tuple[str, dict[str, Any]]
 
+TFunction = TypeVar("TFunction", BaseContractFunction, str)
 
-class _V4Decoder:
-    def __init__(self, w3: Union[AsyncWeb3[AsyncHTTPProvider], Web3], abi_map: ABIMap) -> None:
-        self._w3 = w3
-        self._abi_map = abi_map
-        self._pm_contract = w3.eth.contract(abi=v4_position_manager_abi)
+
+class _ArgumentDecoder(Protocol[TFunction]):
+    function: TFunction
+    selector: bytes
+
+    def decode(self, data: bytes) -> Mapping[str, Any]:
+        ...
+
+    def decode_fields(self, data: bytes, fields: Sequence[str]) -> Mapping[str, Any]:
+        ...
+
+
+def _static_size(abi_type: ABIType) -> int:
+    size = 32
+    if isinstance(abi_type, TupleType):
+        size = sum(_static_size(component) for component in cast(Sequence[ABIType], abi_type.components))
+    for dimension in cast(Sequence[Sequence[int]], abi_type.arrlist or ()):
+        size *= dimension[0]
+    return size
+
+
+def _head_size(type_str: str, decoder: Callable[[ContextFramesBytesIO], Any]) -> int:
+    if not isinstance(decoder, BaseDecoder) or decoder.is_dynamic:
+        # dynamic types, and custom v4 params types, are encoded as an offset in the head
+        return 32
+    return _static_size(cast(ABIType, parse(type_str)))
+
+
+def _input_view(input_data: InputData) -> memoryview:
+    """
+    :return: a view on the input bytes: hex strings are parsed, and the bytes-like objects are not copied
+    """
+    return memoryview(HexBytes(input_data) if isinstance(input_data, str) else input_data)
+
+
+def _get_abi_codec(abi_registry: ABIRegistry) -> ABICodec:
+    return default_codec if abi_registry is registry else ABICodec(abi_registry)
+
+
+class _FieldsDecoder:
+    """
+    Decode only some of the function arguments, reading them from their head position, so the other arguments
+    are never decoded.
+    """
+    def __init__(self, names: Sequence[str], types: Sequence[str], abi_registry: ABIRegistry = registry) -> None:
+        self._indexes = {name: i for i, name in enumerate(names)}
+        # the tuple decoder wraps the dynamic type decoders so they read their offset in the head
+        tuple_decoder = TupleDecoder(decoders=[abi_registry.get_decoder(type_str) for type_str in types])
+        self._decoders = cast(tuple[Callable[[ContextFramesBytesIO], Any], ...], tuple_decoder.decoders)
+        head_sizes = [_head_size(type_str, decoder) for type_str, decoder in zip(types, self._decoders)]
+        self._heads = list(accumulate(head_sizes[:-1], initial=0))
+
+    def decode(self, data: bytes, fields: Sequence[str]) -> tuple[list[int], list[Any]]:
+        """
+        :return: the indexes of the decoded arguments, and their values
+        """
+        stream = ContextFramesBytesIO(data)
+        indexes = [self._indexes[field] for field in fields]
+        values: list[Any] = []
+        for i in indexes:
+            stream.seek(self._heads[i])
+            values.append(self._decoders[i](stream))
+        return indexes, values
+
+
+@implicitly_identity
+def _addresses_checksummed(type_str: str, data: Any) -> Optional[tuple[str, ChecksumAddress]]:
+    if type_str == "address":
+        return type_str, to_checksum_address(data)
+    return None
+
+
+# same as web3 BASE_RETURN_NORMALIZERS, with the shared checksum cache
+_return_normalizers = [_addresses_checksummed]
+
+
+class _FunctionDecoder:
+    """
+    Contract function resolved once, so its inputs can be decoded without building a contract
+    and looking up the function selector on every call.
+    """
+    def __init__(self, function: BaseContractFunction, abi_registry: ABIRegistry = registry) -> None:
+        self.function = function
+        self.selector = function_abi_to_4byte_selector(function.abi)
+        self._inputs = function.abi.get("inputs", [])
+        self._types = get_abi_input_types(function.abi)
+        self._abi_registry = abi_registry
+        self._abi_codec = _get_abi_codec(abi_registry)
+
+    @classmethod
+    def from_abi(
+            cls,
+            w3: Union[AsyncWeb3[AsyncHTTPProvider], Web3],
+            abi_function: ABIFunction,
+            abi_registry: ABIRegistry = registry) -> _FunctionDecoder:
+        contract = w3.eth.contract(abi=abi_function.full_abi)
+        return cls(contract.get_function_by_selector(abi_function.selector), abi_registry)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        """
+        Decode the function arguments, same output as decode_function_input()
+
+        :param data: the encoded arguments, without the function selector
+        :return: the decoded arguments
+        """
+        decoded = self._abi_codec.decode(self._types, data)
+        normalized = map_abi_data(_return_normalizers, self._types, decoded)
+        return named_tree(self._inputs, normalized)
+
+    @cached_property
+    def _fields_decoder(self) -> _FieldsDecoder:
+        return _FieldsDecoder([param.get("name", "") for param in self._inputs], self._types, self._abi_registry)
+
+    def decode_fields(self, data: bytes, fields: Sequence[str]) -> dict[str, Any]:
+        """
+        Decode only the given function arguments
+
+        :param data: the encoded arguments, without the function selector
+        :param fields: the names of the arguments to decode
+        :return: the decoded arguments
+        """
+        indexes, decoded = self._fields_decoder.decode(data, fields)
+        types = [self._types[i] for i in indexes]
+        normalized = map_abi_data(_return_normalizers, types, decoded)
+        return named_tree([self._inputs[i] for i in indexes], normalized)
+
+
+class _ErrorDecoder:
+    """
+    Contract custom error, decoded directly with eth_abi, same output as decode_function_input()
+    """
+    def __init__(self, error_abi: ABIError) -> None:
+        self._inputs = error_abi.get("inputs", [])
+        self._types = get_abi_input_types(error_abi)
+        self.signature = f"{error_abi['name']}({','.join(self._types)})"
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        """
+        :param data: the encoded error arguments, without the error selector
+        :return: the decoded arguments
+        """
+        decoded = decode(self._types, data)
+        normalized = map_abi_data(_return_normalizers, self._types, decoded)
+        return named_tree(self._inputs, normalized)
+
+
+# maximum number of abis sets whose error index is kept by a decoder
+_max_error_indexes = 8
+
+# minimum time in seconds between 2 refreshes of the finalized block, which cannot advance more than once per slot
+_finalized_refresh_interval = 12.0
+
+
+def _build_error_index(abis: Sequence[str]) -> dict[bytes, list[_ErrorDecoder]]:
+    """
+    :return: the error decoders of the abis, by selector, in the abi order
+    """
+    index: dict[bytes, list[_ErrorDecoder]] = {}
+    for abi in abis:
+        for item in json.loads(abi):
+            if item["type"].lower() == "error":
+                error_decoder = _ErrorDecoder(item)
+                candidates = index.setdefault(function_abi_to_4byte_selector(item), [])
+                if all(candidate.signature != error_decoder.signature for candidate in candidates):
+                    candidates.append(error_decoder)
+    return index
+
+
+_v4_params_functions = {
+    "ExactInputParams": MiscFunctions.STRICT_V4_SWAP_EXACT_IN,
+    "ExactOutputParams": MiscFunctions.STRICT_V4_SWAP_EXACT_OUT,
+}
+
+
+def _name_values(
+        param: Union[ABIParam, ABIStruct],
+        compact_path: Optional[tuple[str, ...]] = None) -> Callable[[Any], Any]:
+    if isinstance(param, ABIParam):
+        return lambda value: value
+
+    names = [sub_param.name for sub_param in param.params]
+    sub_path = compact_path + (param.name, ) if compact_path else None
+    namers = [_name_values(sub_param, sub_path) for sub_param in param.params]
+
+    def to_dict(values: Sequence[Any]) -> dict[str, Any]:
+        return {name: namer(value) for name, namer, value in zip(names, namers, values)}
+
+    to_struct: Callable[[Sequence[Any]], Any] = to_dict
+    if sub_path:
+        struct_type = get_compact_type(CompactResult, sub_path, names)
+
+        def to_compact(values: Sequence[Any]) -> CompactResult:
+            return struct_type(*[namer(value) for namer, value in zip(namers, values)])
+        to_struct = to_compact
+
+    if param.type == "tuple[]":
+        return lambda values: [to_struct(value) for value in values]
+    return to_struct
+
+
+class _RawAddressDecoder(AddressDecoder):
+    decoder_fn = staticmethod(bytes)
+
+
+def _build_raw_address_registry(abi_registry: ABIRegistry) -> ABIRegistry:
+    """
+    :return: a copy of the registry decoding the addresses as 20-byte bytes, instead of lower case hex strings
+    """
+    raw_address_registry = abi_registry.copy()
+    raw_address_registry.unregister("address")
+    raw_address_registry.register(BaseEquals("address"), AddressEncoder, _RawAddressDecoder, label="address")
+    return raw_address_registry
+
+
+class _RawFunctionDecoder:
+    """
+    Decode function inputs directly with eth_abi, from the ABIFunction type list.
+    Structs are returned as dicts, addresses as lower case hex strings, and arrays as tuples.
+    With a compact_base, the arguments and structs are returned as compact results instead of dicts.
+    With the raw address registry, addresses are returned as 20-byte bytes.
+    """
+    def __init__(
+            self,
+            abi_function: ABIFunction,
+            abi_map: ABIMap,
+            compact_base: Optional[type[CompactResult]] = None,
+            compact_path: tuple[str, ...] = (),
+            abi_registry: ABIRegistry = registry) -> None:
+        self.function = abi_function.name
+        self._abi_registry = abi_registry
+        self._abi_codec = _get_abi_codec(abi_registry)
+        self.selector = abi_function.selector
+        params: list[Union[ABIParam, ABIStruct]] = []
+        for param in abi_function.params:
+            if param.type in _v4_params_functions:
+                # custom types: encoded as a dynamic struct made of the strict v4 function params
+                struct = ABIStruct(param.name, "tuple")
+                struct.params = abi_map[_v4_params_functions[param.type]].params
+                params.append(struct)
+            else:
+                params.append(param)
+        self._names = [param.name for param in params]
+        self._namers = [_name_values(param, compact_path if compact_base else None) for param in params]
+        self._types = [param.get_types_as_str() for param in params]
+        self._result_type = get_compact_type(compact_base, compact_path, self._names) if compact_base else None
+
+    def decode(self, data: bytes) -> Mapping[str, Any]:
+        """
+        Decode the function arguments
+
+        :param data: the encoded arguments, without the function selector
+        :return: the decoded arguments
+        """
+        decoded = self._abi_codec.decode(self._types, data)
+        if self._result_type:
+            return self._result_type(*[namer(value) for namer, value in zip(self._namers, decoded)])
+        return {name: namer(value) for name, namer, value in zip(self._names, self._namers, decoded)}
+
+    def decode_values(self, data: bytes) -> list[Any]:
+        """
+        Decode the function arguments, without naming them
+
+        :param data: the encoded arguments, without the function selector
+        :return: the decoded arguments, in the ABI order
+        """
+        return [namer(value) for namer, value in zip(self._namers, self._abi_codec.decode(self._types, data))]
+
+    @cached_property
+    def _fields_decoder(self) -> _FieldsDecoder:
+        return _FieldsDecoder(self._names, self._types, self._abi_registry)
+
+    def decode_fields(self, data: bytes, fields: Sequence[str]) -> Mapping[str, Any]:
+        """
+        Decode only the given function arguments
+
+        :param data: the encoded arguments, without the function selector
+        :param fields: the names of the arguments to decode
+        :return: the decoded arguments
+        """
+        indexes, decoded = self._fields_decoder.decode(data, fields)
+        decoded_fields = {self._names[i]: self._namers[i](value) for i, value in zip(indexes, decoded)}
+        return self._result_type(**decoded_fields) if self._result_type else decoded_fields
+
+
+def _build_function_decoders(
+        w3: Union[AsyncWeb3[AsyncHTTPProvider], Web3],
+        abi_map: ABIMap,
+        key_type: Union[type[RouterFunction], type[V4Actions]],
+        abi_registry: ABIRegistry = registry) -> dict[Any, _FunctionDecoder]:
+    return {
+        key: _FunctionDecoder.from_abi(w3, abi, abi_registry)
+        for key, abi in abi_map.items()
+        if isinstance(key, key_type)
+    }
+
+
+def _build_raw_function_decoders(
+        abi_map: ABIMap,
+        key_type: Union[type[MiscFunctions], type[RouterFunction], type[V4Actions]],
+        compact_base: Optional[type[CompactResult]] = None,
+        abi_registry: ABIRegistry = registry) -> dict[Any, _RawFunctionDecoder]:
+    return {
+        key: _RawFunctionDecoder(abi, abi_map, compact_base, _compact_path(key), abi_registry)
+        for key, abi in abi_map.items()
+        if isinstance(key, key_type)
+    }
+
+
+def _compact_path(key: Union[MiscFunctions, RouterFunction, V4Actions]) -> tuple[str, ...]:
+    return (f"{type(key).__name__}.{key.name}", )
+
+
+def _get_compact_type(
+        abi_map: ABIMap,
+        key: Union[MiscFunctions, RouterFunction, V4Actions],
+        base: type[CompactResult]) -> type[CompactResult]:
+    return get_compact_type(base, _compact_path(key), [param.name for param in abi_map[key].params])
+
+
+_v4_router_functions = frozenset((RouterFunction.V4_SWAP, RouterFunction.V4_POSITION_MANAGER_CALL))
+
+
+class _Projection:
+    """
+    The commands and V4 actions to decode, and optionally the fields to decode for some of them
+    """
+    def __init__(
+            self,
+            abi_map: ABIMap,
+            functions: Optional[Collection[Union[RouterFunction, V4Actions]]] = None,
+            fields: Optional[Mapping[Union[RouterFunction, V4Actions], Sequence[str]]] = None) -> None:
+        self.fields: dict[Union[RouterFunction, V4Actions], tuple[str, ...]] = {}
+        for fn, fn_fields in (fields or {}).items():
+            if fn in _v4_router_functions or fn not in abi_map:
+                raise ValueError(f"Fields cannot be selected for {fn}")
+            unknown_fields = set(fn_fields) - {param.name for param in abi_map[fn].params}
+            if unknown_fields:
+                raise ValueError(f"Unknown fields {sorted(unknown_fields)} for {fn}")
+            self.fields[fn] = tuple(fn_fields)
+
+        self.router_functions: Optional[set[RouterFunction]] = None
+        self.v4_actions: Optional[set[V4Actions]] = None
+        if functions is not None:
+            self.router_functions = {fn for fn in functions if isinstance(fn, RouterFunction)}
+            self.v4_actions = {fn for fn in functions if isinstance(fn, V4Actions)} or None
+            if self.v4_actions:
+                # V4 actions are only reachable through these commands
+                self.router_functions |= _v4_router_functions
+
+    def decodes(self, fn: Union[RouterFunction, V4Actions]) -> bool:
+        if isinstance(fn, RouterFunction):
+            return self.router_functions is None or fn in self.router_functions
+        return self.v4_actions is None or fn in self.v4_actions
+
+
+def _decode_arguments(
+        fn_decoder: _ArgumentDecoder[TFunction],
+        fn: Union[RouterFunction, V4Actions],
+        data: bytes,
+        projection: Optional[_Projection]) -> Mapping[str, Any]:
+    fields = projection.fields.get(fn) if projection else None
+    return fn_decoder.decode_fields(data, fields) if fields else fn_decoder.decode(data)
+
+
+class _V4Decoder(Generic[TFunction]):
+    def __init__(self, fn_decoders: Mapping[V4Actions, _ArgumentDecoder[TFunction]]) -> None:
+        self.fn_decoders = fn_decoders
 
     def _decode_v4_actions(
             self,
             actions: bytes,
-            params: list[bytes]) -> list[Union[str, DecodedInput]]:
+            params: list[bytes],
+            projection: Optional[_Projection] = None) -> list[Union[str, bytes, tuple[TFunction, Mapping[str, Any]]]]:
         if len(actions) != len(params):
             raise ValueError(f"Number of actions {len(actions)} is different from number of params: {len(params)}")
 
-        decoded_params: list[Union[str, DecodedInput]] = []
+        decoded_params: list[Union[str, bytes, tuple[TFunction, Mapping[str, Any]]]] = []
         for i, action in enumerate(actions):
             try:
-                abi_mapping = self._abi_map[V4Actions(action)]
-                data = abi_mapping.selector + params[i]
-                sub_contract = self._w3.eth.contract(abi=abi_mapping.full_abi)
-                decoded_params.append(sub_contract.decode_function_input(data))
+                v4_action = V4Actions(action)
+                fn_decoder = self.fn_decoders[v4_action]
+                if projection and not projection.decodes(v4_action):
+                    decoded_params.append(params[i])
+                    continue
+                decoded_params.append(
+                    (fn_decoder.function, _decode_arguments(fn_decoder, v4_action, params[i], projection))
+                )
             except (ValueError, KeyError, DecodingError):
                 decoded_params.append(params[i].hex())
         return decoded_params
 
-    def decode_v4_swap(self, actions: bytes, params: list[bytes]) -> list[Union[str, DecodedInput]]:
-        return self._decode_v4_actions(actions, params)
+    def decode_v4_swap(
+            self,
+            actions: bytes,
+            params: list[bytes],
+            projection: Optional[_Projection] = None) -> list[Union[str, bytes, tuple[TFunction, Mapping[str, Any]]]]:
+        return self._decode_v4_actions(actions, params, projection)
 
-    def decode_v4_pm_call(self, encoded_input: bytes) -> dict[str, Any]:
+    def decode_v4_pm_call(self, encoded_input: bytes, projection: Optional[_Projection] = None) -> dict[str, Any]:
         actions, params = decode(["bytes", "bytes[]"], encoded_input)
-        return {"actions": actions, "params": self._decode_v4_actions(actions, params)}
+        return {"actions": actions, "params": self._decode_v4_actions(actions, params, projection)}
+
+
+DecodedCommand = Union[str, bytes, tuple[TFunction, Mapping[str, Any], dict[str, bool]]]
+
+
+class LazyCommandInputs(Sequence[DecodedCommand[TFunction]]):
+    """
+    Sequence of the command inputs of an execute() call, each of them being decoded when it is first accessed.
+    The decoded inputs are cached, so each command is decoded at most once.
+    """
+    def __init__(
+            self,
+            decode_command: Callable[[int, bytes], DecodedCommand[TFunction]],
+            commands: bytes,
+            inputs: Sequence[bytes]) -> None:
+        if len(commands) > len(inputs):
+            raise IndexError(f"Number of commands {len(commands)} is greater than number of inputs: {len(inputs)}")
+        self._decode_command = decode_command
+        self._commands = commands
+        self._inputs = inputs
+        self._decoded: list[Optional[DecodedCommand[TFunction]]] = [None] * len(commands)
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    @overload
+    def __getitem__(self, index: int) -> DecodedCommand[TFunction]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[DecodedCommand[TFunction]]:
+        ...
+
+    def __getitem__(
+            self,
+            index: Union[int, slice]) -> Union[DecodedCommand[TFunction], list[DecodedCommand[TFunction]]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        decoded = self._decoded[index]
+        if decoded is None:
+            decoded = self._decode_command(self._commands[index], self._inputs[index])
+            self._decoded[index] = decoded
+        return decoded
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyCommandInputs, list)):
+            return list(self) == list(cast(Sequence[Any], other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def is_decoded(self, index: int) -> bool:
+        """
+        :return: True if the command input at this index has already been decoded
+        """
+        return self._decoded[index] is not None
+
+
+def _check_command_count(commands: bytes, inputs: Sequence[bytes]) -> None:
+    # valid abi, but not a valid execute() call: each command must have an input
+    if len(commands) > len(inputs):
+        raise ValueError(f"Number of commands {len(commands)} is greater than number of inputs: {len(inputs)}")
+
+
+class _InputDecoder(Generic[TFunction]):
+    """
+    Decode the execute() input and all its commands with a given set of function decoders.
+    """
+    def __init__(
+            self,
+            execute_decoders: Sequence[_ArgumentDecoder[TFunction]],
+            fn_decoders: Mapping[RouterFunction, _ArgumentDecoder[TFunction]],
+            v4_fn_decoders: Mapping[V4Actions, _ArgumentDecoder[TFunction]],
+            fallback: Optional[Callable[[Union[HexStr, HexBytes]], tuple[TFunction, dict[str, Any]]]] = None) -> None:
+        self._execute_decoders = {fn_decoder.selector: fn_decoder for fn_decoder in execute_decoders}
+        self._fn_decoders = fn_decoders
+        self.v4_decoder = _V4Decoder(v4_fn_decoders)
+        self._fallback = fallback
+
+    def _decode_execute(self, input_data: InputData) -> tuple[TFunction, dict[str, Any]]:
+        data = _input_view(input_data)
+        fn_decoder = self._execute_decoders.get(bytes(data[:4]))
+        if fn_decoder is None:
+            if self._fallback:
+                # not an execute() call: let web3 look it up or raise the usual error
+                return self._fallback(HexBytes(data))
+            raise ValueError(f"Could not find any execute function with matching selector 0x{data[:4].hex()}")
+        # the execute() arguments are always decoded as a dict, from their only copy: eth_abi only decodes bytes
+        decoded_input = cast(dict[str, Any], fn_decoder.decode(bytes(data[4:])))
+        _check_command_count(decoded_input["commands"], decoded_input["inputs"])
+        return fn_decoder.function, decoded_input
+
+    def decode(
+            self,
+            input_data: InputData,
+            projection: Optional[_Projection] = None) -> tuple[TFunction, dict[str, Any]]:
+        fct_name, decoded_input = self._decode_execute(input_data)
+        # returns (execute function, {commands as bytes, inputs as seq of bytes, deadline as int})
+        command = decoded_input["commands"]
+        command_input = decoded_input["inputs"]
+        # iterating over bytes produces integers
+        decoded_input["inputs"] = [
+            self.decode_command(b, command_input[i], projection) for i, b in enumerate(command)
+        ]
+        return fct_name, decoded_input
+
+    def decode_lazily(self, input_data: InputData) -> tuple[TFunction, dict[str, Any]]:
+        fct_name, decoded_input = self._decode_execute(input_data)
+        decoded_input["inputs"] = LazyCommandInputs(
+            self.decode_command,
+            decoded_input["commands"],
+            decoded_input["inputs"],
+        )
+        return fct_name, decoded_input
+
+    def decode_command(
+            self,
+            b: int,
+            command_input: bytes,
+            projection: Optional[_Projection] = None) -> DecodedCommand[TFunction]:
+        """
+        Decode the input of one command
+
+        :param b: the command byte, including the allow revert flag
+        :param command_input: the command input
+        :param projection: the commands and fields to decode. Default is everything.
+        :return: (function, decoded parameters, {"revert_on_fail": bool}), the hex input if it cannot be decoded,
+            or the input bytes if the command is not selected in the projection
+        """
+        command_function = b & RouterConstant.COMMAND_TYPE_MASK.value
+        try:
+            router_function = RouterFunction(command_function)
+            fn_decoder = self._fn_decoders[router_function]
+            if projection and not projection.decodes(router_function):
+                return command_input
+            data = command_input
+            if b == RouterFunction.V4_POSITION_MANAGER_CALL.value:
+                # this command input already starts with the modifyLiquidities() selector
+                if data[:4] != fn_decoder.selector:
+                    raise ValueError(f"Unknown selector {data[:4].hex()} for {RouterFunction(command_function)}")
+                data = data[4:]
+            revert_on_fail = not bool(b & RouterConstant.FLAG_ALLOW_REVERT.value)
+            decoded_fct_name = fn_decoder.function
+            decoded_fct_params = _decode_arguments(fn_decoder, router_function, data, projection)
+            if b == RouterFunction.V4_SWAP.value:
+                return (
+                    decoded_fct_name,
+                    {
+                        "actions": decoded_fct_params["actions"],
+                        "params": self.v4_decoder.decode_v4_swap(
+                            decoded_fct_params["actions"],
+                            decoded_fct_params["params"],
+                            projection,
+                        ),
+                    },
+                    {"revert_on_fail": revert_on_fail},
+                )
+            elif b == RouterFunction.V4_POSITION_MANAGER_CALL.value:
+                return (
+                    decoded_fct_name,
+                    {
+                        "unlockData": self.v4_decoder.decode_v4_pm_call(decoded_fct_params["unlockData"], projection),
+                        "deadline": decoded_fct_params["deadline"]
+                    },
+                    {"revert_on_fail": revert_on_fail},
+                )
+            else:
+                return (
+                    decoded_fct_name,
+                    decoded_fct_params,
+                    {"revert_on_fail": revert_on_fail}
+                )
+
+        except (ValueError, KeyError, DecodingError):
+            return command_input.hex()
+
+    def functions(self) -> Iterator[TFunction]:
+        yield from (fn_decoder.function for fn_decoder in self._execute_decoders.values())
+        yield from (fn_decoder.function for fn_decoder in self._fn_decoders.values())
+        yield from (fn_decoder.function for fn_decoder in self.v4_decoder.fn_decoders.values())
+
+
+CompactDecodedInput = tuple[str, CompactResult]
+
+
+class _CompactInputDecoder:
+    """
+    Decode the execute() input and all its commands into compact results, ie slotted classes generated from the ABI map
+    """
+    def __init__(self, abi_map: ABIMap, abi_registry: ABIRegistry = registry) -> None:
+        self._input_decoder: _InputDecoder[str] = _InputDecoder(
+            [
+                _RawFunctionDecoder(abi_map[MiscFunctions.EXECUTE], abi_map),
+                _RawFunctionDecoder(abi_map[MiscFunctions.EXECUTE_WITH_DEADLINE], abi_map),
+            ],
+            _build_raw_function_decoders(abi_map, RouterFunction, CompactCommand, abi_registry),
+            _build_raw_function_decoders(abi_map, V4Actions, CompactAction, abi_registry),
+        )
+        self._execute_type = _get_compact_type(abi_map, MiscFunctions.EXECUTE, CompactResult)
+        self._execute_with_deadline_type = _get_compact_type(
+            abi_map,
+            MiscFunctions.EXECUTE_WITH_DEADLINE,
+            CompactResult,
+        )
+        self._unlock_data_type = _get_compact_type(abi_map, MiscFunctions.UNLOCK_DATA, CompactResult)
+        self._command_types = {
+            key.name: _get_compact_type(abi_map, key, CompactCommand) for key in _v4_router_functions
+        }
+        self._action_types = {
+            key.name: _get_compact_type(abi_map, key, CompactAction) for key in abi_map if isinstance(key, V4Actions)
+        }
+
+    def _to_actions(self, params: Sequence[Any]) -> list[Any]:
+        return [
+            param if isinstance(param, (str, bytes))
+            else param[1] if isinstance(param[1], CompactAction)
+            else self._action_types[param[0]](**param[1])  # only some fields were decoded
+            for param in params
+        ]
+
+    def _to_command(self, command_input: DecodedCommand[str]) -> Union[str, bytes, CompactCommand]:
+        if isinstance(command_input, (str, bytes)):
+            return command_input
+        fct_name, params, revert_on_fail = command_input
+        if isinstance(params, CompactCommand):
+            command = params
+        elif fct_name in self._command_types:
+            # V4 commands are built by the input decoder, with their decoded actions
+            fields = dict(params)
+            if "params" in fields:
+                fields["params"] = self._to_actions(fields["params"])
+            if "unlockData" in fields:
+                actions, params = fields["unlockData"]["actions"], fields["unlockData"]["params"]
+                fields["unlockData"] = self._unlock_data_type(actions, self._to_actions(params))
+            command = cast(CompactCommand, self._command_types[fct_name](**fields))
+        else:
+            raise ValueError(f"Unexpected decoded params for {fct_name}")
+        set_revert_on_fail(command, revert_on_fail["revert_on_fail"])
+        return command
+
+    def decode(
+            self,
+            input_data: InputData,
+            projection: Optional[_Projection] = None) -> CompactDecodedInput:
+        fct_name, decoded_input = self._input_decoder.decode(input_data, projection)
+        decoded_input["inputs"] = [self._to_command(command_input) for command_input in decoded_input["inputs"]]
+        execute_type = self._execute_with_deadline_type if "deadline" in decoded_input else self._execute_type
+        return fct_name, execute_type(**decoded_input)
+
+
+class _ColumnarDecoder:
+    """
+    Decode batches of execute() inputs into one CommandColumns table per UR command, appending the decoded arguments
+    to the columns instead of building a dict per command.
+    """
+    def __init__(self, abi_map: ABIMap, abi_registry: ABIRegistry = registry, raw_addresses: bool = False) -> None:
+        self._abi_map = abi_map
+        self._raw_addresses = raw_addresses
+        self._execute_decoders = {
+            fn_decoder.selector: fn_decoder
+            for fn_decoder in (
+                _RawFunctionDecoder(abi_map[MiscFunctions.EXECUTE], abi_map),
+                _RawFunctionDecoder(abi_map[MiscFunctions.EXECUTE_WITH_DEADLINE], abi_map),
+            )
+        }
+        self._fn_decoders: dict[RouterFunction, _RawFunctionDecoder] = _build_raw_function_decoders(
+            abi_map,
+            RouterFunction,
+            abi_registry=abi_registry,
+        )
+
+    def decode(
+            self,
+            input_data_iterable: Iterable[InputData],
+            functions: Optional[Collection[RouterFunction]] = None) -> dict[RouterFunction, CommandColumns]:
+        tables = {
+            function: CommandColumns(function, self._abi_map[function].params, self._raw_addresses)
+            for function in functions or ()
+        }
+        for i, input_data in enumerate(input_data_iterable):
+            data = _input_view(input_data)
+            execute_decoder = self._execute_decoders.get(bytes(data[:4]))
+            if execute_decoder is None:
+                raise ValueError(f"Could not find any execute function with matching selector 0x{data[:4].hex()}")
+            # only copy of the execute() arguments: eth_abi only decodes bytes
+            commands, inputs = execute_decoder.decode_values(bytes(data[4:]))[:2]
+            if len(commands) > len(inputs):
+                # not a valid execute() call, which function_input() rejects: none of its commands is decoded
+                continue
+            for j, b in enumerate(commands):
+                command_function = b & RouterConstant.COMMAND_TYPE_MASK.value
+                if command_function not in router_function_values:
+                    continue
+                router_function = RouterFunction(command_function)
+                if functions is not None and router_function not in tables:
+                    continue
+                command_input = inputs[j]
+                try:
+                    fn_decoder = self._fn_decoders[router_function]
+                    if router_function is RouterFunction.V4_POSITION_MANAGER_CALL:
+                        # this command input starts with the modifyLiquidities() selector
+                        if command_input[:4] != fn_decoder.selector:
+                            raise ValueError(f"Unknown selector {command_input[:4].hex()} for {router_function}")
+                        command_input = command_input[4:]
+                    values = fn_decoder.decode_values(command_input)
+                    table = tables.get(router_function)
+                    if table is None:
+                        table = CommandColumns(
+                            router_function,
+                            self._abi_map[router_function].params,
+                            self._raw_addresses,
+                        )
+                    # raises ValueError for invalid swap paths
+                    table.append(i, j, not bool(b & RouterConstant.FLAG_ALLOW_REVERT.value), values)
+                except (ValueError, KeyError, DecodingError):
+                    # same as function_input(), which returns these inputs as hex strings
+                    continue
+                tables.setdefault(router_function, table)
+        return tables
+
+
+@dataclass(frozen=True)
+class CommandInfo:
+    """
+    command: the RouterFunction, or the command value if it is unknown
+
+    revert_on_fail: False if the allow revert flag is set
+
+    input_offset, input_length: position of the command input in the transaction input data
+    """
+    command: Union[RouterFunction, int]
+    revert_on_fail: bool
+    input_offset: int
+    input_length: int
+
+
+@dataclass(frozen=True)
+class CommandSummary:
+    """
+    Commands of an execute() call, extracted without decoding their inputs
+    """
+    commands: bytes
+    deadline: Optional[int]
+    command_infos: tuple[CommandInfo, ...]
+
+    def contains(self, *functions: RouterFunction) -> bool:
+        """
+        :return: True if at least one of the given functions is among the commands
+        """
+        return any(info.command in functions for info in self.command_infos)
+
+
+def _read_word(data: memoryview, offset: int) -> int:
+    if offset + 32 > len(data):
+        raise ValueError(f"Input data too short: cannot read 32 bytes at offset {offset}")
+    return int.from_bytes(data[offset:offset + 32], "big")
+
+
+def _map_functions(
+        decoded_input: tuple[Any, Mapping[str, Any]],
+        mapper: Callable[[Any], Any]) -> tuple[Any, Mapping[str, Any]]:
+    """
+    Apply mapper to all the functions of a decoded input, ex: to replace the web3 functions (which cannot be pickled)
+    """
+    def map_actions(decoded_actions: dict[str, Any]) -> dict[str, Any]:
+        params = [
+            param if isinstance(param, (str, bytes)) else (mapper(param[0]), param[1])
+            for param in decoded_actions["params"]
+        ]
+        return {**decoded_actions, "params": params}
+
+    fct, decoded_params = decoded_input
+    if "inputs" not in decoded_params:
+        return mapper(fct), decoded_params
+
+    mapped_inputs: list[Any] = []
+    for b, command_input in zip(decoded_params["commands"], decoded_params["inputs"]):
+        if isinstance(command_input, (str, bytes)):
+            mapped_inputs.append(command_input)
+            continue
+        command_fct, command_params, revert_on_fail = command_input
+        command_function = b & RouterConstant.COMMAND_TYPE_MASK.value
+        if command_function == RouterFunction.V4_SWAP.value:
+            command_params = map_actions(command_params)
+        elif command_function == RouterFunction.V4_POSITION_MANAGER_CALL.value:
+            command_params = {**command_params, "unlockData": map_actions(command_params["unlockData"])}
+        mapped_inputs.append((mapper(command_fct), command_params, revert_on_fail))
+    return mapper(fct), {**decoded_params, "inputs": mapped_inputs}
+
+
+def _is_v3_exact_out(v3_fn_name: str) -> bool:
+    valid_fn_names = ("V3_SWAP_EXACT_IN", "V3_SWAP_EXACT_OUT")
+    if v3_fn_name.upper() not in valid_fn_names:
+        raise ValueError(f"v3_fn_name must be in {valid_fn_names}")
+    return v3_fn_name.upper() == "V3_SWAP_EXACT_OUT"
+
+
+def _v3_path_bytes(path: Union[bytes, str]) -> bytes:
+    if isinstance(path, bytes):
+        return path
+    return bytes.fromhex(path[2:] if path.startswith("0x") else path)
 
 
 class _BaseDecoder(Generic[W3]):
-    def __init__(self, w3: W3, abi_map: ABIMap) -> None:
+    def __init__(
+            self,
+            w3: W3,
+            abi_map: ABIMap,
+            abi_registry: ABIRegistry,
+            cache: Optional[DecodeCache] = None,
+            raw_addresses: bool = False,
+            transaction_cache: Optional[TransactionCache] = None,
+            transaction_cache_mode: TransactionCacheMode = TransactionCacheMode.READ_THROUGH) -> None:
         self._w3 = w3
+        self.cache = cache
+        self.raw_addresses = raw_addresses
+        self.transaction_cache = transaction_cache
+        self.transaction_cache_mode = transaction_cache_mode
+        self._finalized_block_number = -1
+        self._finalized_refresh_time = float("-inf")
+        raw_abi_registry = _build_raw_address_registry(abi_registry) if raw_addresses else abi_registry
 
         # w3.eth.contract returns a contract type if no address is provided, and a contract if one is.
         self._router_contract: Union[type[AsyncContract], type[Contract]] = self._w3.eth.contract(abi=ur_abi)
 
         self._abi_map = abi_map
-        self._v4_decoder = _V4Decoder(w3, abi_map)
+        self._web3_input_decoder: _InputDecoder[BaseContractFunction] = _InputDecoder(
+            [
+                _FunctionDecoder(function, abi_registry)
+                for function in self._router_contract.all_functions()
+                if function.fn_name == "execute"
+            ],
+            _build_function_decoders(w3, abi_map, RouterFunction, abi_registry),
+            _build_function_decoders(w3, abi_map, V4Actions, abi_registry),
+            self._router_contract.decode_function_input,
+        )
+        self._raw_input_decoder: _InputDecoder[str] = _InputDecoder(
+            [
+                _RawFunctionDecoder(abi_map[MiscFunctions.EXECUTE], abi_map, abi_registry=abi_registry),
+                _RawFunctionDecoder(abi_map[MiscFunctions.EXECUTE_WITH_DEADLINE], abi_map, abi_registry=abi_registry),
+            ],
+            _build_raw_function_decoders(abi_map, RouterFunction, abi_registry=raw_abi_registry),
+            _build_raw_function_decoders(abi_map, V4Actions, abi_registry=raw_abi_registry),
+        )
+        self._compact_input_decoder = _CompactInputDecoder(abi_map, raw_abi_registry)
+        self._columnar_decoder = _ColumnarDecoder(abi_map, raw_abi_registry, raw_addresses)
+        self._v4_decoder = self._web3_input_decoder.v4_decoder
+        self._functions_by_signature = {fn.signature: fn for fn in self._web3_input_decoder.functions()}
+        # execute() selectors -> True if the function has a deadline
+        self._execute_selectors = {
+            abi_map[MiscFunctions.EXECUTE].selector: False,
+            abi_map[MiscFunctions.EXECUTE_WITH_DEADLINE].selector: True,
+        }
+        # error indexes by abis, built on first use, the least recently used ones are evicted first
+        self._error_indexes: OrderedDict[tuple[str, ...], dict[bytes, list[_ErrorDecoder]]] = OrderedDict()
+        self._error_indexes_lock = Lock()
+
+    @overload
+    def function_input(
+            self,
+            input_data: InputData,
+            engine: Literal[DecodingEngine.WEB3] = ...,
+            *,
+            functions: Optional[Collection[Union[RouterFunction, V4Actions]]] = None,
+            fields: Optional[Mapping[Union[RouterFunction, V4Actions], Sequence[str]]] = None) -> DecodedInput:
+        ...
+
+    @overload
+    def function_input(
+            self,
+            input_data: InputData,
+            engine: Literal[DecodingEngine.RAW],
+            *,
+            functions: Optional[Collection[Union[RouterFunction, V4Actions]]] = None,
+            fields: Optional[Mapping[Union[RouterFunction, V4Actions], Sequence[str]]] = None) -> RawDecodedInput:
+        ...
+
+    @overload
+    def function_input(
+            self,
+            input_data: InputData,
+            engine: Literal[DecodingEngine.COMPACT],
+            *,
+            functions: Optional[Collection[Union[RouterFunction, V4Actions]]] = None,
+            fields: Optional[Mapping[Union[RouterFunction, V4Actions], Sequence[str]]] = None) -> CompactDecodedInput:
+        ...
 
-    def function_input(self, input_data: Union[HexStr, HexBytes]) -> DecodedInput:
+    def function_input(
+            self,
+            input_data: InputData,
+            engine: DecodingEngine = DecodingEngine.WEB3,
+            *,
+            functions: Optional[Collection[Union[RouterFunction, V4Actions]]] = None,
+            fields: Optional[Mapping[Union[RouterFunction, V4Actions], Sequence[str]]] = None,
+    ) -> Union[DecodedInput, RawDecodedInput, CompactDecodedInput]:
         """
         Decode the data sent to an UR function
 
+        :param input_data: the transaction 'input' data, as a hex string or any bytes-like object. A memoryview
+            (ex: from a CalldataCorpus) is read in place, only the execute() arguments are copied for eth_abi.
+        :param engine: DecodingEngine.WEB3 (default) returns web3 contract functions and checksum addresses.
+            DecodingEngine.RAW decodes directly with eth_abi, which is faster, and returns the function names instead,
+            with the addresses as returned by eth_abi (lower case), or as 20-byte bytes if the decoder has been built
+            with raw_addresses=True.
+            DecodingEngine.COMPACT decodes like RAW, but returns slotted objects (see CompactResult), which use much
+            less memory when many decoded inputs are kept.
+        :param functions: the commands (RouterFunction) and V4 actions (V4Actions) to decode. The other ones are
+            returned as raw bytes. Selecting V4 actions implies decoding the V4 commands. Default is everything.
+        :param fields: the parameters to decode for some commands or V4 actions, ex: {RouterFunction.V3_SWAP_EXACT_IN:
+            ["amountIn", "path"]}. The other parameters are not decoded. Default is all parameters.
+        :return: The decoded data if the function has been implemented. With a decode cache, the decoded data is
+            read-only: dicts are MappingProxyType and lists are tuples.
+        """
+        projection = _Projection(self._abi_map, functions, fields) if functions is not None or fields else None
+        if self.cache is None:
+            return self._decode_input(input_data, engine, projection)
+        options = self._cache_options(engine, functions, fields)
+        # the hex strings are parsed once, for the cache key and the decoding
+        data = _input_view(input_data)
+        return self.cache.get_or_decode(data, options, lambda: self._decode_input(data, engine, projection))
+
+    def _cache_options(
+            self,
+            engine: DecodingEngine,
+            functions: Optional[Collection[Union[RouterFunction, V4Actions]]] = None,
+            fields: Optional[Mapping[Union[RouterFunction, V4Actions], Sequence[str]]] = None) -> Hashable:
+        """
+        :return: the decoding options which are part of the decode cache key
+        """
+        return (
+            engine,
+            self.raw_addresses and engine is not DecodingEngine.WEB3,
+            frozenset(functions) if functions is not None else None,
+            frozenset((key, tuple(names)) for key, names in fields.items()) if fields else None,
+        )
+
+    def _decode_input(
+            self,
+            input_data: InputData,
+            engine: DecodingEngine,
+            projection: Optional[_Projection]) -> Union[DecodedInput, RawDecodedInput, CompactDecodedInput]:
+        if engine is DecodingEngine.RAW:
+            return self._raw_input_decoder.decode(input_data, projection)
+        if engine is DecodingEngine.COMPACT:
+            return self._compact_input_decoder.decode(input_data, projection)
+        return self._web3_input_decoder.decode(input_data, projection)
+
+    def command_summary(self, input_data: InputData) -> CommandSummary:
+        """
+        Extract the commands, the deadline and the position of the command inputs from the data sent to execute(),
+        reading only the ABI head words: none of the command inputs is decoded.
+        Much faster than function_input() to know which commands a transaction contains.
+
         :param input_data: the transaction 'input' data
-        :return: The decoded data if the function has been implemented.
+        :return: the command summary
         """
-        fct_name, decoded_input = self._router_contract.decode_function_input(input_data)
-        # returns (execute as basecontractfunction, {commands as bytes, inputs as seq of bytes, deadline as int})
-        command = decoded_input["commands"]
-        command_input = decoded_input["inputs"]
-        decoded_command_input: list[tuple[BaseContractFunction, dict[str, Any], dict[str, bool]]] = []
-        for i, b in enumerate(command):
-            # iterating over bytes produces integers
+        data = _input_view(input_data)
+        has_deadline = self._execute_selectors.get(bytes(data[:4]))
+        if has_deadline is None:
+            raise ValueError(f"Could not find any execute function with matching selector 0x{data[:4].hex()}")
+
+        # offsets in the ABI encoding are relative to the start of the arguments, just after the selector
+        commands_offset = 4 + _read_word(data, 4)
+        inputs_offset = 4 + _read_word(data, 36)
+        deadline = _read_word(data, 68) if has_deadline else None
+
+        commands_length = _read_word(data, commands_offset)
+        if commands_offset + 32 + commands_length > len(data):
+            raise ValueError(f"Input data too short: cannot read {commands_length} commands")
+        commands = bytes(data[commands_offset + 32:commands_offset + 32 + commands_length])
+
+        inputs_count = _read_word(data, inputs_offset)
+        if inputs_count < len(commands):
+            raise ValueError(f"Number of commands {len(commands)} is greater than number of inputs: {inputs_count}")
+        inputs_start = inputs_offset + 32
+        command_infos: list[CommandInfo] = []
+        for i, b in enumerate(commands):
+            input_offset = inputs_start + _read_word(data, inputs_start + 32 * i)
+            input_length = _read_word(data, input_offset)
+            if input_offset + 32 + input_length > len(data):
+                raise ValueError(f"Input data too short: cannot read the input of command {i}")
             command_function = b & RouterConstant.COMMAND_TYPE_MASK.value
-            try:
-                abi_mapping = self._abi_map[RouterFunction(command_function)]
-                if b == RouterFunction.V4_POSITION_MANAGER_CALL.value:
-                    data = command_input[i]
-                else:
-                    data = abi_mapping.selector + command_input[i]
-                sub_contract = self._w3.eth.contract(abi=abi_mapping.full_abi)
-                revert_on_fail = not bool(b & RouterConstant.FLAG_ALLOW_REVERT.value)
-                decoded_fct_name, decoded_fct_params = sub_contract.decode_function_input(data)
-                if b == RouterFunction.V4_SWAP.value:
-                    decoded_command_input.append(
-                        (
-                            decoded_fct_name,
-                            {
-                                "actions": decoded_fct_params["actions"],
-                                "params": self._v4_decoder.decode_v4_swap(
-                                    decoded_fct_params["actions"],
-                                    decoded_fct_params["params"],
-                                ),
-                            },
-                            {"revert_on_fail": revert_on_fail},
-                        )
-                    )
-                elif b == RouterFunction.V4_POSITION_MANAGER_CALL.value:
-                    decoded_command_input.append(
-                        (
-                            decoded_fct_name,
-                            {
-                                "unlockData": self._v4_decoder.decode_v4_pm_call(decoded_fct_params["unlockData"]),
-                                "deadline": decoded_fct_params["deadline"]
-                            },
-                            {"revert_on_fail": revert_on_fail},
-                        )
-                    )
-                else:
-                    decoded_command_input.append(
-                        (
-                            decoded_fct_name,
-                            decoded_fct_params,
-                            {"revert_on_fail": revert_on_fail}
-                        )
-                    )
+            if command_function in router_function_values:
+                command_function = RouterFunction(command_function)
+            command_infos.append(
+                CommandInfo(
+                    command_function,
+                    not bool(b & RouterConstant.FLAG_ALLOW_REVERT.value),
+                    input_offset + 32,
+                    input_length,
+                )
+            )
+        return CommandSummary(commands, deadline, tuple(command_infos))
 
-            except (ValueError, KeyError, DecodingError):
-                decoded_command_input.append(command_input[i].hex())
-        decoded_input["inputs"] = decoded_command_input
-        return fct_name, decoded_input
+    def swap_legs(self, input_data: InputData) -> list[SwapLeg]:
+        """
+        Extract the V2, V3 and V4 swaps of the data sent to execute() as a flat list of normalized swap legs,
+        one per hop, in the execution order. Only the swap commands and actions, and the V4 TAKE and TAKE_ALL actions
+        which give the V4 recipients, are decoded, with the RAW engine.
+        Addresses are checksummed, or 20-byte bytes if the decoder has been built with raw_addresses=True.
+
+        :param input_data: the transaction 'input' data
+        :return: the swap legs
+        """
+        _, decoded_input = self.function_input(input_data, DecodingEngine.RAW, functions=swap_leg_functions)
+        to_address: Callable[[Any], Any] = bytes if self.raw_addresses else to_checksum_address
+        return extract_swap_legs(decoded_input["commands"], decoded_input["inputs"], to_address)
+
+    @overload
+    def function_inputs(
+            self,
+            input_data_iterable: Iterable[InputData],
+            workers: Optional[int] = None,
+            chunksize: int = 64,
+            engine: Literal[DecodingEngine.WEB3] = ...) -> list[DecodedInput]:
+        ...
+
+    @overload
+    def function_inputs(
+            self,
+            input_data_iterable: Iterable[InputData],
+            workers: Optional[int] = None,
+            chunksize: int = 64,
+            *,
+            engine: Literal[DecodingEngine.RAW]) -> list[RawDecodedInput]:
+        ...
+
+    @overload
+    def function_inputs(
+            self,
+            input_data_iterable: Iterable[InputData],
+            workers: Optional[int] = None,
+            chunksize: int = 64,
+            *,
+            engine: Literal[DecodingEngine.COMPACT]) -> list[CompactDecodedInput]:
+        ...
+
+    def function_inputs(
+            self,
+            input_data_iterable: Iterable[InputData],
+            workers: Optional[int] = None,
+            chunksize: int = 64,
+            engine: DecodingEngine = DecodingEngine.WEB3,
+    ) -> Union[list[DecodedInput], list[RawDecodedInput], list[CompactDecodedInput]]:
+        """
+        Decode a batch of data sent to UR functions, spreading the work over several processes.
+        Each worker process builds its own decoder once, so neither the codec nor its Web3 instance are pickled.
+        With a decode cache, the cached inputs are read in the current process, and only the other ones are sent to the
+        workers. The inputs are read by windows of a few chunks per worker, so an iterable of inputs is not read at
+        once.
+
+        :param input_data_iterable: the transaction 'input' data to decode
+        :param workers: the number of worker processes. Default is the number of CPUs. With 0 or 1, the data is decoded
+            in the current process.
+        :param chunksize: the number of inputs sent at once to a worker process
+        :param engine: the decoding engine, see function_input()
+        :return: the decoded data, in the same order as the given inputs
+        """
+        if workers is not None and workers <= 1:
+            if engine is DecodingEngine.RAW:
+                return [self.function_input(input_data, DecodingEngine.RAW) for input_data in input_data_iterable]
+            if engine is DecodingEngine.COMPACT:
+                return [self.function_input(input_data, DecodingEngine.COMPACT) for input_data in input_data_iterable]
+            return [self.function_input(input_data) for input_data in input_data_iterable]
+
+        # executor.map() reads and submits all its inputs at once: it is given a window of inputs at a time
+        window_size = (workers or os.cpu_count() or 1) * chunksize * _chunks_per_worker
+        input_data_iterator = iter(input_data_iterable)
+        results: list[Any] = []
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.raw_addresses, )) as executor:
+            while window := list(islice(input_data_iterator, window_size)):
+                results.extend(self._decode_window(executor, window, chunksize, engine))
+        if engine is DecodingEngine.RAW:
+            return cast(list[RawDecodedInput], results)
+        if engine is DecodingEngine.COMPACT:
+            return cast(list[CompactDecodedInput], results)
+        return cast(list[DecodedInput], results)
+
+    def _decode_window(
+            self,
+            executor: ProcessPoolExecutor,
+            window: list[InputData],
+            chunksize: int,
+            engine: DecodingEngine) -> list[Any]:
+        """
+        :return: the decoded inputs of the window, read from the decode cache or decoded by the worker processes
+        """
+        options = self._cache_options(engine)
+        if self.cache is None:
+            results: list[Any] = [None] * len(window)
+        else:
+            results = [self.cache.get(_input_view(input_data), options) for input_data in window]
+        missing = [i for i, result in enumerate(results) if result is None]
+        # memoryviews cannot be pickled: they are copied to be sent to the worker processes
+        picklable_inputs = (
+            bytes(input_data) if isinstance(input_data, memoryview) else input_data
+            for input_data in (window[i] for i in missing)
+        )
+        decoded_inputs = executor.map(partial(_decode_in_worker, engine=engine), picklable_inputs, chunksize=chunksize)
+        for i, decoded_input in zip(missing, decoded_inputs):
+            if engine is DecodingEngine.WEB3:
+                decoded_input = _map_functions(decoded_input, self._get_function)
+            if self.cache is not None:
+                decoded_input = self.cache.put(_input_view(window[i]), options, decoded_input)
+            results[i] = decoded_input
+        return results
+
+    def columns(
+            self,
+            input_data_iterable: Iterable[InputData],
+            functions: Optional[Collection[RouterFunction]] = None) -> dict[RouterFunction, CommandColumns]:
+        """
+        Decode a batch of data sent to execute() into columnar tables, one per UR command, ready for bulk analytics.
+        Each table can be exported with to_arrow() (requires pyarrow) or to_numpy() (requires numpy).
+        The commands that cannot be decoded are skipped.
+
+        :param input_data_iterable: the transaction 'input' data to decode
+        :param functions: the commands to decode. Their tables are returned even if empty.
+            Default is all commands, with a table for each command found in the batch.
+        :return: the CommandColumns tables by command
+        """
+        return self._columnar_decoder.decode(input_data_iterable, functions)
+
+    @overload
+    def stream(
+            self,
+            fileobj: Iterable[str],
+            file_format: StreamFormat = StreamFormat.JSONL,
+            input_key: str = "input",
+            engine: Literal[DecodingEngine.WEB3] = ...,
+            stats: Optional[StreamStats] = None) -> Iterator[tuple[int, DecodedInput]]:
+        ...
+
+    @overload
+    def stream(
+            self,
+            fileobj: Iterable[str],
+            file_format: StreamFormat = StreamFormat.JSONL,
+            input_key: str = "input",
+            *,
+            engine: Literal[DecodingEngine.RAW],
+            stats: Optional[StreamStats] = None) -> Iterator[tuple[int, RawDecodedInput]]:
+        ...
+
+    @overload
+    def stream(
+            self,
+            fileobj: Iterable[str],
+            file_format: StreamFormat = StreamFormat.JSONL,
+            input_key: str = "input",
+            *,
+            engine: Literal[DecodingEngine.COMPACT],
+            stats: Optional[StreamStats] = None) -> Iterator[tuple[int, CompactDecodedInput]]:
+        ...
+
+    def stream(
+            self,
+            fileobj: Iterable[str],
+            file_format: StreamFormat = StreamFormat.JSONL,
+            input_key: str = "input",
+            engine: DecodingEngine = DecodingEngine.WEB3,
+            stats: Optional[StreamStats] = None,
+    ) -> Iterator[tuple[int, Union[DecodedInput, RawDecodedInput, CompactDecodedInput]]]:
+        """
+        Lazily read and decode a file of transaction inputs, one transaction per line.
+        The file is read line by line, so the memory usage does not depend on its size.
+        Malformed lines and inputs that cannot be decoded are skipped, and counted in stats.
+
+        :param fileobj: the file opened in text mode, or any iterable of lines
+        :param file_format: StreamFormat.JSONL (default) or StreamFormat.CSV (with a header line)
+        :param input_key: the JSON object key or the CSV column containing the input. Default is 'input'.
+        :param engine: the decoding engine, see function_input()
+        :param stats: optional StreamStats instance updated while the file is read
+        :return: an iterator of (line number, decoded input)
+        """
+        return decode_stream(
+            fileobj,
+            file_format,
+            input_key,
+            lambda input_data: self.function_input(input_data, engine),
+            stats,
+        )
+
+    @overload
+    def lazy_function_input(
+            self,
+            input_data: InputData,
+            engine: Literal[DecodingEngine.WEB3] = ...) -> DecodedInput:
+        ...
+
+    @overload
+    def lazy_function_input(
+            self,
+            input_data: InputData,
+            engine: Literal[DecodingEngine.RAW]) -> RawDecodedInput:
+        ...
+
+    def lazy_function_input(
+            self,
+            input_data: InputData,
+            engine: DecodingEngine = DecodingEngine.WEB3) -> Union[DecodedInput, RawDecodedInput]:
+        """
+        Decode the data sent to an UR function, but decode each command input only when it is first accessed.
+        Useful to screen transactions on their 'commands' without paying for a full decoding.
+
+        :param input_data: the transaction 'input' data
+        :param engine: the decoding engine, see function_input(). DecodingEngine.COMPACT is not supported.
+        :return: The decoded data, same as function_input(), but with 'inputs' being a LazyCommandInputs sequence
+            when the function is execute()
+        """
+        if engine is DecodingEngine.COMPACT:
+            raise ValueError("Lazy decoding is not supported by the COMPACT engine")
+        if engine is DecodingEngine.RAW:
+            return self._raw_input_decoder.decode_lazily(input_data)
+        return self._web3_input_decoder.decode_lazily(input_data)
 
     @staticmethod
-    def v3_path(v3_fn_name: str, path: Union[bytes, str]) -> tuple[Union[int, ChecksumAddress], ...]:
+    def _select_router_transactions(block: BlockData, router_addresses: Collection[str]) -> list[TxData]:
+        addresses = {address.lower() for address in router_addresses}
+        trxs = cast(Sequence[Union[TxData, HexBytes]], block.get("transactions", []))
+        selected: list[TxData] = []
+        for trx in trxs:
+            if isinstance(trx, HexBytes):
+                raise ValueError("The block must be fetched with full transactions")
+            if str(trx.get("to") or "").lower() in addresses:
+                selected.append(trx)
+        return selected
+
+    def _decode_block_transaction(self, trx: TxData) -> dict[str, Any]:
+        try:
+            return self._decode_transaction(trx)
+        except (ValueError, DecodingError):
+            # ex: plain ETH transfer to the router
+            result_trx: dict[str, Any] = dict(trx)
+            result_trx["decoded_input"] = None
+            return result_trx
+
+    def _cached_transaction(self, trx_hash: Union[HexBytes, HexStr]) -> Optional[TxData]:
+        if self.transaction_cache is None or self.transaction_cache_mode is not TransactionCacheMode.READ_THROUGH:
+            return None
+        return self.transaction_cache.get(bytes(HexBytes(trx_hash)))
+
+    def _above_finalized_block(self, trxs: Iterable[TxData]) -> bool:
+        """
+        :return: True if some transactions to cache are mined above the last known finalized block, which must then be
+            refreshed before caching them
+        """
+        if self.transaction_cache is None:
+            return False
+        block_numbers = (trx.get("blockNumber") for trx in trxs)
+        return any(number is not None and number > self._finalized_block_number for number in block_numbers)
+
+    def _finalized_refresh_due(self, trxs: Iterable[TxData]) -> bool:
+        """
+        :return: True if the finalized block must be refreshed before caching the transactions. It is refreshed at most
+            once per slot, and the refresh is claimed by the caller, so concurrent fetches do not repeat it.
+        """
+        if not self._above_finalized_block(trxs):
+            return False
+        now = time.monotonic()
+        if now - self._finalized_refresh_time < _finalized_refresh_interval:
+            return False
+        self._finalized_refresh_time = now
+        return True
+
+    def _cache_transaction(self, trx: TxData) -> TxData:
+        # only finalized transactions are cached: the block, and so the details, of pending or recently mined ones
+        # can still change with a reorg, and the cache would keep returning the stale ones
+        trx_hash = trx.get("hash")
+        block_number = trx.get("blockNumber")
+        if (
+                self.transaction_cache is not None
+                and trx_hash is not None
+                and block_number is not None
+                and block_number <= self._finalized_block_number):
+            self.transaction_cache.put(bytes(trx_hash), trx)
+        return trx
+
+    def _decode_transaction(self, trx: TxData) -> dict[str, Any]:
+        fct_name, decoded_input = self.function_input(trx.get("input", HexStr("0x")))
+        result_trx: dict[str, Any] = dict(trx)
+        result_trx["decoded_input"] = (fct_name, decoded_input)
+        return result_trx
+
+    def _get_function(self, signature: str) -> BaseContractFunction:
+        try:
+            return self._functions_by_signature[signature]
+        except KeyError:
+            # functions that are not decoded through the abi map (ie: UR functions other than execute())
+            return self._router_contract.get_function_by_signature(signature)
+
+    @overload
+    @staticmethod
+    def v3_path(
+            v3_fn_name: str,
+            path: Union[bytes, str],
+            checksum: Literal[True] = ...) -> tuple[Union[int, ChecksumAddress], ...]:
+        ...
+
+    @overload
+    @staticmethod
+    def v3_path(v3_fn_name: str, path: Union[bytes, str], checksum: Literal[False]) -> tuple[Union[int, bytes], ...]:
+        ...
+
+    @staticmethod
+    def v3_path(
+            v3_fn_name: str,
+            path: Union[bytes, str],
+            checksum: bool = True) -> tuple[Union[int, ChecksumAddress, bytes], ...]:
         """
         Decode a V3 router path
 
         :param v3_fn_name: V3_SWAP_EXACT_IN or V3_SWAP_EXACT_OUT only
         :param path: the V3 path as returned by decode_function_input() or decode_transaction()
+        :param checksum: True (default) to return the token addresses as checksum addresses,
+            False to return them as raw 20-byte addresses
         :return: a tuple of token addresses separated by the corresponding pool fees, first token being the 'in-token',
         last token being the 'out-token'
         """
-        valid_fn_names = ("V3_SWAP_EXACT_IN", "V3_SWAP_EXACT_OUT")
-        if v3_fn_name.upper() not in valid_fn_names:
-            raise ValueError(f"v3_fn_name must be in {valid_fn_names}")
-        path_str = path.hex() if isinstance(path, bytes) else str(path)
-        path_str = path_str[2:] if path_str.startswith("0x") else path_str
-        path_list: list[Union[int, ChecksumAddress]] = [Web3.to_checksum_address(path_str[0:40]), ]
-        parsed_remaining_path: list[list[Union[int, ChecksumAddress]]] = [
-            [
-                int(path_str[40:][i:i + 6], 16),
-                Web3.to_checksum_address(path_str[40:][i + 6:i + 46]),
-            ]
-            for i in range(0, len(path_str[40:]), 46)
-        ]
-        path_list.extend(list(chain.from_iterable(parsed_remaining_path)))
+        reverse = _is_v3_exact_out(v3_fn_name)
+        to_address: Callable[[bytes], Any] = to_checksum_address if checksum else bytes
+        return parse_v3_path(_v3_path_bytes(path), to_address, reverse)
 
-        if v3_fn_name.upper() == "V3_SWAP_EXACT_OUT":
-            path_list.reverse()
+    @overload
+    @staticmethod
+    def v3_paths(
+            v3_fn_name: str,
+            paths: Iterable[Union[bytes, str]],
+            checksum: Literal[True] = ...) -> list[tuple[Union[int, ChecksumAddress], ...]]:
+        ...
 
-        return tuple(path_list)
+    @overload
+    @staticmethod
+    def v3_paths(
+            v3_fn_name: str,
+            paths: Iterable[Union[bytes, str]],
+            checksum: Literal[False]) -> list[tuple[Union[int, bytes], ...]]:
+        ...
+
+    @staticmethod
+    def v3_paths(
+            v3_fn_name: str,
+            paths: Iterable[Union[bytes, str]],
+            checksum: bool = True) -> list[tuple[Any, ...]]:
+        """
+        Decode a batch of V3 router paths
+
+        :param v3_fn_name: V3_SWAP_EXACT_IN or V3_SWAP_EXACT_OUT only
+        :param paths: the V3 paths as returned by decode_function_input() or decode_transaction()
+        :param checksum: True (default) to return the token addresses as checksum addresses,
+            False to return them as raw 20-byte addresses
+        :return: the decoded paths, in the same order, see v3_path()
+        """
+        reverse = _is_v3_exact_out(v3_fn_name)
+        to_address: Callable[[bytes], Any] = to_checksum_address if checksum else bytes
+        return [parse_v3_path(_v3_path_bytes(path), to_address, reverse) for path in paths]
+
+    def _get_error_index(self, abis: tuple[str, ...]) -> dict[bytes, list[_ErrorDecoder]]:
+        # the abi strings cache their hash, and the default ones are compared by identity: the key lookup is cheap
+        with self._error_indexes_lock:
+            error_index = self._error_indexes.get(abis)
+            if error_index is not None:
+                self._error_indexes.move_to_end(abis)
+                return error_index
+
+        error_index = _build_error_index(abis)
+        with self._error_indexes_lock:
+            self._error_indexes[abis] = error_index
+            while len(self._error_indexes) > _max_error_indexes:
+                self._error_indexes.popitem(last=False)
+        return error_index
 
     def contract_error(
             self,
@@ -208,63 +1552,297 @@ class _BaseDecoder(Generic[W3]):
         :param abis: override the default abis which are permit2, v4 pool and position managers, and the UR
         :return: the decoded error if it's part of the abis, or 'Unknown error'
         """
-        for abi in abis:
+        error_index = self._get_error_index(tuple(abis))
+
+        data = HexBytes(contract_error)
+        for error_decoder in error_index.get(bytes(data[:4]), ()):
             try:
-                json_abi = json.loads(abi)
-                error_abi: list[ABIFunctionDict] = []
-                for item in json_abi:
-                    if item["type"].lower() == "error":
-                        item["type"] = "function"
-                        error_abi.append(item)
-                contract = self._w3.eth.contract(abi=error_abi)
-                error, params = contract.decode_function_input(contract_error)
-                return f"{error.fn_name}({','.join(build_abi_type_list(error.abi))})", params
-            except (ValueError, Web3Exception):
-                """The error is not defined in this ABI"""
+                return error_decoder.signature, error_decoder.decode(data[4:])
+            except DecodingError:
+                """The error data does not match this definition"""
         return "Unknown error", {}
 
 
 class Decoder(_BaseDecoder[Web3]):
-    def __init__(self, w3: Web3, abi_map: ABIMap) -> None:
-        super().__init__(w3, abi_map)
+    def __init__(
+            self,
+            w3: Web3,
+            abi_map: ABIMap,
+            abi_registry: ABIRegistry,
+            cache: Optional[DecodeCache] = None,
+            raw_addresses: bool = False,
+            transaction_cache: Optional[TransactionCache] = None,
+            transaction_cache_mode: TransactionCacheMode = TransactionCacheMode.READ_THROUGH) -> None:
+        super().__init__(w3, abi_map, abi_registry, cache, raw_addresses, transaction_cache, transaction_cache_mode)
 
     def transaction(self, trx_hash: Union[HexBytes, HexStr]) -> dict[str, Any]:
         """
         Get transaction details and decode the data used to call a UR function.
+        With a transaction cache, see TransactionCacheMode, the mined transactions are fetched once.
 
         ⚠ To use this method, the decoder must be built with a Web3 instance or a rpc endpoint address.
 
         :param trx_hash: the hash of the transaction sent to the UR
         :return: the transaction as a dict with the additional 'decoded_input' field
         """
-        trx = self._get_transaction(trx_hash)
-        fct_name, decoded_input = self.function_input(trx.get("input", HexStr("0x")))
-        result_trx: dict[str, Any] = dict(trx)
-        result_trx["decoded_input"] = (fct_name, decoded_input)
-        return result_trx
+        return self._decode_transaction(self._get_transaction(trx_hash))
+
+    def block(
+            self,
+            block_identifier: BlockIdentifier,
+            router_addresses: Collection[str] = (ur_address, )) -> list[dict[str, Any]]:
+        """
+        Get a block with its full transactions in one request, and decode the transactions sent to the UR.
+
+        ⚠ To use this method, the decoder must be built with a Web3 instance or a rpc endpoint address.
+
+        :param block_identifier: the block number, hash, or tag ('latest', ...)
+        :param router_addresses: the addresses of the Universal Routers. Default is the UR address on Mainnet.
+        :return: the transactions sent to the UR, in the block order, as dicts with the additional 'decoded_input'
+            field, which is None if the input data could not be decoded
+        """
+        block = self._w3.eth.get_block(block_identifier, full_transactions=True)
+        return [
+            self._decode_block_transaction(trx) for trx in self._select_router_transactions(block, router_addresses)
+        ]
+
+    def scan(
+            self,
+            start_block: int,
+            end_block: int,
+            checkpoint: Optional[Checkpoint] = None,
+            concurrency: int = 8,
+            router_addresses: Collection[str] = (ur_address, )) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+        """
+        Decode the UR transactions of a block range, fetching several blocks concurrently (in threads),
+        and yield them in the block order. With a checkpoint, the scan resumes after the last block done.
+
+        ⚠ To use this method, the decoder must be built with a Web3 instance or a rpc endpoint address.
+
+        :param start_block: the first block to scan
+        :param end_block: the last block to scan (included)
+        :param checkpoint: optional FileCheckpoint, SQLiteCheckpoint or any Checkpoint. A block is saved as done
+            when the next one is requested, ie once the caller has processed it.
+        :param concurrency: the maximum number of blocks fetched at the same time. Default is 8.
+        :param router_addresses: the addresses of the Universal Routers. Default is the UR address on Mainnet.
+        :return: an iterator of (block number, decoded UR transactions as returned by block())
+        """
+        return scan_blocks(
+            partial(self.block, router_addresses=router_addresses),
+            start_block,
+            end_block,
+            checkpoint,
+            concurrency,
+        )
 
     def _get_transaction(self, trx_hash: Union[HexBytes, HexStr]) -> TxData:
-        return self._w3.eth.get_transaction(trx_hash)
+        trx = self._cached_transaction(trx_hash)
+        if trx is None:
+            trx = self._w3.eth.get_transaction(trx_hash)
+            self._refresh_finalized_block([trx])
+            self._cache_transaction(trx)
+        return trx
+
+    def _refresh_finalized_block(self, trxs: Iterable[TxData]) -> None:
+        if self._finalized_refresh_due(trxs):
+            try:
+                self._finalized_block_number = self._w3.eth.get_block("finalized").get("number", -1)
+            except Exception:
+                pass  # ex: node without the 'finalized' tag: the recent transactions are not cached
 
 
 class AsyncDecoder(_BaseDecoder[AsyncWeb3[AsyncHTTPProvider]]):
-    def __init__(self, w3: AsyncWeb3[AsyncHTTPProvider], abi_map: ABIMap) -> None:
-        super().__init__(w3, abi_map)
+    def __init__(
+            self,
+            w3: AsyncWeb3[AsyncHTTPProvider],
+            abi_map: ABIMap,
+            abi_registry: ABIRegistry,
+            cache: Optional[DecodeCache] = None,
+            raw_addresses: bool = False,
+            transaction_cache: Optional[TransactionCache] = None,
+            transaction_cache_mode: TransactionCacheMode = TransactionCacheMode.READ_THROUGH) -> None:
+        super().__init__(w3, abi_map, abi_registry, cache, raw_addresses, transaction_cache, transaction_cache_mode)
 
     async def transaction(self, trx_hash: Union[HexBytes, HexStr]) -> dict[str, Any]:
         """
         Get transaction details and decode the data used to call a UR function.
+        With a transaction cache, see TransactionCacheMode, the mined transactions are fetched once.
 
         ⚠ To use this method, the decoder must be built with an AsyncWeb3 instance or a rpc endpoint address.
 
         :param trx_hash: the hash of the transaction sent to the UR
         :return: the transaction as a dict with the additional 'decoded_input' field
         """
-        trx = await self._get_transaction(trx_hash)
-        fct_name, decoded_input = self.function_input(trx.get("input", HexStr("0x")))
-        result_trx: dict[str, Any] = dict(trx)
-        result_trx["decoded_input"] = (fct_name, decoded_input)
-        return result_trx
+        return self._decode_transaction(await self._get_transaction(trx_hash))
+
+    async def transactions(
+            self,
+            trx_hashes: Iterable[Union[HexBytes, HexStr]],
+            concurrency: int = 16,
+            batch_size: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        Get the details of several transactions concurrently, and decode the data used to call a UR function
+        as soon as each transaction is received.
+
+        ⚠ To use this method, the decoder must be built with an AsyncWeb3 instance or a rpc endpoint address.
+
+        :param trx_hashes: the hashes of the transactions sent to the UR
+        :param concurrency: the maximum number of concurrent requests sent to the rpc endpoint. Default is 16.
+        :param batch_size: if given, the transactions are fetched by JSON-RPC batch requests of this size,
+            which the provider must support. Default is one request per transaction.
+        :return: the transactions as dicts with the additional 'decoded_input' field, in the same order as the hashes
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be positive: {concurrency}")
+        hashes = list(trx_hashes)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        if batch_size:
+            async def fetch_batch(batch_hashes: list[Union[HexBytes, HexStr]]) -> list[dict[str, Any]]:
+                async with semaphore:
+                    trxs = await self._get_transactions(batch_hashes)
+                return [self._decode_transaction(trx) for trx in trxs]
+
+            batches = await asyncio.gather(
+                *(fetch_batch(hashes[i:i + batch_size]) for i in range(0, len(hashes), batch_size))
+            )
+            return list(chain.from_iterable(batches))
+
+        async def fetch(trx_hash: Union[HexBytes, HexStr]) -> dict[str, Any]:
+            async with semaphore:
+                trx = await self._get_transaction(trx_hash)
+            return self._decode_transaction(trx)
+
+        return list(await asyncio.gather(*map(fetch, hashes)))
+
+    async def block(
+            self,
+            block_identifier: BlockIdentifier,
+            router_addresses: Collection[str] = (ur_address, )) -> list[dict[str, Any]]:
+        """
+        Get a block with its full transactions in one request, and decode the transactions sent to the UR.
+
+        ⚠ To use this method, the decoder must be built with an AsyncWeb3 instance or a rpc endpoint address.
+
+        :param block_identifier: the block number, hash, or tag ('latest', ...)
+        :param router_addresses: the addresses of the Universal Routers. Default is the UR address on Mainnet.
+        :return: the transactions sent to the UR, in the block order, as dicts with the additional 'decoded_input'
+            field, which is None if the input data could not be decoded
+        """
+        block = await self._w3.eth.get_block(block_identifier, full_transactions=True)
+        return [
+            self._decode_block_transaction(trx) for trx in self._select_router_transactions(block, router_addresses)
+        ]
+
+    def scan(
+            self,
+            start_block: int,
+            end_block: int,
+            checkpoint: Optional[Checkpoint] = None,
+            concurrency: int = 8,
+            router_addresses: Collection[str] = (ur_address, )) -> AsyncIterator[tuple[int, list[dict[str, Any]]]]:
+        """
+        Decode the UR transactions of a block range, fetching several blocks concurrently,
+        and yield them in the block order. With a checkpoint, the scan resumes after the last block done.
+
+        ⚠ To use this method, the decoder must be built with an AsyncWeb3 instance or a rpc endpoint address.
+
+        :param start_block: the first block to scan
+        :param end_block: the last block to scan (included)
+        :param checkpoint: optional FileCheckpoint, SQLiteCheckpoint or any Checkpoint. A block is saved as done
+            when the next one is requested, ie once the caller has processed it.
+        :param concurrency: the maximum number of blocks fetched at the same time. Default is 8.
+        :param router_addresses: the addresses of the Universal Routers. Default is the UR address on Mainnet.
+        :return: an async iterator of (block number, decoded UR transactions as returned by block())
+        """
+        return async_scan_blocks(
+            partial(self.block, router_addresses=router_addresses),
+            start_block,
+            end_block,
+            checkpoint,
+            concurrency,
+        )
+
+    def pending_transactions(
+            self,
+            websocket: Union[str, AsyncWeb3[WebSocketProvider]],
+            router_addresses: Collection[str] = (ur_address, ),
+            full_transactions: bool = True,
+            max_pending: int = 256) -> AsyncIterator[dict[str, Any]]:
+        """
+        Subscribe to the new pending transactions over a websocket, and yield the transactions sent to the UR
+        as soon as they are received and decoded.
+
+        :param websocket: the websocket rpc endpoint address (ex: 'wss://...'), or an AsyncWeb3 instance connected
+            with a WebSocketProvider, whose other subscriptions are ignored
+        :param router_addresses: the addresses of the Universal Routers. Default is the UR address on Mainnet.
+        :param full_transactions: True (default) to subscribe to the full pending transactions, which not all nodes
+            support. If False, only the hashes are received, and each transaction is then fetched on the websocket.
+        :param max_pending: the maximum number of decoded transactions waiting to be consumed. When it is reached,
+            the subscription is not read anymore until the caller catches up. Default is 256.
+        :return: an async iterator of the transactions as dicts with the additional 'decoded_input' field,
+            which is None if the input data could not be decoded
+        """
+        return decode_pending_transactions(
+            websocket,
+            router_addresses,
+            full_transactions,
+            max_pending,
+            self._decode_block_transaction,
+        )
 
     async def _get_transaction(self, trx_hash: Union[HexBytes, HexStr]) -> TxData:
-        return await self._w3.eth.get_transaction(trx_hash)
+        trx = self._cached_transaction(trx_hash)
+        if trx is None:
+            trx = await self._w3.eth.get_transaction(trx_hash)
+            await self._refresh_finalized_block([trx])
+            self._cache_transaction(trx)
+        return trx
+
+    async def _get_transactions(self, trx_hashes: Sequence[Union[HexBytes, HexStr]]) -> list[TxData]:
+        cached_trxs = [self._cached_transaction(trx_hash) for trx_hash in trx_hashes]
+        missing_hashes = [trx_hash for trx_hash, trx in zip(trx_hashes, cached_trxs) if trx is None]
+        if not missing_hashes:
+            return cast(list[TxData], cached_trxs)
+        # each batch runs in its own task, so concurrent batches do not share the provider batching context
+        async with self._w3.batch_requests() as batch:
+            for trx_hash in missing_hashes:
+                batch.add(self._w3.eth.get_transaction(trx_hash))
+            fetched_trxs = cast(list[TxData], await batch.async_execute())
+        await self._refresh_finalized_block(fetched_trxs)
+        fetched = iter(fetched_trxs)
+        return [trx if trx is not None else self._cache_transaction(next(fetched)) for trx in cached_trxs]
+
+    async def _refresh_finalized_block(self, trxs: Iterable[TxData]) -> None:
+        if self._finalized_refresh_due(trxs):
+            try:
+                self._finalized_block_number = (await self._w3.eth.get_block("finalized")).get("number", -1)
+            except Exception:
+                pass  # ex: node without the 'finalized' tag: the recent transactions are not cached
+
+
+_worker_decoder: Optional[Decoder] = None
+
+# number of chunks per worker process read at once from the inputs of function_inputs()
+_chunks_per_worker = 4
+
+
+def _init_worker(raw_addresses: bool) -> None:
+    global _worker_decoder
+    w3 = Web3()
+    abi_map_wrapper = ABIMapWrapper(w3)
+    _worker_decoder = Decoder(w3, abi_map_wrapper.abi_map, abi_map_wrapper.abi_registry, raw_addresses=raw_addresses)
+
+
+def _decode_in_worker(
+        input_data: Union[HexStr, bytes, bytearray],
+        engine: DecodingEngine) -> tuple[Union[str, BaseContractFunction], Mapping[str, Any]]:
+    if _worker_decoder is None:
+        raise RuntimeError("The worker decoder is not initialized")
+    if engine is DecodingEngine.RAW:
+        return _worker_decoder.function_input(input_data, DecodingEngine.RAW)
+    if engine is DecodingEngine.COMPACT:
+        # compact results are pickled with their class definition, see CompactResult.__reduce__()
+        return _worker_decoder.function_input(input_data, DecodingEngine.COMPACT)
+    # web3 functions cannot be pickled: they are sent back as signatures
+    return _map_functions(_worker_decoder.function_input(input_data), lambda fn: fn.signature)
@@ -19,6 +19,7 @@ from typing import (
     Union,
 )
 
+from eth_abi.codec import ABICodec
 from eth_account.account import SignedMessage
 from eth_utils import keccak
 from typing_extensions import Self
@@ -37,6 +38,7 @@ from web3.types import (
 )
 
 from uniswap_universal_router_decoder._abi_builder import ABIMap
+from uniswap_universal_router_decoder._checksum import to_checksum_address
 from uniswap_universal_router_decoder._constants import (
     ur_abi,
     ur_address,
@@ -91,10 +93,11 @@ AllowanceTransferDetails = TypedDict(
 
 
 class _BaseEncoder(Generic[W3]):
-    def __init__(self, w3: W3, abi_map: ABIMap) -> None:
+    def __init__(self, w3: W3, abi_map: ABIMap, abi_codec: ABICodec) -> None:
         self._w3 = w3
         self._router_contract = self._w3.eth.contract(abi=ur_abi)
         self._abi_map = abi_map
+        self._abi_codec = abi_codec
 
     @staticmethod
     def v3_path(v3_fn_name: str, path_seq: Sequence[Union[int, ChecksumAddress]]) -> bytes:
@@ -114,7 +117,7 @@ class _BaseEncoder(Generic[W3]):
         path = "0x"
         for i, item in enumerate(path_list):
             if i % 2 == 0:
-                _item = Web3.to_checksum_address(cast(ChecksumAddress, item))[2:]
+                _item = to_checksum_address(cast(ChecksumAddress, item))[2:]
             else:
                 _item = f"{item:06X}"
             path += _item
@@ -140,11 +143,11 @@ class _BaseEncoder(Generic[W3]):
         if int(currency_0, 16) > int(currency_1, 16):
             currency_0, currency_1 = currency_1, currency_0
         return PoolKey(
-            currency_0=Web3.to_checksum_address(currency_0),
-            currency_1=Web3.to_checksum_address(currency_1),
+            currency_0=to_checksum_address(currency_0),
+            currency_1=to_checksum_address(currency_1),
             fee=int(fee),
             tick_spacing=int(tick_spacing),
-            hooks=Web3.to_checksum_address(hooks),
+            hooks=to_checksum_address(hooks),
         )
 
     def v4_pool_id(self, pool_key: PoolKey) -> bytes:
@@ -156,7 +159,7 @@ class _BaseEncoder(Generic[W3]):
         """
         args = (tuple(pool_key.values()), )
         abi = self._abi_map[MiscFunctions.V4_POOL_ID]
-        return keccak(abi.encode(args))
+        return keccak(abi.encode(args, self._abi_codec))
 
     @staticmethod
     def v4_path_key(
@@ -176,23 +179,23 @@ class _BaseEncoder(Generic[W3]):
         :return: the corresponding PathKey
         """
         return PathKey(
-            intermediate_currency=Web3.to_checksum_address(intermediate_currency),
+            intermediate_currency=to_checksum_address(intermediate_currency),
             fee=int(fee),
             tick_spacing=int(tick_spacing),
-            hooks=Web3.to_checksum_address(hooks),
+            hooks=to_checksum_address(hooks),
             hook_data=hook_data,
         )
 
 
 class Encoder(_BaseEncoder[Web3]):
-    def __init__(self, w3: Web3, abi_map: ABIMap) -> None:
-        super().__init__(w3, abi_map)
+    def __init__(self, w3: Web3, abi_map: ABIMap, abi_codec: ABICodec) -> None:
+        super().__init__(w3, abi_map, abi_codec)
 
     def __call__(self):
         """
         :return: Initialize the chain of encoded functions
         """
-        return _ChainedFunctionBuilder(self._w3, self._abi_map)
+        return _ChainedFunctionBuilder(self._w3, self._abi_map, self._abi_codec)
 
     def chain(self) -> _ChainedFunctionBuilder:
         """
@@ -202,14 +205,14 @@ class Encoder(_BaseEncoder[Web3]):
 
 
 class AsyncEncoder(_BaseEncoder[AsyncWeb3[AsyncHTTPProvider]]):
-    def __init__(self, async_w3: AsyncWeb3[AsyncHTTPProvider], abi_map: ABIMap) -> None:
-        super().__init__(async_w3, abi_map)
+    def __init__(self, async_w3: AsyncWeb3[AsyncHTTPProvider], abi_map: ABIMap, abi_codec: ABICodec) -> None:
+        super().__init__(async_w3, abi_map, abi_codec)
 
     def __call__(self):
         """
         :return: Initialize the chain of encoded functions
         """
-        return _AsyncChainedFunctionBuilder(self._w3, self._abi_map)
+        return _AsyncChainedFunctionBuilder(self._w3, self._abi_map, self._abi_codec)
 
     def chain(self) -> _AsyncChainedFunctionBuilder:
         """
@@ -222,15 +225,16 @@ TChainedFunctionBuilder = TypeVar("TChainedFunctionBuilder", "_ChainedFunctionBu
 
 
 class _V4ChainedCommonFunctionBuilder(ABC, Generic[TChainedFunctionBuilder]):
-    def __init__(self, abi_map: ABIMap):
+    def __init__(self, abi_map: ABIMap, abi_codec: ABICodec):
         self._abi_map = abi_map
+        self._abi_codec = abi_codec
         self.actions: bytearray = bytearray()
         self.arguments: list[bytes] = []
 
     def _add_action(self, action: V4Actions, args: Sequence[Any]) -> None:
         abi = self._abi_map[action]
         self.actions.append(action.value)
-        self.arguments.append(abi.encode(args))
+        self.arguments.append(abi.encode(args, self._abi_codec))
 
     def settle(
             self,
@@ -268,8 +272,8 @@ class _V4ChainedCommonFunctionBuilder(ABC, Generic[TChainedFunctionBuilder]):
 
 
 class _BaseV4ChainedPositionFunctionBuilder(_V4ChainedCommonFunctionBuilder[TChainedFunctionBuilder]):
-    def __init__(self, abi_map: ABIMap) -> None:
-        super().__init__(abi_map)
+    def __init__(self, abi_map: ABIMap, abi_codec: ABICodec) -> None:
+        super().__init__(abi_map, abi_codec)
 
     def mint_position(
             self,
@@ -399,9 +403,9 @@ class _BaseV4ChainedPositionFunctionBuilder(_V4ChainedCommonFunctionBuilder[TCha
 
 
 class _V4ChainedPositionFunctionBuilder(_BaseV4ChainedPositionFunctionBuilder["_ChainedFunctionBuilder"]):
-    def __init__(self, builder: _ChainedFunctionBuilder, abi_map: ABIMap) -> None:
+    def __init__(self, builder: _ChainedFunctionBuilder, abi_map: ABIMap, abi_codec: ABICodec) -> None:
         self.builder = builder
-        super().__init__(abi_map)
+        super().__init__(abi_map, abi_codec)
 
     def build_v4_posm_call(self, deadline: int) -> _ChainedFunctionBuilder:
         """
@@ -412,7 +416,7 @@ class _V4ChainedPositionFunctionBuilder(_BaseV4ChainedPositionFunctionBuilder["_
         """
         action_values = (bytes(self.actions), self.arguments)
         abi = self._abi_map[MiscFunctions.UNLOCK_DATA]
-        encoded_data = abi.encode(action_values)
+        encoded_data = abi.encode(action_values, self._abi_codec)
         args = (encoded_data, deadline)
         self.builder._add_command(  # pyright:ignore[reportPrivateUsage]
             RouterFunction.V4_POSITION_MANAGER_CALL,
@@ -423,9 +427,9 @@ class _V4ChainedPositionFunctionBuilder(_BaseV4ChainedPositionFunctionBuilder["_
 
 
 class _AsyncV4ChainedPositionFunctionBuilder(_BaseV4ChainedPositionFunctionBuilder["_AsyncChainedFunctionBuilder"]):
-    def __init__(self, builder: _AsyncChainedFunctionBuilder, abi_map: ABIMap) -> None:
+    def __init__(self, builder: _AsyncChainedFunctionBuilder, abi_map: ABIMap, abi_codec: ABICodec) -> None:
         self.builder = builder
-        super().__init__(abi_map)
+        super().__init__(abi_map, abi_codec)
 
     def build_v4_posm_call(self, deadline: int) -> _AsyncChainedFunctionBuilder:
         """
@@ -436,7 +440,7 @@ class _AsyncV4ChainedPositionFunctionBuilder(_BaseV4ChainedPositionFunctionBuild
         """
         action_values = (bytes(self.actions), self.arguments)
         abi = self._abi_map[MiscFunctions.UNLOCK_DATA]
-        encoded_data = abi.encode(action_values)
+        encoded_data = abi.encode(action_values, self._abi_codec)
         args = (encoded_data, deadline)
         self.builder._add_command(  # pyright:ignore[reportPrivateUsage]
             RouterFunction.V4_POSITION_MANAGER_CALL,
@@ -602,9 +606,9 @@ class _BaseV4ChainedSwapFunctionBuilder(_V4ChainedCommonFunctionBuilder[TChained
 
 
 class _V4ChainedSwapFunctionBuilder(_BaseV4ChainedSwapFunctionBuilder["_ChainedFunctionBuilder"]):
-    def __init__(self, builder: _ChainedFunctionBuilder, abi_map: ABIMap) -> None:
+    def __init__(self, builder: _ChainedFunctionBuilder, abi_map: ABIMap, abi_codec: ABICodec) -> None:
         self.builder = builder
-        super().__init__(abi_map)
+        super().__init__(abi_map, abi_codec)
 
     def build_v4_swap(self) -> _ChainedFunctionBuilder:
         """
@@ -618,9 +622,9 @@ class _V4ChainedSwapFunctionBuilder(_BaseV4ChainedSwapFunctionBuilder["_ChainedF
 
 
 class _AsyncV4ChainedSwapFunctionBuilder(_BaseV4ChainedSwapFunctionBuilder["_AsyncChainedFunctionBuilder"]):
-    def __init__(self, builder: _AsyncChainedFunctionBuilder, abi_map: ABIMap) -> None:
+    def __init__(self, builder: _AsyncChainedFunctionBuilder, abi_map: ABIMap, abi_codec: ABICodec) -> None:
         self.builder = builder
-        super().__init__(abi_map)
+        super().__init__(abi_map, abi_codec)
 
     def build_v4_swap(self) -> _AsyncChainedFunctionBuilder:
         """
@@ -634,17 +638,19 @@ class _AsyncV4ChainedSwapFunctionBuilder(_BaseV4ChainedSwapFunctionBuilder["_Asy
 
 
 class _BasedChainedFunctionBuilder(Generic[W3]):
-    def __init__(self, w3: W3, abi_map: ABIMap):
+    def __init__(self, w3: W3, abi_map: ABIMap, abi_codec: ABICodec):
         self._w3 = w3
         self._router_contract = self._w3.eth.contract(abi=ur_abi)
         self._abi_map = abi_map
+        self._abi_codec = abi_codec
         self.commands: bytearray = bytearray()
         self.arguments: list[bytes] = []
 
     def _add_command(self, command: RouterFunction, args: Sequence[Any], add_selector: bool = False) -> None:
         abi = self._abi_map[command]
         self.commands.append(command.value)
-        arguments = abi.selector + abi.encode(args) if add_selector else abi.encode(args)
+        encoded_args = abi.encode(args, self._abi_codec)
+        arguments = abi.selector + encoded_args if add_selector else encoded_args
         self.arguments.append(arguments)
 
     @staticmethod
@@ -658,7 +664,7 @@ class _BasedChainedFunctionBuilder(Generic[W3]):
         }
         recipient = recipient_mapping[function_recipient]
         if recipient:
-            return Web3.to_checksum_address(recipient)
+            return to_checksum_address(recipient)
         else:
             raise ValueError(
                 f"Invalid function_recipient: {function_recipient} or custom_recipient: {custom_recipient}: "
@@ -1079,16 +1085,16 @@ class _BasedChainedFunctionBuilder(Generic[W3]):
         if deadline:
             execute_with_deadline_args = (bytes(self.commands), self.arguments, deadline)
             abi = self._abi_map[MiscFunctions.EXECUTE_WITH_DEADLINE]
-            return Web3.to_hex(abi.selector + abi.encode(execute_with_deadline_args))
+            return Web3.to_hex(abi.selector + abi.encode(execute_with_deadline_args, self._abi_codec))
         else:
             execute_args = (bytes(self.commands), self.arguments)
             abi = self._abi_map[MiscFunctions.EXECUTE]
-            return Web3.to_hex(abi.selector + abi.encode(execute_args))
+            return Web3.to_hex(abi.selector + abi.encode(execute_args, self._abi_codec))
 
 
 class _ChainedFunctionBuilder(_BasedChainedFunctionBuilder[Web3]):
-    def __init__(self, w3: Web3, abi_map: ABIMap):
-        super().__init__(w3, abi_map)
+    def __init__(self, w3: Web3, abi_map: ABIMap, abi_codec: ABICodec):
+        super().__init__(w3, abi_map, abi_codec)
 
     def v4_swap(self) -> _V4ChainedSwapFunctionBuilder:
         """
@@ -1096,14 +1102,14 @@ class _ChainedFunctionBuilder(_BasedChainedFunctionBuilder[Web3]):
 
         :return: The chain link corresponding to this function call.
         """
-        return _V4ChainedSwapFunctionBuilder(self, self._abi_map)
+        return _V4ChainedSwapFunctionBuilder(self, self._abi_map, self._abi_codec)
 
     def v4_posm_call(self) -> _V4ChainedPositionFunctionBuilder:
         """
         V4 - Start building a call to the V4 positon manager functions
         :return: The chain link corresponding to this function call.
         """
-        return _V4ChainedPositionFunctionBuilder(self, self._abi_map)
+        return _V4ChainedPositionFunctionBuilder(self, self._abi_map, self._abi_codec)
 
     def build_transaction(
             self,
@@ -1196,8 +1202,8 @@ class _ChainedFunctionBuilder(_BasedChainedFunctionBuilder[Web3]):
 
 
 class _AsyncChainedFunctionBuilder(_BasedChainedFunctionBuilder[AsyncWeb3[AsyncHTTPProvider]]):
-    def __init__(self, async_w3: AsyncWeb3[AsyncHTTPProvider], abi_map: ABIMap):
-        super().__init__(async_w3, abi_map)
+    def __init__(self, async_w3: AsyncWeb3[AsyncHTTPProvider], abi_map: ABIMap, abi_codec: ABICodec):
+        super().__init__(async_w3, abi_map, abi_codec)
 
     def v4_swap(self) -> _AsyncV4ChainedSwapFunctionBuilder:
         """
@@ -1205,14 +1211,14 @@ class _AsyncChainedFunctionBuilder(_BasedChainedFunctionBuilder[AsyncWeb3[AsyncH
 
         :return: The chain link corresponding to this function call.
         """
-        return _AsyncV4ChainedSwapFunctionBuilder(self, self._abi_map)
+        return _AsyncV4ChainedSwapFunctionBuilder(self, self._abi_map, self._abi_codec)
 
     def v4_posm_call(self) -> _AsyncV4ChainedPositionFunctionBuilder:
         """
         V4 - Start building a call to the V4 positon manager functions
         :return: The chain link corresponding to this function call.
         """
-        return _AsyncV4ChainedPositionFunctionBuilder(self, self._abi_map)
+        return _AsyncV4ChainedPositionFunctionBuilder(self, self._abi_map, self._abi_codec)
 
     async def build_transaction(
             self,
@@ -11,9 +11,15 @@ from enum import (
     auto,
     Enum,
 )
+from typing import (
+    cast,
+    TYPE_CHECKING,
+)
+
 
-from web3 import Web3
-from web3.types import Wei
+if TYPE_CHECKING:
+    from eth_typing import ChecksumAddress
+    from web3.types import Wei
 
 
 class RouterFunction(Enum):
@@ -36,6 +42,39 @@ class RouterFunction(Enum):
     V4_POSITION_MANAGER_CALL = 20
 
 
+class DecodingEngine(Enum):
+    """
+    WEB3: Decode with the web3 contract machinery: web3 contract functions, checksum addresses
+
+    RAW: Decode directly with eth_abi: function names, addresses as returned by eth_abi. Faster.
+
+    COMPACT: Same as RAW, but the results are slotted objects generated from the ABI map. Less memory.
+    """
+    WEB3 = auto()
+    RAW = auto()
+    COMPACT = auto()
+
+
+class StreamFormat(Enum):
+    """
+    JSONL: One JSON value per line: either the transaction input as a hex string, or an object containing it
+
+    CSV: CSV file with a header line, one of the columns containing the transaction input
+    """
+    JSONL = auto()
+    CSV = auto()
+
+
+class TransactionCacheMode(Enum):
+    """
+    READ_THROUGH: The transactions are read from the cache first, and the ones fetched from the rpc endpoint are stored
+
+    WRITE_THROUGH: The transactions are always fetched from the rpc endpoint and stored, to fill or refresh the cache
+    """
+    READ_THROUGH = auto()
+    WRITE_THROUGH = auto()
+
+
 class FunctionRecipient(Enum):
     """
     SENDER: When the function recipient is the sender
@@ -51,9 +90,9 @@ class FunctionRecipient(Enum):
 
 class RouterConstant(Enum):
     # https://github.com/Uniswap/universal-router/blob/main/contracts/libraries/Constants.sol
-    MSG_SENDER = Web3.to_checksum_address("0x0000000000000000000000000000000000000001")
-    ADDRESS_THIS = Web3.to_checksum_address("0x0000000000000000000000000000000000000002")
-    ROUTER_BALANCE = Wei(2**255)
+    MSG_SENDER = cast("ChecksumAddress", "0x0000000000000000000000000000000000000001")
+    ADDRESS_THIS = cast("ChecksumAddress", "0x0000000000000000000000000000000000000002")
+    ROUTER_BALANCE = cast("Wei", 2**255)
     FLAG_ALLOW_REVERT = 0x80
     COMMAND_TYPE_MASK = 0x3f
 
@@ -92,6 +131,15 @@ class V4Actions(Enum):
     TAKE = 0x0e
 
 
+class SwapProtocol(Enum):
+    """
+    Uniswap protocol version of a swap leg
+    """
+    V2 = "V2"
+    V3 = "V3"
+    V4 = "V4"
+
+
 class V4Constants(Enum):
     OPEN_DELTA = 0
     CONTRACT_BALANCE = 0x8000000000000000000000000000000000000000000000000000000000000000
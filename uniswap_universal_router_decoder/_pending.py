@@ -0,0 +1,90 @@
+"""
+Decoding of the pending transactions received over a websocket subscription, used by the Uniswap Universal Router Codec
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Collection,
+    Mapping,
+)
+from typing import (
+    Any,
+    cast,
+    Optional,
+    Union,
+)
+
+from web3 import (
+    AsyncWeb3,
+    WebSocketProvider,
+)
+from web3.exceptions import TransactionNotFound
+from web3.types import (
+    HexStr,
+    TxData,
+)
+
+
+async def decode_pending_transactions(
+        websocket: Union[str, AsyncWeb3[WebSocketProvider]],
+        router_addresses: Collection[str],
+        full_transactions: bool,
+        max_pending: int,
+        decode_transaction: Callable[[TxData], dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    """
+    Subscribe to the new pending transactions over a websocket, and yield the decoded transactions sent to the UR.
+    See decode.pending_transactions().
+
+    :param decode_transaction: the function decoding a transaction, which returns it as a dict with the additional
+        'decoded_input' field
+    :return: an async iterator of the decoded transactions
+    """
+    ws_w3 = AsyncWeb3(WebSocketProvider(websocket)) if isinstance(websocket, str) else websocket
+    if isinstance(websocket, str):
+        await ws_w3.provider.connect()
+    addresses = {address.lower() for address in router_addresses}
+    # bounded queue: the producer waits when the caller is too slow, None marks the end of the subscription
+    queue: asyncio.Queue[Union[dict[str, Any], Exception, None]] = asyncio.Queue(max_pending)
+
+    async def produce(subscription_id: HexStr) -> None:
+        try:
+            async for message in ws_w3.socket.process_subscriptions():
+                if message["subscription"] != subscription_id:
+                    continue  # another subscription of the caller's websocket
+                trx = message["result"]
+                if not isinstance(trx, Mapping):
+                    try:
+                        trx = await ws_w3.eth.get_transaction(cast(HexStr, trx))
+                    except TransactionNotFound:
+                        continue  # already dropped or replaced
+                trx = cast(TxData, trx)
+                if str(trx.get("to") or "").lower() in addresses:
+                    await queue.put(decode_transaction(trx))
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+
+    subscription_id: Optional[HexStr] = None
+    producer: Optional[asyncio.Task[None]] = None
+    try:
+        subscription_id = await ws_w3.eth.subscribe("newPendingTransactions", full_transactions)
+        producer = asyncio.create_task(produce(subscription_id))
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        if producer is not None and not producer.done():
+            # stopped by the caller while the subscription is still running
+            producer.cancel()
+            if subscription_id is not None:
+                await ws_w3.eth.unsubscribe(subscription_id)
+        if isinstance(websocket, str):
+            await ws_w3.provider.disconnect()
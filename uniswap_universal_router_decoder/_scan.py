@@ -0,0 +1,95 @@
+"""
+Ordered and resumable decoding of block ranges used by the Uniswap Universal Router Codec
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterator,
+)
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Any,
+    Optional,
+    TypeVar,
+)
+
+from uniswap_universal_router_decoder._checkpoint import Checkpoint
+
+
+T = TypeVar("T")
+
+
+def _scan_start(start_block: int, checkpoint: Optional[Checkpoint], concurrency: int) -> int:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be positive: {concurrency}")
+    last_block = checkpoint.load() if checkpoint else None
+    return start_block if last_block is None else max(start_block, last_block + 1)
+
+
+def scan_blocks(
+        decode_block: Callable[[int], T],
+        start_block: int,
+        end_block: int,
+        checkpoint: Optional[Checkpoint],
+        concurrency: int) -> Iterator[tuple[int, T]]:
+    """
+    Decode the blocks of a range in threads, and yield them in the block order. See decode.scan().
+
+    :param decode_block: the function fetching and decoding a block by number
+    :return: an iterator of (block number, decoded block)
+    """
+    next_block = _scan_start(start_block, checkpoint, concurrency)
+    pending: deque[tuple[int, Future[T]]] = deque()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            while pending or next_block <= end_block:
+                while next_block <= end_block and len(pending) < concurrency:
+                    pending.append((next_block, executor.submit(decode_block, next_block)))
+                    next_block += 1
+                block_number, future = pending.popleft()
+                yield block_number, future.result()
+                if checkpoint:
+                    checkpoint.save(block_number)
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+async def async_scan_blocks(
+        decode_block: Callable[[int], Coroutine[Any, Any, T]],
+        start_block: int,
+        end_block: int,
+        checkpoint: Optional[Checkpoint],
+        concurrency: int) -> AsyncIterator[tuple[int, T]]:
+    """
+    Decode the blocks of a range in tasks, and yield them in the block order. See decode.scan().
+
+    :param decode_block: the coroutine function fetching and decoding a block by number
+    :return: an async iterator of (block number, decoded block)
+    """
+    next_block = _scan_start(start_block, checkpoint, concurrency)
+    pending: deque[tuple[int, asyncio.Task[T]]] = deque()
+    try:
+        while pending or next_block <= end_block:
+            while next_block <= end_block and len(pending) < concurrency:
+                pending.append((next_block, asyncio.create_task(decode_block(next_block))))
+                next_block += 1
+            block_number, task = pending.popleft()
+            yield block_number, await task
+            if checkpoint:
+                checkpoint.save(block_number)
+    finally:
+        for _, task in pending:
+            task.cancel()
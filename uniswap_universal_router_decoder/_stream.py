@@ -0,0 +1,122 @@
+"""
+Lazy decoding of the files of transaction inputs (JSON lines or CSV) used by the Uniswap Universal Router Codec
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+)
+import csv
+from dataclasses import dataclass
+import json
+from typing import (
+    Any,
+    cast,
+    Optional,
+    TypeVar,
+)
+
+from eth_abi.exceptions import DecodingError
+from hexbytes import HexBytes
+
+from uniswap_universal_router_decoder._enums import StreamFormat
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class StreamStats:
+    """
+    Counters updated by decode.stream() while reading a file:
+
+    lines: number of non-empty lines (or CSV rows) read
+
+    decoded: number of inputs successfully decoded and yielded
+
+    malformed: number of skipped lines that could not be parsed or do not contain a valid hex input
+
+    undecodable: number of skipped inputs that could not be decoded
+    """
+    lines: int = 0
+    decoded: int = 0
+    malformed: int = 0
+    undecodable: int = 0
+
+
+def _parse_jsonl(fileobj: Iterable[str], input_key: str) -> Iterator[tuple[int, Optional[str]]]:
+    for line_number, line in enumerate(fileobj, start=1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError:
+            yield line_number, None
+            continue
+        if isinstance(value, dict):
+            value = cast(dict[str, Any], value).get(input_key)
+        yield line_number, value if isinstance(value, str) else None
+
+
+def _parse_csv(fileobj: Iterable[str], input_key: str) -> Iterator[tuple[int, Optional[str]]]:
+    reader = csv.DictReader(fileobj)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error:
+            yield reader.line_num, None
+            continue
+        yield reader.line_num, row.get(input_key)
+
+
+def _parse_stream(
+        fileobj: Iterable[str],
+        file_format: StreamFormat,
+        input_key: str) -> Iterator[tuple[int, Optional[HexBytes]]]:
+    """
+    Lazily read the transaction inputs from a file
+
+    :return: an iterator of (line number, input), input being None if the line is malformed
+    """
+    parse = _parse_csv if file_format is StreamFormat.CSV else _parse_jsonl
+    for line_number, value in parse(fileobj, input_key):
+        try:
+            yield line_number, HexBytes(value) if value else None
+        except ValueError:
+            yield line_number, None
+
+
+def decode_stream(
+        fileobj: Iterable[str],
+        file_format: StreamFormat,
+        input_key: str,
+        decode: Callable[[HexBytes], T],
+        stats: Optional[StreamStats] = None) -> Iterator[tuple[int, T]]:
+    """
+    Lazily read and decode a file of transaction inputs, skipping and counting the malformed lines and the inputs that
+    cannot be decoded. See decode.stream().
+
+    :param decode: the function decoding an input
+    :return: an iterator of (line number, decoded input)
+    """
+    stats = stats if stats is not None else StreamStats()
+    for line_number, input_data in _parse_stream(fileobj, file_format, input_key):
+        stats.lines += 1
+        if input_data is None:
+            stats.malformed += 1
+            continue
+        try:
+            decoded_input = decode(input_data)
+        except (ValueError, DecodingError):
+            stats.undecodable += 1
+            continue
+        stats.decoded += 1
+        yield line_number, decoded_input
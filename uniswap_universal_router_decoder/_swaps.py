@@ -0,0 +1,305 @@
+"""
+Normalized swap legs extracted from the decoded inputs of the Uniswap Universal Router Codec
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from collections.abc import (
+    Callable,
+    Mapping,
+    Sequence,
+)
+from dataclasses import (
+    dataclass,
+    replace,
+)
+from typing import (
+    Any,
+    Optional,
+    Union,
+)
+
+from uniswap_universal_router_decoder._enums import (
+    FunctionRecipient,
+    RouterConstant,
+    RouterFunction,
+    SwapProtocol,
+    V4Actions,
+)
+
+
+@dataclass(frozen=True)
+class SwapLeg:
+    """
+    One hop of a swap, ie a swap in a single pool
+
+    command_index: index of the swap command in the execute() commands
+
+    action_index: index of the swap action in the V4_SWAP actions, None for V2 and V3 swaps
+
+    hop_index: index of the hop in the swap path, 0 for the first or only hop
+
+    protocol, function: the Uniswap version and the command or V4 action of the swap
+
+    exact_input: True for the exact input swaps, False for the exact output ones
+
+    token_in, token_out: the sold and bought tokens (or "0x0000000000000000000000000000000000000000" for ETH in V4)
+
+    amount_in: the exact input amount, or the maximum input amount, set on the first hop only
+
+    amount_out: the minimum output amount, or the exact output amount, set on the last hop only
+
+    fee: the pool fee in percentage * 10000 (ex: 3000 for 0.3%), None for V2 swaps
+
+    tick_spacing, hooks: the V4 pool key elements not given by the tokens and the fee, None for V2 and V3 swaps
+
+    recipient: who receives the swap output, set on the last hop only: the command recipient for V2 and V3 swaps,
+    the TAKE or TAKE_ALL recipient of the bought token in the same V4_SWAP command for V4 swaps, if any.
+    """
+    command_index: int
+    action_index: Optional[int]
+    hop_index: int
+    protocol: SwapProtocol
+    function: Union[RouterFunction, V4Actions]
+    exact_input: bool
+    token_in: Any
+    token_out: Any
+    amount_in: Optional[int]
+    amount_out: Optional[int]
+    fee: Optional[int]
+    tick_spacing: Optional[int] = None
+    hooks: Any = None
+    recipient: Optional[FunctionRecipient] = None
+
+
+# functions to decode to extract the swap legs
+swap_leg_functions = (
+    RouterFunction.V2_SWAP_EXACT_IN,
+    RouterFunction.V2_SWAP_EXACT_OUT,
+    RouterFunction.V3_SWAP_EXACT_IN,
+    RouterFunction.V3_SWAP_EXACT_OUT,
+    V4Actions.SWAP_EXACT_IN_SINGLE,
+    V4Actions.SWAP_EXACT_IN,
+    V4Actions.SWAP_EXACT_OUT_SINGLE,
+    V4Actions.SWAP_EXACT_OUT,
+    V4Actions.TAKE,
+    V4Actions.TAKE_ALL,
+)
+
+_command_protocols = {
+    RouterFunction.V2_SWAP_EXACT_IN: (SwapProtocol.V2, True),
+    RouterFunction.V2_SWAP_EXACT_OUT: (SwapProtocol.V2, False),
+    RouterFunction.V3_SWAP_EXACT_IN: (SwapProtocol.V3, True),
+    RouterFunction.V3_SWAP_EXACT_OUT: (SwapProtocol.V3, False),
+}
+router_function_values = frozenset(fn.value for fn in RouterFunction)
+_v4_action_values = frozenset(action.value for action in V4Actions)
+
+
+def check_v3_path_length(path: bytes) -> None:
+    """
+    :param path: the encoded V3 path
+    :raise ValueError: if the path is not a 20-byte address followed by 23-byte fee and address segments
+    """
+    size = len(path)
+    if size < 20 or (size - 20) % 23:
+        raise ValueError(f"Invalid V3 path length: {size} bytes")
+
+
+def parse_v3_path(path: bytes, to_address: Callable[[bytes], Any], reverse: bool) -> tuple[Any, ...]:
+    """
+    Walk the V3 path: a 20-byte address, then 3-byte fee and 20-byte address segments
+
+    :param path: the encoded V3 path
+    :param to_address: conversion of the raw 20-byte addresses
+    :param reverse: True to return the path from the last token to the first one
+    :return: the token addresses separated by the pool fees
+    """
+    check_v3_path_length(path)
+    parsed: list[Any] = [to_address(path[:20])]
+    for i in range(20, len(path), 23):
+        parsed.append(int.from_bytes(path[i:i + 3], "big"))
+        parsed.append(to_address(path[i + 3:i + 23]))
+    if reverse:
+        parsed.reverse()
+    return tuple(parsed)
+
+
+def _recipient_kind(recipient: Union[str, bytes]) -> FunctionRecipient:
+    value = int(recipient, 16) if isinstance(recipient, str) else int.from_bytes(recipient, "big")
+    if value == int(RouterConstant.MSG_SENDER.value, 16):
+        return FunctionRecipient.SENDER
+    if value == int(RouterConstant.ADDRESS_THIS.value, 16):
+        return FunctionRecipient.ROUTER
+    return FunctionRecipient.CUSTOM
+
+
+def _amounts(hop_index: int, hop_count: int, amount_in: int, amount_out: int) -> tuple[Optional[int], Optional[int]]:
+    return amount_in if hop_index == 0 else None, amount_out if hop_index == hop_count - 1 else None
+
+
+class _SwapLegExtractor:
+    def __init__(self, to_address: Callable[[Any], Any]) -> None:
+        self._to_address = to_address
+        self.legs: list[SwapLeg] = []
+
+    def add_command(self, command_index: int, fn: RouterFunction, args: Mapping[str, Any]) -> None:
+        protocol, exact_input = _command_protocols[fn]
+        if exact_input:
+            amount_in, amount_out = args["amountIn"], args["amountOutMin"]
+        else:
+            amount_in, amount_out = args["amountInMax"], args["amountOut"]
+        recipient = _recipient_kind(args["recipient"])
+
+        fees: Sequence[Optional[int]]
+        if protocol is SwapProtocol.V2:
+            tokens = [self._to_address(token) for token in args["path"]]
+            fees = [None] * (len(tokens) - 1)
+        else:
+            # the exact output V3 paths are encoded from the last token to the first one
+            parsed_path = parse_v3_path(args["path"], self._to_address, not exact_input)
+            tokens, fees = list(parsed_path[::2]), parsed_path[1::2]
+
+        hop_count = len(fees)
+        for i, fee in enumerate(fees):
+            hop_amount_in, hop_amount_out = _amounts(i, hop_count, amount_in, amount_out)
+            self.legs.append(
+                SwapLeg(
+                    command_index,
+                    None,
+                    i,
+                    protocol,
+                    fn,
+                    exact_input,
+                    tokens[i],
+                    tokens[i + 1],
+                    hop_amount_in,
+                    hop_amount_out,
+                    fee,
+                    recipient=recipient if i == hop_count - 1 else None,
+                )
+            )
+
+    def add_v4_swap(self, command_index: int, actions: bytes, params: Sequence[Any]) -> None:
+        # recipients of the bought tokens, by token
+        recipients: dict[Any, FunctionRecipient] = {}
+        v4_legs: list[SwapLeg] = []
+        for action_index, (action, param) in enumerate(zip(actions, params)):
+            if action not in _v4_action_values or isinstance(param, (str, bytes)):
+                continue  # unknown, undecoded or not extracted action
+            v4_action = V4Actions(action)
+            args = param[1]
+            if v4_action is V4Actions.TAKE:
+                recipients.setdefault(self._to_address(args["currency"]), _recipient_kind(args["recipient"]))
+            elif v4_action is V4Actions.TAKE_ALL:
+                recipients.setdefault(self._to_address(args["currency"]), FunctionRecipient.SENDER)
+            elif v4_action in (V4Actions.SWAP_EXACT_IN_SINGLE, V4Actions.SWAP_EXACT_OUT_SINGLE):
+                v4_legs.append(self._v4_single_leg(command_index, action_index, v4_action, args))
+            else:
+                v4_legs.extend(self._v4_multi_hop_legs(command_index, action_index, v4_action, args["params"]))
+
+        for leg in v4_legs:
+            if leg.amount_out is not None and leg.token_out in recipients:
+                # the last hop: its output is taken in the same command
+                leg = replace(leg, recipient=recipients[leg.token_out])
+            self.legs.append(leg)
+
+    def _v4_single_leg(
+            self,
+            command_index: int,
+            action_index: int,
+            v4_action: V4Actions,
+            args: Mapping[str, Any]) -> SwapLeg:
+        exact_input = v4_action is V4Actions.SWAP_EXACT_IN_SINGLE
+        params = args["exact_in_single_params" if exact_input else "exact_out_single_params"]
+        pool_key = params["PoolKey"]
+        currency_0, currency_1 = self._to_address(pool_key["currency0"]), self._to_address(pool_key["currency1"])
+        token_in, token_out = (currency_0, currency_1) if params["zeroForOne"] else (currency_1, currency_0)
+        if exact_input:
+            amount_in, amount_out = params["amountIn"], params["amountOutMinimum"]
+        else:
+            amount_in, amount_out = params["amountInMaximum"], params["amountOut"]
+        return SwapLeg(
+            command_index,
+            action_index,
+            0,
+            SwapProtocol.V4,
+            v4_action,
+            exact_input,
+            token_in,
+            token_out,
+            amount_in,
+            amount_out,
+            pool_key["fee"],
+            pool_key["tickSpacing"],
+            self._to_address(pool_key["hooks"]),
+        )
+
+    def _v4_multi_hop_legs(
+            self,
+            command_index: int,
+            action_index: int,
+            v4_action: V4Actions,
+            params: Mapping[str, Any]) -> list[SwapLeg]:
+        path_keys = params["PathKeys"]
+        intermediate_currencies = [self._to_address(path_key["intermediateCurrency"]) for path_key in path_keys]
+        exact_input = v4_action is V4Actions.SWAP_EXACT_IN
+        if exact_input:
+            # path_keys[i] is the pool between the input token of the hop i and its intermediate currency
+            tokens = [self._to_address(params["currencyIn"])] + intermediate_currencies
+            amount_in, amount_out = params["amountIn"], params["amountOutMinimum"]
+        else:
+            # path_keys[i] is the pool between its intermediate currency and the output token of the hop i
+            tokens = intermediate_currencies + [self._to_address(params["currencyOut"])]
+            amount_in, amount_out = params["amountInMaximum"], params["amountOut"]
+
+        legs: list[SwapLeg] = []
+        hop_count = len(path_keys)
+        for i, path_key in enumerate(path_keys):
+            hop_amount_in, hop_amount_out = _amounts(i, hop_count, amount_in, amount_out)
+            legs.append(
+                SwapLeg(
+                    command_index,
+                    action_index,
+                    i,
+                    SwapProtocol.V4,
+                    v4_action,
+                    exact_input,
+                    tokens[i],
+                    tokens[i + 1],
+                    hop_amount_in,
+                    hop_amount_out,
+                    path_key["fee"],
+                    path_key["tickSpacing"],
+                    self._to_address(path_key["hooks"]),
+                )
+            )
+        return legs
+
+
+def extract_swap_legs(
+        commands: bytes,
+        inputs: Sequence[Any],
+        to_address: Callable[[Any], Any]) -> list[SwapLeg]:
+    """
+    Walk the command inputs decoded by the RAW engine and extract their swap legs, in the execution order
+
+    :param commands: the execute() commands
+    :param inputs: the command inputs, decoded by the RAW engine
+    :param to_address: conversion of the decoded addresses
+    :return: the swap legs
+    """
+    extractor = _SwapLegExtractor(to_address)
+    for command_index, (b, command_input) in enumerate(zip(commands, inputs)):
+        command_function = b & RouterConstant.COMMAND_TYPE_MASK.value
+        if command_function not in router_function_values or isinstance(command_input, (str, bytes)):
+            continue  # unknown, undecoded or not extracted command
+        fn = RouterFunction(command_function)
+        if fn in _command_protocols:
+            extractor.add_command(command_index, fn, command_input[1])
+        elif fn is RouterFunction.V4_SWAP:
+            extractor.add_v4_swap(command_index, command_input[1]["actions"], command_input[1]["params"])
+    return extractor.legs
@@ -0,0 +1,112 @@
+"""
+On-disk cache of the transactions fetched by the Uniswap Universal Router Codec decoders
+
+* Author: Elnaril (elnaril_dev@caramail.com, https://github.com/Elnaril).
+* License: MIT.
+* Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import pickle
+import sqlite3
+from threading import Lock
+from types import TracebackType
+from typing import (
+    cast,
+    Optional,
+    Protocol,
+    TYPE_CHECKING,
+    Union,
+)
+
+
+if TYPE_CHECKING:
+    from web3.types import TxData
+
+
+class TransactionCache(Protocol):
+    """
+    Store the transactions fetched from the rpc endpoint by hash. Any object with these 2 methods can be used.
+    Only the transactions of finalized blocks are given to put(): they cannot change anymore.
+    """
+    def get(self, trx_hash: bytes) -> Optional[TxData]:
+        """
+        :param trx_hash: the 32-byte transaction hash
+        :return: the cached transaction, or None if it is not in the cache
+        """
+        ...
+
+    def put(self, trx_hash: bytes, trx: TxData) -> None:
+        """
+        :param trx_hash: the 32-byte transaction hash
+        :param trx: the transaction, as returned by the rpc endpoint
+        """
+        ...
+
+
+class SQLiteTransactionCache:
+    """
+    Transaction cache stored in a SQLite database, in the 'transactions' table, with the transactions pickled as they
+    are returned by web3. Only use a database you created: unpickling data from an untrusted source is not safe.
+    The connection is shared by the threads and closed with close() or at the end of a 'with' block.
+    """
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS transactions (hash BLOB PRIMARY KEY, trx BLOB NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM transactions").fetchone()[0])
+
+    def __repr__(self) -> str:
+        return f"SQLiteTransactionCache(path='{self.path}', hits={self.hits}, misses={self.misses})"
+
+    def __enter__(self) -> SQLiteTransactionCache:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    def get(self, trx_hash: bytes) -> Optional[TxData]:
+        with self._lock:
+            row = self._connection.execute("SELECT trx FROM transactions WHERE hash = ?", (trx_hash, )).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return cast("TxData", pickle.loads(row[0]))
+
+    def put(self, trx_hash: bytes, trx: TxData) -> None:
+        data = pickle.dumps(trx, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO transactions (hash, trx) VALUES (?, ?)", (trx_hash, data))
+
+    def clear(self) -> None:
+        """
+        Remove all cached transactions and reset the hit and miss counters
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM transactions")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """
+        Close the database connection
+        """
+        with self._lock:
+            self._connection.close()
@@ -29,6 +29,7 @@ from web3.types import (
 )
 
 from uniswap_universal_router_decoder._abi_builder import ABIMapWrapper
+from uniswap_universal_router_decoder._cache import DecodeCache
 from uniswap_universal_router_decoder._constants import (
     permit2_abi,
     permit2_address,
@@ -45,6 +46,8 @@ from uniswap_universal_router_decoder._encoder import (
     AsyncEncoder,
     Encoder,
 )
+from uniswap_universal_router_decoder._enums import TransactionCacheMode
+from uniswap_universal_router_decoder._transaction_cache import TransactionCache
 
 
 __author__ = "Elnaril"
@@ -192,7 +195,11 @@ class RouterCodec(_BaseRouterCodec):
     def __init__(
             self,
             w3: Optional[Web3] = None,
-            rpc_endpoint: Optional[str] = None) -> None:
+            rpc_endpoint: Optional[str] = None,
+            decode_cache: Optional[DecodeCache] = None,
+            raw_addresses: bool = False,
+            transaction_cache: Optional[TransactionCache] = None,
+            transaction_cache_mode: TransactionCacheMode = TransactionCacheMode.READ_THROUGH) -> None:
         if w3:
             _w3 = w3
         elif rpc_endpoint:
@@ -200,9 +207,18 @@ class RouterCodec(_BaseRouterCodec):
         else:
             _w3 = Web3()
         self._w3 = _w3
-        self._abi_map = ABIMapWrapper(self._w3).abi_map
-        self.decode = Decoder(self._w3, self._abi_map)
-        self.encode = Encoder(self._w3, self._abi_map)
+        abi_map_wrapper = ABIMapWrapper(self._w3)
+        self._abi_map = abi_map_wrapper.abi_map
+        self.decode = Decoder(
+            self._w3,
+            self._abi_map,
+            abi_map_wrapper.abi_registry,
+            decode_cache,
+            raw_addresses,
+            transaction_cache,
+            transaction_cache_mode,
+        )
+        self.encode = Encoder(self._w3, self._abi_map, abi_map_wrapper.abi_codec)
 
     def fetch_permit2_allowance(
             self,
@@ -235,7 +251,11 @@ class AsyncRouterCodec(_BaseRouterCodec):
     def __init__(
             self,
             async_w3: Optional[AsyncWeb3[AsyncHTTPProvider]] = None,
-            rpc_endpoint: Optional[str] = None) -> None:
+            rpc_endpoint: Optional[str] = None,
+            decode_cache: Optional[DecodeCache] = None,
+            raw_addresses: bool = False,
+            transaction_cache: Optional[TransactionCache] = None,
+            transaction_cache_mode: TransactionCacheMode = TransactionCacheMode.READ_THROUGH) -> None:
         if async_w3:
             _async_w3 = async_w3
         elif rpc_endpoint:
@@ -243,9 +263,18 @@ class AsyncRouterCodec(_BaseRouterCodec):
         else:
             _async_w3: AsyncWeb3[AsyncHTTPProvider] = AsyncWeb3()
         self._w3 = _async_w3
-        self._abi_map = ABIMapWrapper(self._w3).abi_map
-        self.decode = AsyncDecoder(self._w3, self._abi_map)
-        self.encode = AsyncEncoder(self._w3, self._abi_map)
+        abi_map_wrapper = ABIMapWrapper(self._w3)
+        self._abi_map = abi_map_wrapper.abi_map
+        self.decode = AsyncDecoder(
+            self._w3,
+            self._abi_map,
+            abi_map_wrapper.abi_registry,
+            decode_cache,
+            raw_addresses,
+            transaction_cache,
+            transaction_cache_mode,
+        )
+        self.encode = AsyncEncoder(self._w3, self._abi_map, abi_map_wrapper.abi_codec)
 
     async def fetch_permit2_allowance(
             self,
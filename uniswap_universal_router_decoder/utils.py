@@ -5,6 +5,8 @@ Collection of utility functions used by the Uniswap Universal Router Codec
 * License: MIT.
 * Doc: https://github.com/Elnaril/uniswap-universal-router-decoder
 """
+from __future__ import annotations
+
 from collections.abc import Sequence
 from math import (
     ceil,
@@ -12,18 +14,9 @@ from math import (
     log10,
 )
 from statistics import quantiles
-from typing import cast
-
-from web3 import (
-    AsyncHTTPProvider,
-    AsyncWeb3,
-    Web3,
-)
-from web3.types import (
-    BlockData,
-    BlockIdentifier,
-    TxData,
-    Wei,
+from typing import (
+    cast,
+    TYPE_CHECKING,
 )
 
 from uniswap_universal_router_decoder._constants import (
@@ -35,6 +28,20 @@ from uniswap_universal_router_decoder._constants import (
 from uniswap_universal_router_decoder._enums import TransactionSpeed
 
 
+if TYPE_CHECKING:
+    from web3 import (
+        AsyncHTTPProvider,
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.types import (
+        BlockData,
+        BlockIdentifier,
+        TxData,
+        Wei,
+    )
+
+
 _speed_multiplier = {
     TransactionSpeed.SLOW: 1,
     TransactionSpeed.AVERAGE: 1,
@@ -90,7 +97,7 @@ def _compute_gas_fees(
         block: BlockData,
         trx_speed: TransactionSpeed = TransactionSpeed.FAST,
         block_identifier: BlockIdentifier = "latest") -> tuple[Wei, Wei]:
-    transactions = cast(Sequence[TxData], block.get("transactions", []))
+    transactions = cast("Sequence[TxData]", block.get("transactions", []))
     tips = [
         int(trx.get("maxPriorityFeePerGas", 0))
         for trx
@@ -111,7 +118,7 @@ def _compute_gas_fees(
         )
     max_fee_per_gas = int(base_fee * 1.5 + priority_fee)
 
-    return Wei(priority_fee), Wei(max_fee_per_gas)
+    return cast("Wei", priority_fee), cast("Wei", max_fee_per_gas)
 
 
 def compute_sqrt_price_x96(amount_0: Wei, amount_1: Wei) -> int: